@@ -0,0 +1,57 @@
+"""Benchmark log load time and disk footprint of the compression codecs."""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from adaptive_oscillator.utils.compression_utils import (
+    available_codecs,
+    convert_log_dir,
+)
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
+
+LOG_DIR = Path("data/walk_mix")
+N_REPEATS = 3
+
+
+def load_time(log_dir: Path) -> float:
+    """Return the best time in milliseconds to parse every file of a log directory."""
+    best = float("inf")
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        LogParser(LogFiles(log_dir))
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def footprint(log_dir: Path) -> int:
+    """Return the total size of the log files of a directory in bytes."""
+    return sum(path.stat().st_size for path in log_dir.glob("*.txt*"))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logger.configure(handlers=[])
+    results = {"plain text": (footprint(LOG_DIR), load_time(LOG_DIR), 0.0)}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for codec in available_codecs():
+            out_dir = Path(tmp_dir) / codec.lstrip(".")
+            start = time.perf_counter()
+            convert_log_dir(LOG_DIR, codec=codec, output_dir=out_dir)
+            convert_s = time.perf_counter() - start
+            results[codec] = (footprint(out_dir), load_time(out_dir), convert_s)
+
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    plain_size = results["plain text"][0]
+    for name, (size, load_ms, convert_s) in results.items():
+        logger.info(
+            f"{name:<10} | {size / 1e6:6.2f} MB ({size / plain_size:5.1%}) | "
+            f"load {load_ms:7.1f} ms | convert {convert_s:5.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
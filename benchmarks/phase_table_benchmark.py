@@ -0,0 +1,92 @@
+"""Benchmark the reference lookup table against evaluating the spline."""
+
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+from loguru import logger
+
+from adaptive_oscillator.oscillator import (
+    LowLevelController,
+    MultiJointController,
+    spline_table,
+)
+
+N_TICKS = 20_000
+N_BLOCK = 10_000
+N_REPEATS = 5
+N_JOINTS = (2, 8)
+DT = 0.01
+
+
+def best_time(func: Callable[[], object], n_repeats: int = N_REPEATS) -> float:
+    """Return the best run time in microseconds."""
+    best = float("inf")
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def per_joint(singles: list[LowLevelController], ticks: list[float]) -> None:
+    """Run one controller per joint for every tick."""
+    for phi in ticks:
+        for single in singles:
+            single.compute(phi, 0.0, DT)
+
+
+def stacked(
+    bank: MultiJointController, theta_m: np.ndarray, ticks: list[float]
+) -> None:
+    """Run all joints of a multi-joint controller for every tick."""
+    for phi in ticks:
+        bank.compute(phi, theta_m, DT)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    controller = LowLevelController()
+    spline = controller.spline
+    phases = np.random.default_rng(0).uniform(0.0, 2 * np.pi, N_BLOCK)
+    ticks = np.resize(phases, N_TICKS).tolist()
+
+    for method in ("linear", "hermite"):
+        for size in (256, 1024, 4096):
+            table = spline_table(spline, size, method)
+            logger.info(
+                f"{method:<8} {size:5d} cells | max error {table.max_error:.2e}"
+            )
+
+    table = controller.table
+    cases = {
+        "spline per tick": lambda: [
+            spline((phi - np.pi) % (2 * np.pi)) for phi in ticks
+        ],
+        "table per tick": lambda: [table(phi) for phi in ticks],
+        "spline block": lambda: spline(np.mod(phases - np.pi, 2 * np.pi)),
+        "table block": lambda: table(phases),
+    }
+    for name, func in cases.items():
+        n_samples = N_TICKS if "tick" in name else N_BLOCK
+        elapsed_us = best_time(func)
+        logger.info(f"{name:<16} | {elapsed_us / n_samples * 1e3:8.1f} ns per lookup")
+
+    x = np.linspace(0, 2 * np.pi, 100)
+    for n_joints in N_JOINTS:
+        shapes = {f"joint_{jj}": np.sin(x + jj) for jj in range(n_joints)}
+        singles = [LowLevelController(gait_shape=shape) for shape in shapes.values()]
+        bank = MultiJointController(shapes)
+        theta_m = np.zeros(n_joints)
+        cases = {
+            f"{n_joints} controllers": partial(per_joint, singles, ticks),
+            f"{n_joints}-joint bank": partial(stacked, bank, theta_m, ticks),
+        }
+        for name, func in cases.items():
+            elapsed_us = best_time(func)
+            logger.info(f"{name:<16} | {elapsed_us / N_TICKS:8.2f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
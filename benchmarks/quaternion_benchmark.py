@@ -0,0 +1,101 @@
+"""Benchmark segment-relative joint angles from the walk_mix quaternion logs."""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+from loguru import logger
+from scipy.spatial.transform import Rotation
+
+from adaptive_oscillator.base_classes import Quaternion
+from adaptive_oscillator.definitions import LogFileKeys
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
+from adaptive_oscillator.utils.quaternion_utils import quat_relative, quat_to_euler
+
+LOG_DIR = "data/walk_mix"
+N_REPEATS = 5
+JOINT_SEGMENTS = (
+    ("pelvis", "upper_leg"),
+    ("upper_leg", "lower_leg"),
+    ("lower_leg", "foot"),
+)
+
+
+def load_pairs() -> list[tuple[np.ndarray, np.ndarray]]:
+    """Return the (parent, child) quaternion arrays of every joint on both sides."""
+    log_data = LogParser(LogFiles(LOG_DIR), categories=[LogFileKeys.QUAT])
+    return [
+        (getattr(body, parent).quat.data, getattr(body, child).quat.data)
+        for body in (log_data.data.left, log_data.data.right)
+        for parent, child in JOINT_SEGMENTS
+    ]
+
+
+def per_sample(pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Convert one sample at a time, as done outside the library before."""
+    for parent, child in pairs:
+        for q_p, q_c in zip(parent, child, strict=True):
+            relative = Quaternion(data=q_p[np.newaxis]).conjugate() * Quaternion(
+                data=q_c[np.newaxis]
+            )
+            quat_to_euler(relative.data)
+
+
+def scipy_rotation(pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Convert whole arrays with scipy."""
+    for parent, child in pairs:
+        r_parent = Rotation.from_quat(parent, scalar_first=True)
+        r_child = Rotation.from_quat(child, scalar_first=True)
+        (r_parent.inv() * r_child).as_euler("xyz", degrees=True)
+
+
+def kernels(pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Convert whole arrays with the quaternion kernels."""
+    for parent, child in pairs:
+        quat_to_euler(quat_relative(parent, child))
+
+
+def kernels_out(pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Convert whole arrays with the kernels, reusing the output buffers."""
+    relative = np.empty((0, 4))
+    angles = np.empty((0, 3))
+    for parent, child in pairs:
+        if len(parent) != len(relative):
+            relative = np.empty_like(parent)
+            angles = np.empty((len(parent), 3))
+        quat_relative(parent, child, out=relative)
+        quat_to_euler(relative, out=angles)
+
+
+def best_time(
+    func: Callable[[list[tuple[np.ndarray, np.ndarray]]], None],
+    pairs: list[tuple[np.ndarray, np.ndarray]],
+    n_repeats: int = N_REPEATS,
+) -> float:
+    """Return the best run time in milliseconds."""
+    best = float("inf")
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func(pairs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    """Run the benchmark."""
+    pairs = load_pairs()
+    n_samples = sum(len(parent) for parent, _ in pairs)
+    logger.info(f"{len(pairs)} joints, {n_samples} samples from {LOG_DIR}")
+    cases = {
+        "per-sample loop": (per_sample, 1),
+        "scipy Rotation": (scipy_rotation, N_REPEATS),
+        "kernels": (kernels, N_REPEATS),
+        "kernels with out=": (kernels_out, N_REPEATS),
+    }
+    for name, (func, n_repeats) in cases.items():
+        elapsed_ms = best_time(func, pairs, n_repeats)
+        logger.info(f"{name:<20} | {elapsed_ms:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the controller step time with per-frame logging and with telemetry."""
+
+import io
+import sys
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+from adaptive_oscillator.controller import TELEMETRY_FIELDS, AOController
+from adaptive_oscillator.oscillator import AOParameters, sample_walking_data
+from adaptive_oscillator.telemetry import Telemetry, TelemetryRecord
+
+N_REPEATS = 5
+T_END = 20.0
+
+
+def per_frame_fstring_sink(record: TelemetryRecord) -> None:
+    """Reproduce the former per-step f-string logging."""
+    _, theta_hat, omega, phi_gp = record.values
+    logger.info(f"theta_hat: {theta_hat:.2f}, omega: {omega:.2f}, phi_gp: {phi_gp:.2f}")
+
+
+def time_steps(make_telemetry: Callable[[], Telemetry], solver: str) -> float:
+    """Return the best mean step time in microseconds."""
+    t_vals, theta_il, theta_il_dot = sample_walking_data(period=0.5, t_end=T_END)
+    best = float("inf")
+    for _ in range(N_REPEATS):
+        controller = AOController(
+            show_plots=False,
+            telemetry=make_telemetry(),
+            params=AOParameters(solver=solver),
+        )
+        start = time.perf_counter()
+        for t, th, dth in zip(t_vals, theta_il, theta_il_dot, strict=True):
+            controller.step(t=t, th=th, dth=dth)
+        best = min(best, (time.perf_counter() - start) / len(t_vals))
+    return best * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    cases = {
+        "per-frame f-string (previous)": lambda: Telemetry(
+            TELEMETRY_FIELDS, sinks=[per_frame_fstring_sink], max_rate_hz=None
+        ),
+        "per-frame deferred": lambda: Telemetry(TELEMETRY_FIELDS, max_rate_hz=None),
+        "rate-limited 10 Hz (default)": lambda: Telemetry(TELEMETRY_FIELDS),
+        "disabled": lambda: Telemetry(TELEMETRY_FIELDS, sinks=[]),
+    }
+
+    results = {}
+    for solver in ("RK45", "rk4"):
+        for name, make_telemetry in cases.items():
+            # Log into memory so the terminal does not dominate the timings.
+            logger.configure(handlers=[{"sink": io.StringIO(), "level": "INFO"}])
+            results[(solver, name)] = time_steps(make_telemetry, solver)
+
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    for (solver, name), step_us in results.items():
+        logger.info(f"{solver:>5} | {name:<30} | {step_us:8.1f} us/step")
+
+
+if __name__ == "__main__":
+    main()
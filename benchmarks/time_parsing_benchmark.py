@@ -0,0 +1,48 @@
+"""Benchmark the vectorized time column parser against per-row strptime."""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from adaptive_oscillator.definitions import LOG_FILE_EXT, AnglesHeader
+from adaptive_oscillator.utils.time_utils import (
+    time_str_to_seconds,
+    time_strs_to_seconds,
+)
+
+LOG_DIR = Path(__file__).parent.parent / "data" / "walk_mix"
+N_REPEATS = 5
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    columns = [
+        pd.read_csv(filepath, sep="\t", usecols=[AnglesHeader.TIME])[AnglesHeader.TIME]
+        for filepath in sorted(LOG_DIR.glob(f"*{LOG_FILE_EXT}"))
+    ]
+    n_rows = sum(len(column) for column in columns)
+
+    def per_row() -> list[np.ndarray]:
+        return [np.array([time_str_to_seconds(t) for t in col]) for col in columns]
+
+    def vectorized() -> list[np.ndarray]:
+        return [time_strs_to_seconds(col.to_numpy()) for col in columns]
+
+    for expected, actual in zip(per_row(), vectorized(), strict=True):
+        np.testing.assert_array_equal(expected, actual)
+
+    per_row_s = min(timeit.repeat(per_row, number=1, repeat=N_REPEATS))
+    vectorized_s = min(timeit.repeat(vectorized, number=1, repeat=N_REPEATS))
+    logger.info(f"{len(columns)} files, {n_rows} rows from {LOG_DIR}")
+    logger.info(f"per-row strptime: {per_row_s * 1e3:8.2f} ms")
+    logger.info(f"vectorized:       {vectorized_s * 1e3:8.2f} ms")
+    logger.info(f"speed-up:         {per_row_s / vectorized_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
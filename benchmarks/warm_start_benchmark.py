@@ -0,0 +1,91 @@
+"""Benchmark the oscillator's time-to-convergence with and without warm-start."""
+
+import time
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import (
+    CONVERGENCE_TOLERANCE,
+    WARM_START_WINDOW,
+    LogFileKeys,
+)
+from adaptive_oscillator.oscillator import (
+    AdaptiveOscillator,
+    AOParameters,
+    sample_walking_data,
+)
+from adaptive_oscillator.sweep import convergence_time
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
+from adaptive_oscillator.utils.spectral_utils import local_fundamental
+
+LOG_DIRS = ("data/walk_4", "data/walk_5", "data/walk_6", "data/walk_mix")
+SOLVER = "rk4"
+
+
+def load_signal(log_dir: str) -> tuple[NDArray, NDArray]:
+    """Return the time since the first sample and the left hip angle in radians."""
+    log_data = LogParser(
+        LogFiles(log_dir), sides=["left"], categories=[LogFileKeys.ANGLE]
+    )
+    hip = log_data.data.left.hip
+    return hip.time - hip.time[0], np.deg2rad(hip.angles.data[:, 0])
+
+
+def mean_error(omega: NDArray, omega_ref: NDArray) -> float:
+    """Return the mean relative error of omega over the whole signal."""
+    return float(np.mean(np.abs(omega - omega_ref) / omega_ref))
+
+
+def run(t: NDArray, theta: NDArray, warm: bool) -> tuple[float, NDArray, float]:
+    """Run one oscillator over a signal.
+
+    :return: Warm-start time, omega per sample, and integration time in seconds.
+    """
+    oscillator = AdaptiveOscillator(AOParameters(solver=SOLVER))
+    start = time.perf_counter()
+    if warm:
+        window = t <= WARM_START_WINDOW
+        oscillator.warm_start(t[window], theta[window])
+    fit_s = time.perf_counter() - start
+
+    omega = np.empty(len(t))
+    start = time.perf_counter()
+    for ii, (t_ii, th) in enumerate(zip(t.tolist(), theta.tolist(), strict=True)):
+        oscillator.update(t_ii, th)
+        omega[ii] = oscillator.omega
+    return fit_s, omega, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    t_sim, theta_sim, _ = sample_walking_data(period=0.5, t_end=100.0)
+    signals = {"sine 0.5 Hz": (t_sim, theta_sim, np.full(len(t_sim), np.pi))}
+    for log_dir in LOG_DIRS:
+        t, theta = load_signal(log_dir)
+        signals[log_dir] = (t, theta, local_fundamental(t, theta)[0])
+
+    logger.info(
+        f"Time until omega stays within {CONVERGENCE_TOLERANCE:.0%} of the local gait "
+        f"frequency, warm-start window {WARM_START_WINDOW:g} s"
+    )
+    logger.info(
+        f"{'signal':<14} | {'duration':>8} | {'cold':>8} | {'warm':>8} | "
+        f"{'cold err':>8} | {'warm err':>8} | {'fit':>8} | {'run':>8}"
+    )
+    for name, (t, theta, omega_ref) in signals.items():
+        _, omega_cold, _ = run(t, theta, warm=False)
+        fit_s, omega_warm, run_s = run(t, theta, warm=True)
+        logger.info(
+            f"{name:<14} | {t[-1]:7.1f}s | "
+            f"{convergence_time(t, omega_cold, omega_ref):7.1f}s | "
+            f"{convergence_time(t, omega_warm, omega_ref):7.1f}s | "
+            f"{mean_error(omega_cold, omega_ref):8.1%} | "
+            f"{mean_error(omega_warm, omega_ref):8.1%} | "
+            f"{fit_s * 1e3:6.2f}ms | {run_s:7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
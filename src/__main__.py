@@ -3,6 +3,8 @@
 import argparse
 
 from adaptive_oscillator.controller import AOController
+from adaptive_oscillator.definitions import WARM_START_WINDOW
+from adaptive_oscillator.scheduler import DeadlineScheduler
 
 
 def main() -> None:
@@ -19,9 +21,30 @@ def main() -> None:
     parser.add_argument(
         "-s", "--ssh", action="store_true", help="Connect to an SSH server."
     )
+    parser.add_argument(
+        "-w",
+        "--warm-start",
+        type=float,
+        nargs="?",
+        const=WARM_START_WINDOW,
+        default=None,
+        help="Seed the oscillator from a Fourier fit of the first seconds of the log "
+        f"({WARM_START_WINDOW:g} s if no value is given).",
+    )
+    parser.add_argument(
+        "-x",
+        "--speed",
+        type=float,
+        default=None,
+        help="Replay at this multiple of real time, 'inf' for as fast as possible "
+        "(real time with plots and as fast as possible without by default).",
+    )
     args = parser.parse_args()
-    controller = AOController(show_plots=args.plot_results, ssh=args.ssh)
-    controller.replay(log_dir=args.log_dir)
+    scheduler = DeadlineScheduler(speed=args.speed) if args.speed is not None else None
+    controller = AOController(
+        show_plots=args.plot_results, ssh=args.ssh, scheduler=scheduler
+    )
+    controller.replay(log_dir=args.log_dir, warm_start=args.warm_start)
 
 
 if __name__ == "__main__":
@@ -1,57 +1,126 @@
 """Common base classes."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from adaptive_oscillator.definitions import LOG_FILE_EXT
-
-
-@dataclass
-class VectorXYZ:
-    """XYZ Vector."""
-
-    x: NDArray = field(default_factory=lambda: np.array([]))
-    y: NDArray = field(default_factory=lambda: np.array([]))
-    z: NDArray = field(default_factory=lambda: np.array([]))
+from adaptive_oscillator.utils.compression_utils import find_log_file
+from adaptive_oscillator.utils.quaternion_utils import (
+    euler_to_quat,
+    quat_conjugate,
+    quat_inverse,
+    quat_multiply,
+    quat_normalize,
+    quat_relative,
+    quat_rotate,
+    quat_slerp,
+    quat_to_euler,
+)
+
+_AXES = "xyz"
+
+
+class _StackedComponents:
+    """Components stored as the columns of one contiguous (N, K) array.
+
+    The named components are zero-copy column views into ``data``, and indexing
+    returns views of ``data`` instead of stacking the components again.
+    """
+
+    _components: tuple[str, ...] = ()
+
+    def __init__(self, *components: ArrayLike | None, data: ArrayLike | None = None):
+        if data is not None:
+            if any(component is not None for component in components):
+                raise ValueError("Pass either the components or data, not both.")
+            self.data = np.ascontiguousarray(data)
+        elif all(component is None for component in components):
+            self.data = np.empty((0, len(self._components)))
+        else:
+            self.data = np.stack(
+                [np.atleast_1d(np.asarray(component)) for component in components],
+                axis=1,
+            )
+        if self.data.ndim != 2 or self.data.shape[1] != len(self._components):
+            raise ValueError(
+                f"Expected data of shape (N, {len(self._components)}), "
+                f"got {self.data.shape}."
+            )
 
     def __getitem__(self, index: int | slice) -> NDArray:
-        """Return stacked XYZ components as a 2D array, or select one component.
+        """Return one sample's components, or the stacked components of a slice.
 
-        :param index: Index or slice for accessing stacked vector components.
-                      0 = x, 1 = y, 2 = z; or a slice like 0:2
-        :return: Stacked NumPy array of shape (3, N) or (K, N).
+        :param index: Sample index, or a slice of samples.
+        :return: View of shape (K,) for an index, or (K, N) for a slice.
         :raises IndexError: If index is out of bounds.
         """
-        stacked = np.stack(arrays=[self.x, self.y, self.z], axis=1)
-        return stacked[index].T
+        return self.data[index].T
 
     def __len__(self) -> int:
-        """Return the number of elements in the vector."""
-        return len(self.x)
+        """Return the number of samples."""
+        return len(self.data)
 
+    def __repr__(self) -> str:
+        """Return a string representation of the components."""
+        components = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._components
+        )
+        return f"{type(self).__name__}({components})"
 
-@dataclass
-class Quaternion:
+
+def _component(index: int, doc: str) -> property:
+    def getter(self: _StackedComponents) -> NDArray:
+        return self.data[:, index]
+
+    def setter(self: _StackedComponents, value: ArrayLike) -> None:
+        self.data[:, index] = value
+
+    return property(getter, setter, doc=doc)
+
+
+class VectorXYZ(_StackedComponents):
+    """XYZ Vector."""
+
+    _components = ("x", "y", "z")
+
+    def __init__(
+        self,
+        x: ArrayLike | None = None,
+        y: ArrayLike | None = None,
+        z: ArrayLike | None = None,
+        data: ArrayLike | None = None,
+    ):
+        """Initialize from the x, y, z components or from an (N, 3) array."""
+        super().__init__(x, y, z, data=data)
+
+    x = _component(0, "X component.")
+    y = _component(1, "Y component.")
+    z = _component(2, "Z component.")
+
+
+class Quaternion(_StackedComponents):
     """Quaternion."""
 
-    w: NDArray = field(default_factory=lambda: np.array([]))
-    x: NDArray = field(default_factory=lambda: np.array([]))
-    y: NDArray = field(default_factory=lambda: np.array([]))
-    z: NDArray = field(default_factory=lambda: np.array([]))
+    _components = ("w", "x", "y", "z")
 
-    def __getitem__(self, index: int | slice) -> NDArray:
-        """Return stacked XYZ components as a 2D array, or select one component.
+    def __init__(
+        self,
+        w: ArrayLike | None = None,
+        x: ArrayLike | None = None,
+        y: ArrayLike | None = None,
+        z: ArrayLike | None = None,
+        data: ArrayLike | None = None,
+    ):
+        """Initialize from the w, x, y, z components or from an (N, 4) array."""
+        super().__init__(w, x, y, z, data=data)
 
-        :param index: Index or slice for accessing stacked vector components.
-                      0 = x, 1 = y, 2 = z; or a slice like 0:2
-        :return: Stacked NumPy array of shape (3, N) or (K, N).
-        :raises IndexError: If index is out of bounds.
-        """
-        stacked = np.stack([self.w, self.x, self.y, self.z], axis=1)
-        return stacked[index].T
+    w = _component(0, "Scalar component.")
+    x = _component(1, "X component.")
+    y = _component(2, "Y component.")
+    z = _component(3, "Z component.")
 
     def __mul__(self, quat_b: "Quaternion") -> "Quaternion":
         """Multiply two quaternions.
@@ -59,44 +128,106 @@ class Quaternion:
         :param quat_b: Quaternion to multiply with.
         :return: New Quaternion representing the product.
         """
-        q = quat_b
-        w = self.w * q.w - self.x * q.x - self.y * q.y - self.z * q.z
-        x = self.w * q.x + self.x * q.w + self.y * q.z - self.z * q.y
-        y = self.w * q.y - self.x * q.z + self.y * q.w + self.z * q.x
-        z = self.w * q.z + self.x * q.y - self.y * q.x + self.z * q.w
-        return Quaternion(w, x, y, z)
+        return Quaternion(data=quat_multiply(self.data, quat_b.data))
 
+    def normalized(self) -> "Quaternion":
+        """Return the quaternions scaled to unit norm."""
+        return Quaternion(data=quat_normalize(self.data))
 
-@dataclass
-class AngleXYZ:
-    """XYZ Angle Vector."""
+    def conjugate(self) -> "Quaternion":
+        """Return the conjugate quaternions."""
+        return Quaternion(data=quat_conjugate(self.data))
 
-    x_deg: NDArray = field(default_factory=lambda: np.array([]))
-    y_deg: NDArray = field(default_factory=lambda: np.array([]))
-    z_deg: NDArray = field(default_factory=lambda: np.array([]))
+    def inverse(self) -> "Quaternion":
+        """Return the inverse quaternions."""
+        return Quaternion(data=quat_inverse(self.data))
 
-    def __getitem__(self, index: int | slice) -> NDArray:
-        """Return stacked XYZ components as a 2D array, or select one component.
+    def relative_to(
+        self, parent: "Quaternion", out: NDArray | None = None
+    ) -> "Quaternion":
+        """Return this orientation expressed in the frame of ``parent``.
 
-        :param index: Index or slice for accessing stacked vector components.
-                      0 = x, 1 = y, 2 = z; or a slice like 0:2
-        :return: Stacked NumPy array of shape (3, N) or (K, N).
-        :raises IndexError: If index is out of bounds.
+        :param parent: Orientation of the reference segment, e.g. the pelvis.
+        :param out: (N, 4) array to write the relative rotations into.
+        :return: Relative rotations ``conj(parent) * self``.
         """
-        stacked = np.stack([self.x_deg, self.y_deg, self.z_deg], axis=1)
-        return stacked[index].T
+        return Quaternion(data=quat_relative(parent.data, self.data, out=out))
 
-    def __len__(self) -> int:
-        """Return the number of elements in the vector."""
-        return len(self.x_deg)
+    def rotate(self, vector: VectorXYZ, out: NDArray | None = None) -> VectorXYZ:
+        """Rotate vectors, e.g. accelerations from the sensor to the world frame.
+
+        :param vector: Vectors to rotate, one per quaternion.
+        :param out: (N, 3) array to write the rotated vectors into.
+        :return: Rotated vectors.
+        """
+        return VectorXYZ(data=quat_rotate(self.data, vector.data, out=out))
+
+    def to_euler(self, sequence: str = "xyz", out: NDArray | None = None) -> "AngleXYZ":
+        """Convert to Tait-Bryan angles in degrees.
+
+        :param sequence: Rotation axes, lower case for extrinsic and upper case
+            for intrinsic rotations.
+        :param out: (N, 3) array to write the angles into, in the order of
+            ``sequence``.
+        :return: Angles about the x, y and z axes.
+        """
+        angles = quat_to_euler(self.data, sequence=sequence, out=out)
+        return AngleXYZ(data=_to_axis_order(angles, sequence))
+
+    @classmethod
+    def from_euler(cls, angles: "AngleXYZ", sequence: str = "xyz") -> "Quaternion":
+        """Create quaternions from Tait-Bryan angles in degrees.
+
+        :param angles: Angles about the x, y and z axes.
+        :param sequence: Rotation axes, lower case for extrinsic and upper case
+            for intrinsic rotations.
+        """
+        order = [_AXES.index(axis) for axis in sequence.lower()]
+        return cls(data=euler_to_quat(angles.data[:, order], sequence=sequence))
+
+    def slerp(self, time: ArrayLike, new_time: ArrayLike) -> "Quaternion":
+        """Resample the quaternions with spherical linear interpolation.
+
+        :param time: Sample times of the quaternions.
+        :param new_time: Times to resample at.
+        :return: Resampled quaternions.
+        """
+        return Quaternion(data=quat_slerp(time, self.data, new_time))
+
+
+def _to_axis_order(angles: NDArray, sequence: str) -> NDArray:
+    order = [_AXES.index(axis) for axis in sequence.lower()]
+    if order == [0, 1, 2]:
+        return angles
+    return angles[:, np.argsort(order)]
+
+
+class AngleXYZ(_StackedComponents):
+    """XYZ Angle Vector."""
+
+    _components = ("x_deg", "y_deg", "z_deg")
+
+    def __init__(
+        self,
+        x_deg: ArrayLike | None = None,
+        y_deg: ArrayLike | None = None,
+        z_deg: ArrayLike | None = None,
+        data: ArrayLike | None = None,
+    ):
+        """Initialize from the x, y, z angles in degrees or from an (N, 3) array."""
+        super().__init__(x_deg, y_deg, z_deg, data=data)
+
+    x_deg = _component(0, "X angle in degrees.")
+    y_deg = _component(1, "Y angle in degrees.")
+    z_deg = _component(2, "Z angle in degrees.")
 
 
 class SensorFile:
     """Represent a sensor category with left and right side access."""
 
     def __init__(self, category: str, base_path: Path) -> None:
-        self.left = base_path / f"{category}_left{LOG_FILE_EXT}"
-        self.right = base_path / f"{category}_right{LOG_FILE_EXT}"
+        self.left = find_log_file(base_path / f"{category}_left{LOG_FILE_EXT}")
+        self.right = find_log_file(base_path / f"{category}_right{LOG_FILE_EXT}")
 
 
 @dataclass
@@ -1,31 +1,84 @@
 """Controller module for the Adaptive Oscillator."""
 
 import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 from loguru import logger
+from numpy.typing import NDArray
 
-from adaptive_oscillator.definitions import DEFAULT_DELTA_TIME
+from adaptive_oscillator.definitions import (
+    ANGLES_SEGMENT_FIELDS,
+    DEFAULT_DELTA_TIME,
+    STREAM_CHUNK_SIZE,
+    LogFileKeys,
+)
 from adaptive_oscillator.oscillator import (
     AOParameters,
     GaitPhaseEstimator,
     LowLevelController,
 )
+from adaptive_oscillator.recorder import AORecorder, RecorderFields
+from adaptive_oscillator.scheduler import DeadlineScheduler
+from adaptive_oscillator.snapshot import load_snapshot, restore_snapshot, take_snapshot
+from adaptive_oscillator.telemetry import Telemetry
+from adaptive_oscillator.utils.cache_utils import LogCache
+from adaptive_oscillator.utils.derivative_utils import (
+    BackwardDifference,
+    backward_difference,
+)
 from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
 from adaptive_oscillator.utils.plot_utils import RealtimeAOPlotter
+from adaptive_oscillator.utils.stream_utils import follow_log_file
+
+
+@dataclass
+class ControllerBlock:
+    """Per-frame outputs of a block of controller steps."""
+
+    t: NDArray
+    phi: NDArray
+    phi_gp: NDArray
+    omega: NDArray
+    theta_hat: NDArray
+    theta_m: NDArray
+    omega_cmd: NDArray
+
+
+TELEMETRY_FIELDS = (
+    RecorderFields.TIME,
+    RecorderFields.THETA_HAT,
+    RecorderFields.OMEGA,
+    RecorderFields.PHI_GP,
+)
 
 
 class AOController:
     """Encapsulate the AO control loop and optional real-time plotting."""
 
-    def __init__(self, show_plots: bool, ssh: bool = False):
+    def __init__(  # noqa: PLR0913
+        self,
+        show_plots: bool,
+        ssh: bool = False,
+        recorder: AORecorder | None = None,
+        telemetry: Telemetry | None = None,
+        params: AOParameters | None = None,
+        *,
+        scheduler: DeadlineScheduler | None = None,
+    ):
         """Initialize controller.
 
         :param show_plots: Plot IMU logs before running the control loop.
+        :param ssh: Serve the live plot on all interfaces.
+        :param recorder: Recorder for the per-step outputs, a growable one if None.
+        :param telemetry: Telemetry for the per-step outputs, rate-limited if None.
+        :param params: Adaptive oscillator parameters, the defaults if None.
+        :param scheduler: Paces the frames against their log times. If None,
+            frames run at real time with plots and as fast as possible without.
         """
-        self.params = AOParameters()
+        self.params = params if params is not None else AOParameters()
         self.estimator = GaitPhaseEstimator(self.params)
         self.controller = LowLevelController()
         self.theta_m = 0.0
@@ -33,45 +86,176 @@ class AOController:
 
         self.ang_idx = 0
 
-        self.motor_output: list[float] = []
-        self.theta_hat_output: list[float] = []
-        self.phi_gp_output: list[float] = []
-        self.omegas: list[float] = []
+        self.recorder = recorder if recorder is not None else AORecorder()
+        self.telemetry = (
+            telemetry if telemetry is not None else Telemetry(TELEMETRY_FIELDS)
+        )
+        self.scheduler = (
+            scheduler
+            if scheduler is not None
+            else DeadlineScheduler(speed=1.0 if show_plots else None)
+        )
 
         self.plotter: RealtimeAOPlotter | None = None
         if show_plots:  # pragma: no cover
             self.plotter = RealtimeAOPlotter(ssh=ssh)
             self.plotter.run()
 
-    def replay(self, log_dir: str | Path):
-        """Run the AO simulation loop."""
+    @property
+    def motor_output(self) -> NDArray:
+        """Return the recorded motor angles."""
+        return self.recorder.column(RecorderFields.THETA_M)
+
+    @property
+    def theta_hat_output(self) -> NDArray:
+        """Return the recorded oscillator signal estimates."""
+        return self.recorder.column(RecorderFields.THETA_HAT)
+
+    @property
+    def phi_gp_output(self) -> NDArray:
+        """Return the recorded uncorrected gait phases."""
+        return self.recorder.column(RecorderFields.PHI_GP)
+
+    @property
+    def omegas(self) -> NDArray:
+        """Return the recorded angular frequencies."""
+        return self.recorder.column(RecorderFields.OMEGA)
+
+    def replay(  # noqa: PLR0913
+        self,
+        log_dir: str | Path,
+        cache: LogCache | None = None,
+        resample_hz: float | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        *,
+        initial_state: NDArray | str | Path | None = None,
+        warm_start: float | None = None,
+        index_dir: str | Path | None = None,
+    ):
+        """Run the AO simulation loop.
+
+        :param log_dir: Directory with the log files to replay.
+        :param cache: Binary cache to load the log files through, if any.
+        :param resample_hz: Replay on a uniform grid at this rate, so every step
+            has the same time step, instead of the raw timestamps.
+        :param start: Replay from this many seconds into the log on, seeking to
+            it instead of parsing the samples before it.
+        :param end: Replay up to this many seconds into the log.
+        :param initial_state: Snapshot buffer or file to warm-start from, taken
+            one frame before the first replayed frame.
+        :param warm_start: Seed the oscillator from a Fourier fit of this many
+            seconds of the replayed signal instead of starting it cold.
+        :param index_dir: Directory for the time indexes a windowed replay seeks
+            through, instead of the cache directory next to the logs.
+        """
+        if initial_state is not None and warm_start is not None:
+            raise ValueError("Pass either an initial state or a warm start.")
         logger.info(f"Running controller with log data from {log_dir}")
         log_files = LogFiles(log_dir)
-        log_data = LogParser(log_files)
+        log_data = LogParser(
+            log_files,
+            cache=cache,
+            sides=["left"],
+            categories=[LogFileKeys.ANGLE],
+            resample_hz=resample_hz,
+            start=start,
+            end=end,
+            index_dir=index_dir,
+        )
 
         time_vec = log_data.data.left.hip.time
         angle_vec = log_data.data.left.hip.angles
+        theta = np.deg2rad(angle_vec.data[:, self.ang_idx])
+        theta_dot = backward_difference(time_vec, theta)
+        if initial_state is not None:
+            if not isinstance(initial_state, np.ndarray):
+                initial_state = load_snapshot(initial_state)
+            self.restore(initial_state, time=-DEFAULT_DELTA_TIME)
+        if warm_start is not None:
+            t_rel = time_vec - time_vec[0]
+            window = t_rel <= warm_start
+            self.estimator.ao.warm_start(t_rel[window], theta[window])
 
+        self.scheduler.reset()
+        self.telemetry.reset()
         try:
             for i in range(len(angle_vec) - 1):
-                th = np.deg2rad(angle_vec[i][self.ang_idx])
-                dth = np.deg2rad(
-                    angle_vec[i][self.ang_idx]
-                )  # TODO: replace with actual derivative if available
                 t = time_vec[i] - time_vec[0]
-                self.step(t=t, th=th, dth=dth)
+                self.step(t=t, th=theta[i], dth=theta_dot[i])
 
         except KeyboardInterrupt:  # pragma: no cover
             logger.warning("Controller interrupted.")
 
+        if self.scheduler.paced:
+            logger.info(f"Replay timing: {self.scheduler.stats()}")
         if self.plotter is not None:  # pragma: no cover
-            log_files.plot()
+            log_files.plot(log_parser=log_data)
             plt.show()
 
         logger.success(f"Finished controller with log data from {log_dir}")
 
+    def follow(
+        self,
+        filepath: str | Path,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        idle_timeout: float | None = None,
+    ) -> None:
+        """Run the AO on an Angles log file while it is being written.
+
+        :param filepath: Angles log file to follow.
+        :param chunk_size: Maximum number of frames per estimator block.
+        :param idle_timeout: Stop once the file has not grown for this many
+            seconds, or follow until interrupted if None.
+        """
+        logger.info(f"Following controller log data in {filepath}")
+        column = ANGLES_SEGMENT_FIELDS["hip"][self.ang_idx]
+        start_time = None
+        derivative = BackwardDifference()
+        self.scheduler.reset()
+        self.telemetry.reset()
+        try:
+            for chunk in follow_log_file(
+                filepath,
+                columns=[column],
+                chunk_size=chunk_size,
+                idle_timeout=idle_timeout,
+            ):
+                if start_time is None:
+                    start_time = chunk.time[0]
+                t = chunk.time - start_time
+                theta = np.deg2rad(chunk[column])
+                self.step_block(t=t, th=theta, dth=derivative(t, theta))
+        except KeyboardInterrupt:  # pragma: no cover
+            logger.warning("Controller interrupted.")
+
+        logger.success(f"Finished following {filepath}")
+
+    def snapshot(self, out: NDArray | None = None) -> NDArray:
+        """Return the estimator, PID and motor state as a snapshot buffer.
+
+        The recorder and telemetry are outputs and not part of the snapshot.
+
+        :param out: Buffer to write into instead of a new one.
+        """
+        return take_snapshot(self, out=out)
+
+    def restore(self, snapshot: NDArray, time: float | None = None) -> None:
+        """Continue from the state of a snapshot.
+
+        :param snapshot: Buffer from ``snapshot``, e.g. of another controller.
+        :param time: Time the snapshot's last step is moved to, if the next
+            steps use a different time origin.
+        """
+        restore_snapshot(self, snapshot, time=time)
+
     def step(self, t: float, th: float, dth: float) -> None:
-        """Step the AO ahead with one frame of data from the IMU."""
+        """Step the AO ahead with one frame of data from the IMU.
+
+        The frame is held back until its deadline on the scheduler's timeline.
+        """
+        on_time = self.scheduler.wait(t)
+        start_ns = time.perf_counter_ns()
         if self.last_time is None:
             dt = DEFAULT_DELTA_TIME
         else:
@@ -83,20 +267,27 @@ class AOController:
         self.theta_m += omega_cmd * dt
 
         # Store outputs
-        self.motor_output.append(self.theta_m)
-        self.theta_hat_output.append(self.estimator.ao.theta_hat)
-        self.phi_gp_output.append(self.estimator.phi_gp)
-        self.omegas.append(self.estimator.ao.omega)
-
-        theta_hat = self.estimator.ao.theta_hat
-        omega = self.estimator.ao.omega
-        phi_gp = self.estimator.phi_gp
-        logger.info(
-            f"theta_hat: {theta_hat:.2f}, omega: {omega:.2f}, phi_gp: {phi_gp:.2f}"
+        self.recorder.append(
+            t=t,
+            theta_il=th,
+            phi=phi,
+            phi_gp=self.estimator.phi_gp,
+            omega=self.estimator.ao.omega,
+            theta_hat=self.estimator.ao.theta_hat,
+            theta_m=self.theta_m,
+            omega_cmd=omega_cmd,
+            step_latency=(time.perf_counter_ns() - start_ns) * 1e-9,
         )
 
-        # Update live plot if enabled
-        if self.plotter is not None:  # pragma: no cover
+        self.telemetry.record(
+            t,
+            self.estimator.ao.theta_hat,
+            self.estimator.ao.omega,
+            self.estimator.phi_gp,
+        )
+
+        # Update live plot if enabled and the frame is not dropped as late
+        if self.plotter is not None and on_time:  # pragma: no cover
             self.plotter.update_data(
                 t=t,
                 theta_il=th,
@@ -104,4 +295,85 @@ class AOController:
                 omega=self.estimator.ao.omega,
                 phi_gp=self.estimator.phi_gp,
             )
-            time.sleep(dt)
+
+    def step_block(self, t: NDArray, th: NDArray, dth: NDArray) -> ControllerBlock:
+        """Step the AO ahead with a block of IMU frames.
+
+        Gives the same numbers and telemetry as calling ``step`` for every frame,
+        but runs the estimator and the reference lookup once per block. The
+        block is held back until the deadline of its last frame.
+
+        :param t: Frame times of shape (N,).
+        :param th: Inter-limb angles of shape (N,).
+        :param dth: Inter-limb angle derivatives of shape (N,).
+        :return: Per-frame outputs.
+        """
+        t = np.asarray(t, dtype=float)
+        n_frames = len(t)
+        on_time = self.scheduler.wait(float(t[-1])) if n_frames else True
+        start_ns = time.perf_counter_ns()
+        dt = np.empty(n_frames)
+        if n_frames:
+            dt[0] = (
+                DEFAULT_DELTA_TIME if self.last_time is None else t[0] - self.last_time
+            )
+            dt[1:] = np.diff(t)
+            self.last_time = t[-1]
+
+        trajectory = self.estimator.update_block(t=t, theta_il=th, theta_il_dot=dth)
+        theta_r = self.controller.reference(trajectory.phi)
+
+        theta_m = np.empty(n_frames)
+        omega_cmd = np.empty(n_frames)
+        pid = self.controller.pid
+        for ii, (theta_r_ii, dt_ii) in enumerate(
+            zip(theta_r.tolist(), dt.tolist(), strict=True)
+        ):
+            omega_cmd[ii] = pid.compute(theta_r_ii - self.theta_m, dt_ii)
+            self.theta_m += omega_cmd[ii] * dt_ii
+            theta_m[ii] = self.theta_m
+
+        # Store outputs, with the block latency spread evenly over its frames
+        self.recorder.extend(
+            t=t,
+            theta_il=np.asarray(th),
+            phi=trajectory.phi,
+            phi_gp=trajectory.phi_gp,
+            omega=trajectory.omega,
+            theta_hat=trajectory.theta_hat,
+            theta_m=theta_m,
+            omega_cmd=omega_cmd,
+            step_latency=np.full(
+                n_frames, (time.perf_counter_ns() - start_ns) * 1e-9 / max(n_frames, 1)
+            ),
+        )
+
+        for record in zip(
+            t.tolist(),
+            trajectory.theta_hat.tolist(),
+            trajectory.omega.tolist(),
+            trajectory.phi_gp.tolist(),
+            strict=True,
+        ):
+            self.telemetry.record(*record)
+
+        # Update live plot if enabled and the block is not dropped as late
+        if self.plotter is not None and on_time:  # pragma: no cover
+            for ii in range(n_frames):
+                self.plotter.update_data(
+                    t=t[ii],
+                    theta_il=th[ii],
+                    theta_hat=trajectory.theta_hat[ii],
+                    omega=trajectory.omega[ii],
+                    phi_gp=trajectory.phi_gp[ii],
+                )
+
+        return ControllerBlock(
+            t=t,
+            phi=trajectory.phi,
+            phi_gp=trajectory.phi_gp,
+            omega=trajectory.omega,
+            theta_hat=trajectory.theta_hat,
+            theta_m=theta_m,
+            omega_cmd=omega_cmd,
+        )
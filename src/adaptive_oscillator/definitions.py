@@ -12,6 +12,8 @@ ALPHA = 0.8
 TIME_FORMAT = "%H:%M:%S.%f"
 
 LOG_FILE_EXT = ".txt"
+LOG_CACHE_DIR = ".ao_cache"
+LOG_CACHE_MAX_BYTES = 1 << 30
 logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
 
 NUMPY_PRINT_PRECISION = 3
@@ -22,9 +24,41 @@ ETA = 0.05
 N_HARMONICS = 3
 NU_PHI = 0.5
 NU_OMEGA = 0.5
+SOLVER = "RK45"
+MAX_STEP = 0.01
 
 DEFAULT_DELTA_TIME = 0.01
 
+# Reference lookup table of the low-level controller
+PHASE_TABLE_SIZE = 1024
+PHASE_TABLE_METHOD = "hermite"
+# Most tables kept for sharing between controllers, least recently used dropped
+PHASE_TABLE_CACHE_SIZE = 32
+
+# Gait shapes: samples of a controller's gait shape, phase bins and streamed
+# samples per chunk when learning templates
+GAIT_SHAPE_SAMPLES = 100
+GAIT_TEMPLATE_BINS = 100
+TEMPLATE_CHUNK_SIZE = 4096
+
+# Spectral warm-start: seconds of signal to fit and the stride frequency band
+WARM_START_WINDOW = 5.0
+GAIT_FREQ_BAND_HZ = (0.3, 3.0)
+
+# Parameter sweeps: seconds per reference fit, and the relative omega error
+# within which an oscillator counts as converged
+REFERENCE_WINDOW = 10.0
+CONVERGENCE_TOLERANCE = 0.05
+
+# Telemetry
+TELEMETRY_LEVEL = "INFO"
+TELEMETRY_RATE_HZ = 10.0
+
+# Real-time scheduler: the last stretch of every wait is spun instead of slept,
+# and frames later than the tolerance count as overruns. In seconds.
+SCHEDULER_SPIN_TIME = 0.0005
+SCHEDULER_OVERRUN_TOLERANCE = 0.002
+
 
 class LogFileKeys:
     """Enum for the log file categories."""
@@ -158,3 +192,23 @@ ANGLES_SEGMENT_FIELDS = {
         AnglesHeader.ANKLE_Z,
     ],
 }
+
+# Parent and child segment of every joint. The logged joint angles are the
+# child's orientation relative to the parent as extrinsic x-y-z Euler angles.
+JOINT_SEGMENTS = {
+    "hip": ("pelvis", "upper_leg"),
+    "knee": ("upper_leg", "lower_leg"),
+    "ankle": ("lower_leg", "foot"),
+}
+JOINT_EULER_SEQUENCE = "xyz"
+
+# Gaps longer than this many median sample periods count as dropped samples.
+DROPPED_SAMPLE_TOLERANCE = 1.5
+
+# Streaming reader
+STREAM_CHUNK_SIZE = 32
+STREAM_POLL_INTERVAL = 0.005
+STREAM_READ_BYTES = 1 << 16
+
+# Time index: one entry per this many sample lines
+LOG_INDEX_STRIDE = 1000
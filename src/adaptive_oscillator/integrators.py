@@ -0,0 +1,175 @@
+"""Fixed-step integrators for the adaptive oscillator dynamics."""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import MAX_STEP
+
+FIXED_STEP_SOLVERS = ("euler", "semi-implicit", "rk4")
+
+# Largest product of step size and phase coupling rate taken in a single step. The
+# coupling scales with 1 / sum(alpha), so it is stiff while the amplitudes are still
+# near zero and a step is subdivided until the oscillator has picked up the signal.
+MAX_COUPLING_STEP = 1.0
+# Most substeps a step is split into. With the amplitudes at exactly zero the
+# coupling rate is ~1e6 / s, which would otherwise take ~10^4 substeps, so beyond
+# this the coupling is clipped to what the substeps can integrate stably.
+MAX_SUBSTEPS = 32
+
+Gains = tuple[float | NDArray, float | NDArray, float | NDArray]
+
+
+class FixedStepIntegrator:
+    """Advance adaptive oscillator states in place with a fixed step size.
+
+    The state has shape ``(..., 2 + 2n)`` and is laid out as
+    ``[omega, alpha_0, alpha_1..alpha_n, phi_1..phi_n]``, so the same integrator
+    advances a single oscillator (1-D state) or a bank of oscillators (2-D state).
+    All stage buffers are allocated once, up front.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        n_harmonics: int,
+        method: str = "rk4",
+        max_step: float = MAX_STEP,
+    ):
+        if method not in FIXED_STEP_SOLVERS:
+            raise ValueError(
+                f"Unknown fixed-step solver '{method}', "
+                f"expected one of {FIXED_STEP_SOLVERS}."
+            )
+        self.n = n_harmonics
+        self.method = method
+        self.max_step = max_step
+        self._harmonics = np.arange(1, n_harmonics + 1, dtype=float)
+
+        self._k1 = np.empty(shape)
+        self._k2 = np.empty(shape)
+        self._k3 = np.empty(shape)
+        self._k4 = np.empty(shape)
+        self._y_stage = np.empty(shape)
+        self._sin = np.empty((*shape[:-1], n_harmonics))
+        self._cos = np.empty((*shape[:-1], n_harmonics))
+        self._coupling: NDArray = np.zeros((*shape[:-1], 1))
+        self._max_coupling: float | NDArray = np.inf
+
+        self._step = {
+            "euler": self._step_euler,
+            "semi-implicit": self._step_semi_implicit,
+            "rk4": self._step_rk4,
+        }[method]
+
+    def derivative(
+        self, y: NDArray, theta_il: float | NDArray, gains: Gains, out: NDArray
+    ) -> NDArray:
+        """Evaluate the oscillator equations for state ``y`` into ``out``.
+
+        :param y: State of shape (..., 2 + 2n).
+        :param theta_il: Input signal, a scalar or an array of shape (..., 1).
+        :param gains: Tuple of (eta, nu_phi, nu_omega), scalars or (..., 1) arrays.
+        :param out: Preallocated array with the same shape as ``y``.
+        :return: ``out``, filled with dy/dt.
+        """
+        eta, nu_phi, nu_omega = gains
+        n = self.n
+        omega = y[..., 0:1]
+        alpha_0 = y[..., 1:2]
+        alpha = y[..., 2 : 2 + n]
+        phi = y[..., 2 + n :]
+        dalpha = out[..., 2 : 2 + n]
+        dphi = out[..., 2 + n :]
+
+        sin_phi = np.sin(phi, out=self._sin)
+        cos_phi = np.cos(phi, out=self._cos)
+
+        theta_hat = alpha_0 + np.multiply(alpha, sin_phi, out=dalpha).sum(
+            axis=-1, keepdims=True
+        )
+        F = theta_il - theta_hat
+        alpha_sum = alpha.sum(axis=-1, keepdims=True) + 1e-6
+        coupling = F / alpha_sum
+        np.clip(coupling, -self._max_coupling, self._max_coupling, out=coupling)
+        self._coupling = coupling
+
+        out[..., 0:1] = nu_omega * coupling * cos_phi[..., 0:1]
+        out[..., 1:2] = eta * F
+        np.multiply(sin_phi, eta * F, out=dalpha)
+        np.multiply(cos_phi, nu_phi * coupling, out=dphi)
+        dphi += np.multiply(omega, self._harmonics, out=sin_phi)
+        return out
+
+    def advance(
+        self, y: NDArray, theta_il: float | NDArray, duration: float, gains: Gains
+    ) -> None:
+        """Integrate ``y`` in place over ``duration`` with constant input ``theta_il``.
+
+        The interval is split into the smallest number of equal steps that are no
+        longer than ``max_step``. A step is further subdivided while the phase
+        coupling is too stiff for it, which only happens during start-up. Past
+        ``MAX_SUBSTEPS`` substeps, or for a non-finite coupling, the coupling is
+        clipped to ``MAX_COUPLING_STEP`` per substep instead.
+        """
+        if duration <= 0.0:
+            return
+        n_steps = int(np.ceil(duration / self.max_step - 1e-9))
+        h = duration / n_steps
+        nu_phi = gains[1]
+        for _ in range(n_steps):
+            k1 = self.derivative(y, theta_il, gains, out=self._k1)
+            rate = np.max(np.abs(nu_phi * self._coupling))
+            if rate * h <= MAX_COUPLING_STEP:
+                self._step(y, theta_il, h, gains, k1)
+                continue
+            n_sub = MAX_SUBSTEPS
+            if rate * h < MAX_COUPLING_STEP * MAX_SUBSTEPS:
+                n_sub = int(np.ceil(h * rate / MAX_COUPLING_STEP))
+            h_sub = h / n_sub
+            if n_sub == MAX_SUBSTEPS:
+                with np.errstate(divide="ignore"):
+                    self._max_coupling = MAX_COUPLING_STEP / (h_sub * np.abs(nu_phi))
+                k1 = self.derivative(y, theta_il, gains, out=self._k1)
+            self._step(y, theta_il, h_sub, gains, k1)
+            for _ in range(n_sub - 1):
+                k1 = self.derivative(y, theta_il, gains, out=self._k1)
+                self._step(y, theta_il, h_sub, gains, k1)
+            self._max_coupling = np.inf
+
+    def _step_euler(
+        self, y: NDArray, theta_il: float | NDArray, h: float, gains: Gains, k1: NDArray
+    ) -> None:
+        k1 *= h
+        y += k1
+
+    def _step_semi_implicit(
+        self, y: NDArray, theta_il: float | NDArray, h: float, gains: Gains, k1: NDArray
+    ) -> None:
+        # Update omega and the amplitudes first, then advance the phases with them.
+        split = 2 + self.n
+        k1 *= h
+        y[..., :split] += k1[..., :split]
+        k1 = self.derivative(y, theta_il, gains, out=self._k1)
+        k1 *= h
+        y[..., split:] += k1[..., split:]
+
+    def _step_rk4(
+        self, y: NDArray, theta_il: float | NDArray, h: float, gains: Gains, k1: NDArray
+    ) -> None:
+        y_stage = self._y_stage
+        np.multiply(k1, 0.5 * h, out=y_stage)
+        y_stage += y
+        k2 = self.derivative(y_stage, theta_il, gains, out=self._k2)
+        np.multiply(k2, 0.5 * h, out=y_stage)
+        y_stage += y
+        k3 = self.derivative(y_stage, theta_il, gains, out=self._k3)
+        np.multiply(k3, h, out=y_stage)
+        y_stage += y
+        k4 = self.derivative(y_stage, theta_il, gains, out=self._k4)
+
+        k2 += k3
+        k2 *= 2.0
+        k1 += k2
+        k1 += k4
+        k1 *= h / 6.0
+        y += k1
@@ -1,5 +1,6 @@
 """Adaptive Oscillator gait tracking."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import numpy as np
@@ -8,7 +9,21 @@ from numpy.typing import NDArray
 from scipy.integrate import solve_ivp
 from scipy.interpolate import CubicSpline
 
-from adaptive_oscillator.definitions import ETA, N_HARMONICS, NU_OMEGA, NU_PHI
+from adaptive_oscillator.definitions import (
+    ETA,
+    GAIT_FREQ_BAND_HZ,
+    GAIT_SHAPE_SAMPLES,
+    MAX_STEP,
+    N_HARMONICS,
+    NU_OMEGA,
+    NU_PHI,
+    PHASE_TABLE_METHOD,
+    PHASE_TABLE_SIZE,
+    SOLVER,
+)
+from adaptive_oscillator.integrators import FIXED_STEP_SOLVERS, FixedStepIntegrator
+from adaptive_oscillator.utils.lookup_utils import PhaseTable, cached_table, shape_key
+from adaptive_oscillator.utils.spectral_utils import HarmonicFit, fit_harmonics
 
 
 # -----------------------------------------------------------------------------
@@ -22,6 +37,8 @@ class AOParameters:
     nu_phi: float = NU_PHI
     nu_omega: float = NU_OMEGA
     n_harmonics: int = N_HARMONICS
+    solver: str = SOLVER
+    max_step: float = MAX_STEP
 
 
 # -----------------------------------------------------------------------------
@@ -33,12 +50,73 @@ class AdaptiveOscillator:
     def __init__(self, params: AOParameters, omega_init: float = 1.0):
         self.params = params
         self.n = params.n_harmonics
-        self.omega = omega_init
-        self.alpha_0 = 0.0
-        self.alpha = np.zeros(self.n)
-        self.phi = np.zeros(self.n)
+        self.state = np.zeros(2 + 2 * self.n)
+        self.state[0] = omega_init
         self.last_t = 0.0
         self.theta_hat = 0.0
+        self._integrators: dict[str, FixedStepIntegrator] = {}
+
+    @property
+    def omega(self) -> float:
+        """Return the estimated angular frequency."""
+        return self.state[0]
+
+    @omega.setter
+    def omega(self, value: float) -> None:
+        self.state[0] = value
+
+    @property
+    def alpha_0(self) -> float:
+        """Return the estimated signal offset."""
+        return self.state[1]
+
+    @alpha_0.setter
+    def alpha_0(self, value: float) -> None:
+        self.state[1] = value
+
+    @property
+    def alpha(self) -> NDArray:
+        """Return a view of the harmonic amplitudes."""
+        return self.state[2 : 2 + self.n]
+
+    @alpha.setter
+    def alpha(self, value: NDArray) -> None:
+        self.state[2 : 2 + self.n] = value
+
+    @property
+    def phi(self) -> NDArray:
+        """Return a view of the harmonic phases."""
+        return self.state[2 + self.n :]
+
+    @phi.setter
+    def phi(self, value: NDArray) -> None:
+        self.state[2 + self.n :] = value
+
+    def warm_start(
+        self,
+        t: NDArray,
+        theta_il: NDArray,
+        band: tuple[float, float] = GAIT_FREQ_BAND_HZ,
+    ) -> HarmonicFit:
+        """Seed the state from a Fourier fit of an initial window of the signal.
+
+        Frequency, offset, amplitudes and phases are set to their values at the
+        first sample of the window, so the oscillator starts out locked instead
+        of having to converge from ``omega_init``.
+
+        :param t: Sample times of the window, covering a few gait cycles.
+        :param theta_il: Input signal over the window.
+        :param band: Lowest and highest gait frequency to consider in Hz.
+        :return: The fitted Fourier series.
+        """
+        fit = fit_harmonics(t, theta_il, self.n, band)
+        self.omega = fit.omega
+        self.alpha_0 = fit.alpha_0
+        self.alpha = fit.alpha
+        self.phi = fit.phi(t[0])
+        self.last_t = float(t[0])
+        self.theta_hat = self.alpha_0 + np.sum(self.alpha * np.sin(self.phi))
+        return fit
 
     def _dynamics(self, t: float, y: NDArray, theta_il: float) -> NDArray:
         omega = y[0]
@@ -60,31 +138,188 @@ class AdaptiveOscillator:
 
         return np.concatenate([[omega_dot, dalpha_0], dalpha, phi_dot])
 
-    def update(self, t: float, theta_il: float, solver: str = "RK45") -> float:
-        """Integrate the oscillator from self.last_t to t, return gait phase φ_GP(t)."""
-        y0 = np.concatenate([[self.omega, self.alpha_0], self.alpha, self.phi])
-        sol = solve_ivp(
-            fun=lambda t_, y_: self._dynamics(t_, y_, theta_il),
-            t_span=(self.last_t, t),
-            y0=y0,
+    def update(self, t: float, theta_il: float, solver: str | None = None) -> float:
+        """Integrate the oscillator from self.last_t to t, return gait phase φ_GP(t).
+
+        :param t: Time of the new sample.
+        :param theta_il: Input signal, held constant over the integration interval.
+        :param solver: Integration method, defaults to ``params.solver``. Any of
+            ``FIXED_STEP_SOLVERS`` advances the state in place with fixed steps of
+            at most ``params.max_step``; any other value is passed to
+            ``scipy.integrate.solve_ivp``.
+        """
+        solver = solver or self.params.solver
+        if solver in FIXED_STEP_SOLVERS:
+            gains = (self.params.eta, self.params.nu_phi, self.params.nu_omega)
+            self._get_integrator(solver).advance(
+                self.state, theta_il, t - self.last_t, gains
+            )
+        else:
+            sol = solve_ivp(
+                fun=lambda t_, y_: self._dynamics(t_, y_, theta_il),
+                t_span=(self.last_t, t),
+                y0=self.state.copy(),
+                method=solver,
+                max_step=self.params.max_step,
+            )
+            self.state[:] = sol.y[:, -1]
+        self.last_t = t
+
+        self.theta_hat = self.alpha_0 + np.sum(self.alpha * np.sin(self.phi))
+        return np.mod(self.phi[0], 2 * np.pi)
+
+    def run(self, t: NDArray, theta_il: NDArray, solver: str | None = None) -> NDArray:
+        """Integrate the oscillator through all samples in one pass.
+
+        The input is held constant between samples, as in ``update``. A
+        fixed-step solver advances the state through the whole array without
+        any per-sample setup. Any other solver calls ``solve_ivp`` once per
+        sample, exactly as ``update`` does.
+
+        :param t: Sample times of shape (N,).
+        :param theta_il: Input signal of shape (N,).
+        :param solver: Integration method, defaults to ``params.solver``.
+        :return: State after every sample, of shape (N, 2 + 2n).
+        """
+        solver = solver or self.params.solver
+        states = np.empty((len(t), len(self.state)))
+        samples = zip(
+            np.asarray(t).tolist(), np.asarray(theta_il).tolist(), strict=True
+        )
+        if solver not in FIXED_STEP_SOLVERS:
+            for ii, (t_ii, th) in enumerate(samples):
+                self.update(t_ii, th, solver=solver)
+                states[ii] = self.state
+            return states
+
+        integrator = self._get_integrator(solver)
+        gains = (self.params.eta, self.params.nu_phi, self.params.nu_omega)
+        last_t = self.last_t
+        for ii, (t_ii, th) in enumerate(samples):
+            integrator.advance(self.state, th, t_ii - last_t, gains)
+            states[ii] = self.state
+            last_t = t_ii
+        if len(states):
+            self.last_t = last_t
+            self.theta_hat = self.alpha_0 + np.sum(self.alpha * np.sin(self.phi))
+        return states
+
+    def _get_integrator(self, solver: str) -> FixedStepIntegrator:
+        if solver not in self._integrators:
+            self._integrators[solver] = FixedStepIntegrator(
+                shape=self.state.shape,
+                n_harmonics=self.n,
+                method=solver,
+                max_step=self.params.max_step,
+            )
+        return self._integrators[solver]
+
+
+# -----------------------------------------------------------------------------
+# Adaptive Oscillator Bank
+# -----------------------------------------------------------------------------
+class AdaptiveOscillatorBank:
+    """Bank of K adaptive oscillators advanced together in one (K, 2+2n) state.
+
+    Every oscillator has its own ``AOParameters`` gains, but all of them must use
+    the same number of harmonics and are sampled at the same times. The bank is
+    always integrated with one of the fixed-step solvers.
+    """
+
+    def __init__(
+        self,
+        params: list[AOParameters],
+        omega_init: float | NDArray = 1.0,
+        solver: str = "rk4",
+        max_step: float = MAX_STEP,
+    ):
+        n_harmonics = {p.n_harmonics for p in params}
+        if len(n_harmonics) != 1:
+            raise ValueError(
+                f"All oscillators in a bank need the same n_harmonics, "
+                f"got {sorted(n_harmonics)}."
+            )
+        self.params = params
+        self.k = len(params)
+        self.n = n_harmonics.pop()
+        self.state = np.zeros((self.k, 2 + 2 * self.n))
+        self.state[:, 0] = omega_init
+        self.last_t = 0.0
+        self.theta_hat = np.zeros(self.k)
+
+        self._gains = (
+            np.array([[p.eta] for p in params]),
+            np.array([[p.nu_phi] for p in params]),
+            np.array([[p.nu_omega] for p in params]),
+        )
+        self._theta_il = np.zeros((self.k, 1))
+        self._integrator = FixedStepIntegrator(
+            shape=self.state.shape,
+            n_harmonics=self.n,
             method=solver,
-            max_step=0.01,
+            max_step=max_step,
         )
 
-        y = sol.y[:, -1]
-        self.omega = y[0]
-        self.alpha_0 = y[1]
-        self.alpha = y[2 : 2 + self.n]
-        self.phi = y[2 + self.n :]
+    def __len__(self) -> int:
+        """Return the number of oscillators in the bank."""
+        return self.k
+
+    @property
+    def omega(self) -> NDArray:
+        """Return a view of the estimated angular frequencies, shape (K,)."""
+        return self.state[:, 0]
+
+    @property
+    def alpha_0(self) -> NDArray:
+        """Return a view of the estimated signal offsets, shape (K,)."""
+        return self.state[:, 1]
+
+    @property
+    def alpha(self) -> NDArray:
+        """Return a view of the harmonic amplitudes, shape (K, n)."""
+        return self.state[:, 2 : 2 + self.n]
+
+    @property
+    def phi(self) -> NDArray:
+        """Return a view of the harmonic phases, shape (K, n)."""
+        return self.state[:, 2 + self.n :]
+
+    @property
+    def phase(self) -> NDArray:
+        """Return the gait phases φ_GP wrapped to [0, 2π), shape (K,)."""
+        return np.mod(self.state[:, 2 + self.n], 2 * np.pi)
+
+    def update(self, t: float, theta_il: NDArray) -> NDArray:
+        """Integrate all oscillators from self.last_t to t, return phases φ_GP(t).
+
+        :param t: Time of the new sample, shared by all oscillators.
+        :param theta_il: Input signal for every oscillator, shape (K,).
+        :return: Gait phases of shape (K,).
+        """
+        self._theta_il[:, 0] = theta_il
+        self._integrator.advance(
+            self.state, self._theta_il, t - self.last_t, self._gains
+        )
         self.last_t = t
 
-        self.theta_hat = self.alpha_0 + np.sum(self.alpha * np.sin(self.phi))
-        return np.mod(self.phi[0], 2 * np.pi)
+        self.theta_hat = self.alpha_0 + np.sum(self.alpha * np.sin(self.phi), axis=1)
+        return self.phase
 
 
 # -----------------------------------------------------------------------------
 # Gait Phase Estimation
 # -----------------------------------------------------------------------------
+@dataclass
+class GaitPhaseTrajectory:
+    """Gait phase estimates for every sample of a recording."""
+
+    phi: NDArray
+    phi_gp: NDArray
+    omega: NDArray
+    theta_hat: NDArray
+    alpha: NDArray
+
+
 class GaitPhaseEstimator:
     """Estimates corrected gait phase using AOs, event detection, and correction."""
 
@@ -105,6 +340,10 @@ class GaitPhaseEstimator:
         self, phi_gp: float, t: float, t_start: float, omega: float
     ) -> float:
         """Correct gait phase φ(t) using error correction."""
+        if t_start == -np.inf:
+            # No gait event yet, so nothing to correct. The decay below is zero
+            # for omega > 0, but overflows while a cold start has omega < 0.
+            return np.mod(phi_gp + self.phi_error, 2 * np.pi)
         Pe = -phi_gp if 0 <= phi_gp < np.pi else 2 * np.pi - phi_gp
         Ce = self.ke * (Pe - self.phi_error)
         self.phi_error += Ce * np.exp(-omega * (t - t_start))
@@ -112,20 +351,106 @@ class GaitPhaseEstimator:
 
     def update(self, t: float, theta_il: float, theta_il_dot: float) -> float:
         """Update gait phase and return corrected gait phase φ(t)."""
-        self.phi_gp = self.ao.update(t, theta_il)
+        phi = self._advance(t, theta_il, theta_il_dot)
         omega = self.ao.omega
+
+        logger.debug(
+            "t={:.2f}, φ_GP={:.2f}, φ={:.2f}, ω={:.2f}, θ_hat={:.2f}",
+            t,
+            self.phi_gp,
+            phi,
+            omega,
+            self.ao.theta_hat,
+        )
+        return phi
+
+    def update_block(
+        self, t: NDArray, theta_il: NDArray, theta_il_dot: NDArray
+    ) -> GaitPhaseTrajectory:
+        """Update gait phase with a block of frames and return per-frame outputs.
+
+        Gives the same numbers as calling ``update`` for every frame, but logs once
+        per block instead of once per frame.
+        """
+        trajectory = self.run(t, theta_il, theta_il_dot)
+        if len(trajectory.phi):
+            logger.debug(
+                "t={:.2f}, φ_GP={:.2f}, φ={:.2f}, ω={:.2f}, θ_hat={:.2f}",
+                t[-1],
+                self.phi_gp,
+                trajectory.phi[-1],
+                self.ao.omega,
+                self.ao.theta_hat,
+            )
+        return trajectory
+
+    def run(
+        self,
+        t: NDArray,
+        theta_il: NDArray,
+        theta_il_dot: NDArray,
+        solver: str | None = None,
+    ) -> GaitPhaseTrajectory:
+        """Estimate the gait phase over whole input arrays in one pass.
+
+        The oscillator is integrated through all samples first, with the input
+        held constant between samples as in ``update``, and the gait events and
+        phase corrections follow in a scalar loop over its outputs. The estimator
+        state is advanced to the last sample.
+
+        With the default solver, ``params.solver``, the results are identical to
+        calling ``update`` for every sample. Pass a fixed-step solver such as
+        "rk4" for long recordings: it tracks the default RK45 to ~1e-3 at a
+        fraction of the cost.
+
+        :param t: Sample times of shape (N,).
+        :param theta_il: Input signal of shape (N,).
+        :param theta_il_dot: Derivative of the input signal of shape (N,).
+        :param solver: Integration method, defaults to ``params.solver``.
+        :return: Preallocated output arrays for every sample.
+        """
+        states = self.ao.run(t, theta_il, solver=solver)
+        n = self.ao.n
+        alpha = states[:, 2 : 2 + n]
+        phases = states[:, 2 + n :]
+        out = GaitPhaseTrajectory(
+            phi=np.empty(len(states)),
+            phi_gp=np.mod(phases[:, 0], 2 * np.pi),
+            omega=states[:, 0],
+            theta_hat=states[:, 1] + np.sum(alpha * np.sin(phases), axis=-1),
+            alpha=alpha,
+        )
+        samples = zip(
+            np.asarray(t).tolist(),
+            np.asarray(theta_il).tolist(),
+            np.asarray(theta_il_dot).tolist(),
+            out.phi_gp.tolist(),
+            out.omega.tolist(),
+            strict=True,
+        )
+        for ii, sample in enumerate(samples):
+            out.phi[ii] = self._correct(*sample)
+        return out
+
+    def _advance(self, t: float, theta_il: float, theta_il_dot: float) -> float:
+        phi_gp = self.ao.update(t, theta_il)
+        return self._correct(t, theta_il, theta_il_dot, phi_gp, self.ao.omega)
+
+    def _correct(
+        self,
+        t: float,
+        theta_il: float,
+        theta_il_dot: float,
+        phi_gp: float,
+        omega: float,
+    ) -> float:
+        self.phi_gp = phi_gp
         period = 2 * np.pi / omega
 
         if self.detect_gait_event(t, theta_il, theta_il_dot, period):
             self.last_t_start = t
 
-        phi = self.correct_phase(self.phi_gp, t, self.last_t_start, omega)
-
-        logger.debug(
-            f"t={t:.2f}, φ_GP={self.phi_gp:.2f}, "
-            f"φ={phi:.2f}, ω={omega:.2f}, θ_hat={self.ao.theta_hat:.2f}"
-        )
-        return phi
+        return self.correct_phase(phi_gp, t, self.last_t_start, omega)
 
 
 # -----------------------------------------------------------------------------
@@ -149,31 +474,171 @@ class PIDController:
         return self.kp * error + self.ki * self.integral + self.kd * derivative
 
 
+class PIDBank:
+    """Bank of J independent ``PIDController`` loops evaluated together.
+
+    Gains may be scalars shared by all joints or (J,) arrays. Errors, integrals
+    and outputs are (J,) arrays, so one tick of all loops is a handful of array
+    operations.
+    """
+
+    def __init__(
+        self,
+        n_joints: int,
+        kp: float | NDArray,
+        ki: float | NDArray,
+        kd: float | NDArray,
+    ):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral = np.zeros(n_joints)
+        self.last_error = np.zeros(n_joints)
+
+    def compute(self, error: NDArray, dt: float) -> NDArray:
+        """Compute the outputs of all loops for a (J,) error."""
+        self.integral += error * dt
+        derivative = error - self.last_error
+        derivative /= dt
+        self.last_error[:] = error
+        return self.kp * error + self.ki * self.integral + self.kd * derivative
+
+
 # -----------------------------------------------------------------------------
 # Low-Level Motor Controller
 # -----------------------------------------------------------------------------
 class LowLevelController:
-    """Low-level motor controller."""
+    """Low-level motor controller.
 
-    def __init__(
+    The reference angle is a cubic spline through ``gait_shape``, evaluated at
+    ``phi - π`` wrapped into [0, 2π), the span of its knots. It is looked up in a ``PhaseTable`` of the spline instead of
+    evaluating the spline on every tick; ``table.max_error`` bounds the
+    difference. Controllers with the same gait shape share one table.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
         kp: float = 5.0,
         ki: float = 0.0,
         kd: float = 0.1,
         gait_shape: NDArray | None = None,
+        *,
+        table_size: int = PHASE_TABLE_SIZE,
+        table_method: str = PHASE_TABLE_METHOD,
     ):
         self.pid = PIDController(kp, ki, kd)
-        x = np.linspace(0, 2 * np.pi, 100)
+        x = np.linspace(0, 2 * np.pi, GAIT_SHAPE_SAMPLES)
         y = gait_shape if gait_shape is not None else np.sin(x)
         self.spline = CubicSpline(x, y)
+        self.table = cached_table(
+            shape_key(gait_shape),
+            lambda: spline_table(self.spline, table_size, table_method),
+            table_size,
+            table_method,
+        )
+
+    def reference(self, phi: float | NDArray) -> NDArray:
+        """Return the reference motor angle for one or many gait phases."""
+        return self.table(phi)
 
     def compute(self, phi: float, theta_m: float, dt: float) -> float:
         """Compute motor output."""
-        theta_r = self.spline(phi - np.pi)
+        theta_r = self.reference(phi)
         error = theta_r - theta_m
         return self.pid.compute(error, dt)  # type: ignore[arg-type]
 
 
+class MultiJointController:
+    """Low-level controller of several joints driven by one gait phase.
+
+    Every joint follows its own gait shape like a ``LowLevelController``, but the
+    shapes are tabulated into one stacked (J, size + 1) table, so the references
+    of all joints come from one lookup and all motor commands from one
+    ``PIDBank`` evaluation per tick.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        gait_shapes: Mapping[str, NDArray | None],
+        kp: float | NDArray = 5.0,
+        ki: float | NDArray = 0.0,
+        kd: float | NDArray = 0.1,
+        *,
+        table_size: int = PHASE_TABLE_SIZE,
+        table_method: str = PHASE_TABLE_METHOD,
+    ):
+        """Initialize the controller.
+
+        :param gait_shapes: Gait shape per joint name, sampled like the
+            ``gait_shape`` of ``LowLevelController``, or None for a sine.
+        :param kp: Proportional gain, shared or one per joint.
+        :param ki: Integral gain, shared or one per joint.
+        :param kd: Derivative gain, shared or one per joint.
+        :param table_size: Number of reference table cells.
+        :param table_method: Reference table interpolation, "linear" or "hermite".
+        """
+        self.joints = tuple(gait_shapes)
+        self.pid = PIDBank(len(self.joints), kp, ki, kd)
+        x = np.linspace(0, 2 * np.pi, GAIT_SHAPE_SAMPLES)
+        shapes = np.stack(
+            [
+                shape if shape is not None else np.sin(x)
+                for shape in gait_shapes.values()
+            ],
+            axis=1,
+        )
+        self.spline = CubicSpline(x, shapes)
+        self.table = cached_table(
+            shape_key(shapes),
+            lambda: spline_table(self.spline, table_size, table_method),
+            table_size,
+            table_method,
+        )
+
+    def reference(self, phi: float | NDArray) -> NDArray:
+        """Return the reference angles of shape (J,) or (J, N) for N phases."""
+        return self.table(phi)
+
+    def velocity(self, phi: float | NDArray, omega: float | NDArray) -> NDArray:
+        """Return the reference angular velocities at phases advancing at omega.
+
+        :param phi: Gait phase or (N,) phases.
+        :param omega: Phase rate, e.g. the oscillator's angular frequency.
+        :return: Velocities of shape (J,) or (J, N).
+        """
+        return self.table.derivative(phi) * omega
+
+    def compute(self, phi: float, theta_m: NDArray, dt: float) -> NDArray:
+        """Compute the motor commands of all joints.
+
+        :param phi: Corrected gait phase.
+        :param theta_m: Motor angles of shape (J,).
+        :param dt: Time since the last tick.
+        :return: Motor velocity commands of shape (J,).
+        """
+        return self.pid.compute(self.reference(phi) - theta_m, dt)
+
+
+def spline_table(
+    spline: CubicSpline,
+    size: int = PHASE_TABLE_SIZE,
+    method: str = PHASE_TABLE_METHOD,
+) -> PhaseTable:
+    """Tabulate the reference ``spline((phi - π) mod 2π)`` of a gait shape spline.
+
+    The spline argument is wrapped into the span of its knots, so phases below π
+    do not extrapolate the spline. A spline of J gait shapes gives a stacked
+    (J, size + 1) table.
+    """
+    slope = spline.derivative()
+    return PhaseTable.sample(
+        lambda phi: np.moveaxis(spline(np.mod(phi - np.pi, 2 * np.pi)), 0, -1),
+        lambda phi: np.moveaxis(slope(np.mod(phi - np.pi, 2 * np.pi)), 0, -1),
+        size,
+        method,
+    )
+
+
 def sample_walking_data(
     period: float, t_start: float = 0.0, t_end: float = 100.0, dt: float = 0.01
 ) -> tuple[NDArray, NDArray, NDArray]:
@@ -0,0 +1,178 @@
+"""Columnar recorder for per-step controller outputs."""
+
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+DEFAULT_RECORDER_CAPACITY = 4096
+
+
+class RecorderFields:
+    """Names of the signals stored by the recorder."""
+
+    TIME = "t"
+    THETA_IL = "theta_il"
+    PHI = "phi"
+    PHI_GP = "phi_gp"
+    OMEGA = "omega"
+    THETA_HAT = "theta_hat"
+    THETA_M = "theta_m"
+    OMEGA_CMD = "omega_cmd"
+    LATENCY = "step_latency"
+
+
+RECORDER_FIELDS = (
+    RecorderFields.TIME,
+    RecorderFields.THETA_IL,
+    RecorderFields.PHI,
+    RecorderFields.PHI_GP,
+    RecorderFields.OMEGA,
+    RecorderFields.THETA_HAT,
+    RecorderFields.THETA_M,
+    RecorderFields.OMEGA_CMD,
+    RecorderFields.LATENCY,
+)
+
+
+class AORecorder:
+    """Record per-step signals into preallocated NumPy columns.
+
+    Every field is stored as one contiguous row of a (fields, capacity) float64
+    buffer. In the default growable mode the buffer doubles when it is full; in
+    ring mode the capacity is fixed and the oldest records are overwritten, which
+    bounds memory for live runs.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_RECORDER_CAPACITY,
+        ring: bool = False,
+        fields: tuple[str, ...] = RECORDER_FIELDS,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"Recorder capacity must be positive, got {capacity}.")
+        self.fields = fields
+        self.ring = ring
+        self.total = 0
+        self._index = {name: ii for ii, name in enumerate(fields)}
+        self._buffer = np.empty((len(fields), capacity))
+        self._size = 0
+        self._head = 0
+
+    def __len__(self) -> int:
+        """Return the number of records currently held."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of records that fit without growing."""
+        return self._buffer.shape[1]
+
+    def append(self, **values: float) -> None:
+        """Append one record, given as one keyword argument per field.
+
+        Fields that are not given are recorded as NaN.
+        """
+        row = self._reserve(1)
+        self._buffer[:, row] = np.nan
+        for name, value in values.items():
+            self._buffer[self._index[name], row] = value
+
+    def extend(self, **columns: NDArray) -> None:
+        """Append a block of records, given as one array per field.
+
+        Fields that are not given are recorded as NaN.
+        """
+        n_records = len(next(iter(columns.values())))
+        if n_records == 0:
+            return
+        if self.ring and n_records > self.capacity:
+            columns = {name: col[-self.capacity :] for name, col in columns.items()}
+            self.total += n_records - self.capacity
+            n_records = self.capacity
+
+        start = self._reserve(n_records)
+        first = min(n_records, self.capacity - start)
+        for name in self.fields:
+            row = self._buffer[self._index[name]]
+            if name not in columns:
+                row[start : start + first] = np.nan
+                row[: n_records - first] = np.nan
+                continue
+            column = columns[name]
+            row[start : start + first] = column[:first]
+            row[: n_records - first] = column[first:]
+
+    def column(self, name: str) -> NDArray:
+        """Return one field in chronological order.
+
+        This is a zero-copy view unless a ring buffer has wrapped around.
+        """
+        chunks = self._chunks(name)
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    def to_dict(self) -> dict[str, NDArray]:
+        """Return all fields in chronological order."""
+        return {name: self.column(name) for name in self.fields}
+
+    def clear(self) -> None:
+        """Drop all records but keep the allocated buffer."""
+        self._size = 0
+        self._head = 0
+        self.total = 0
+
+    def save_npz(self, filepath: str | Path, compress: bool = False) -> Path:
+        """Save all fields to a ``.npz`` archive."""
+        filepath = Path(filepath)
+        save = np.savez_compressed if compress else np.savez
+        save(filepath, **self.to_dict())  # type: ignore[arg-type]
+        logger.info(f"Saved {len(self)} records to {filepath}")
+        return filepath
+
+    def save_parquet(self, filepath: str | Path) -> Path:
+        """Save all fields to a Parquet file, which requires ``pyarrow``."""
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+            import pyarrow.parquet as pq  # noqa: PLC0415
+        except ImportError as err:
+            raise ImportError("Parquet export requires 'pyarrow'.") from err
+
+        filepath = Path(filepath)
+        table = pa.table(
+            {
+                name: pa.chunked_array(
+                    [pa.array(chunk) for chunk in self._chunks(name)]
+                )
+                for name in self.fields
+            }
+        )
+        pq.write_table(table, filepath)
+        logger.info(f"Saved {len(self)} records to {filepath}")
+        return filepath
+
+    def _chunks(self, name: str) -> list[NDArray]:
+        # Chronological zero-copy pieces of one field, two if the ring has wrapped.
+        row = self._buffer[self._index[name]]
+        if self.ring and self._size == self.capacity and self._head:
+            return [row[self._head :], row[: self._head]]
+        return [row[: self._size]]
+
+    def _reserve(self, n_records: int) -> int:
+        # Claim n_records slots and return the buffer position of the first one.
+        self.total += n_records
+        if self.ring:
+            start = self._head
+            self._head = (self._head + n_records) % self.capacity
+            self._size = min(self._size + n_records, self.capacity)
+            return start
+
+        start = self._size
+        if start + n_records > self.capacity:
+            new_capacity = max(2 * self.capacity, start + n_records)
+            buffer = np.empty((len(self.fields), new_capacity))
+            buffer[:, :start] = self._buffer[:, :start]
+            self._buffer = buffer
+        self._size += n_records
+        return start
@@ -0,0 +1,168 @@
+"""Fixed-rate pacing of the control loop against absolute deadlines."""
+
+import math
+import time
+from dataclasses import dataclass
+
+from adaptive_oscillator.definitions import (
+    SCHEDULER_OVERRUN_TOLERANCE,
+    SCHEDULER_SPIN_TIME,
+)
+
+
+class OverrunPolicy:
+    """What the scheduler does with a frame that misses its deadline."""
+
+    # Run late frames right away and keep the timeline, so the loop catches up.
+    CATCH_UP = "catch_up"
+    # As CATCH_UP, but report late frames so the caller can drop optional work.
+    SKIP = "skip"
+    # Move the timeline back by the lateness, so later frames are not bunched.
+    REALIGN = "realign"
+
+
+OVERRUN_POLICIES = (OverrunPolicy.CATCH_UP, OverrunPolicy.SKIP, OverrunPolicy.REALIGN)
+
+
+@dataclass
+class SchedulerStats:
+    """Timing of the frames a scheduler has paced, in seconds."""
+
+    frames: int
+    overruns: int
+    skipped: int
+    jitter_mean: float
+    jitter_std: float
+    jitter_max: float
+    lateness_max: float
+
+    def __str__(self) -> str:
+        """Return a one-line summary."""
+        return (
+            f"{self.frames} frames, {self.overruns} overruns, {self.skipped} skipped, "
+            f"jitter {self.jitter_mean * 1e6:.0f} ± {self.jitter_std * 1e6:.0f} us "
+            f"(max {self.jitter_max * 1e6:.0f} us)"
+        )
+
+
+class DeadlineScheduler:
+    """Release frames at their log time, scaled by a speed factor.
+
+    Every frame's deadline is computed from the first frame's wall clock time
+    with ``time.perf_counter_ns``, not from the previous frame, so the time spent
+    working between frames does not add up to drift. A wait sleeps until shortly
+    before the deadline and spins for the rest, as sleeps overshoot by up to a
+    scheduler tick.
+
+    Jitter is how late a frame is released after its deadline. Running totals
+    are kept instead of per-frame samples, so memory stays constant.
+    """
+
+    def __init__(
+        self,
+        speed: float | None = 1.0,
+        spin_time: float = SCHEDULER_SPIN_TIME,
+        overrun_tolerance: float = SCHEDULER_OVERRUN_TOLERANCE,
+        policy: str = OverrunPolicy.CATCH_UP,
+    ) -> None:
+        """Initialize the scheduler.
+
+        :param speed: Log seconds per wall clock second, e.g. 1.0 for real time,
+            or None to run as fast as possible.
+        :param spin_time: Seconds before every deadline to spin instead of sleep,
+            0 to only sleep.
+        :param overrun_tolerance: Seconds a frame may be late without counting as
+            an overrun.
+        :param policy: One of ``OVERRUN_POLICIES``.
+        :raises ValueError: If the speed is not positive or the policy is unknown.
+        """
+        if speed is not None and not speed > 0:
+            raise ValueError(f"Speed must be positive, got {speed}.")
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected {OVERRUN_POLICIES}.")
+        self.speed = speed
+        self.spin_ns = round(spin_time * 1e9)
+        self.tolerance_ns = round(overrun_tolerance * 1e9)
+        self.policy = policy
+        self.reset()
+
+    @property
+    def paced(self) -> bool:
+        """Return whether frames are held back until their deadlines."""
+        return self.speed is not None and math.isfinite(self.speed)
+
+    def reset(self) -> None:
+        """Forget the timeline and the statistics."""
+        self._origin_t: float | None = None
+        self._origin_ns = 0
+        self.frames = 0
+        self.overruns = 0
+        self.skipped = 0
+        self._jitter_sum = 0.0
+        self._jitter_sq = 0.0
+        self._jitter_max = 0.0
+        self._lateness_max = 0.0
+
+    def deadline_ns(self, t: float) -> int:
+        """Return the ``perf_counter_ns`` deadline of the frame at log time ``t``."""
+        if self._origin_t is None or self.speed is None:
+            raise RuntimeError("The timeline starts with the first call to wait.")
+        return self._origin_ns + round((t - self._origin_t) / self.speed * 1e9)
+
+    def wait(self, t: float) -> bool:
+        """Block until the deadline of the frame at log time ``t``.
+
+        The first frame starts the timeline and is released right away.
+
+        :param t: Log time of the frame in seconds.
+        :return: False if the frame overran under the SKIP policy and optional
+            work for it should be dropped, else True.
+        """
+        self.frames += 1
+        if not self.paced:
+            return True
+        now = time.perf_counter_ns()
+        if self._origin_t is None:
+            self._origin_t = t
+            self._origin_ns = now
+            return True
+
+        deadline = self.deadline_ns(t)
+        remaining = deadline - now
+        if remaining > self.spin_ns:
+            time.sleep((remaining - self.spin_ns) * 1e-9)
+        while (now := time.perf_counter_ns()) < deadline:
+            pass
+
+        lateness = now - deadline
+        jitter = lateness * 1e-9
+        self._jitter_sum += jitter
+        self._jitter_sq += jitter * jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+        if lateness <= self.tolerance_ns or remaining > 0:
+            # A frame that was only made late by its own wait is not an overrun.
+            return True
+
+        self.overruns += 1
+        self._lateness_max = max(self._lateness_max, jitter)
+        if self.policy == OverrunPolicy.REALIGN:
+            self._origin_ns += lateness
+        elif self.policy == OverrunPolicy.SKIP:
+            self.skipped += 1
+            return False
+        return True
+
+    def stats(self) -> SchedulerStats:
+        """Return the statistics of the frames waited for since the last reset."""
+        n_waits = max(self.frames - 1, 1) if self.paced else 1
+        mean = self._jitter_sum / n_waits
+        variance = max(self._jitter_sq / n_waits - mean * mean, 0.0)
+        return SchedulerStats(
+            frames=self.frames,
+            overruns=self.overruns,
+            skipped=self.skipped,
+            jitter_mean=mean,
+            jitter_std=math.sqrt(variance),
+            jitter_max=self._jitter_max,
+            lateness_max=self._lateness_max,
+        )
@@ -0,0 +1,176 @@
+"""Binary snapshots of the full controller state."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from adaptive_oscillator.controller import AOController
+
+SNAPSHOT_MAGIC = float(0x414F5353)  # "AOSS"
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotFields:
+    """Names of the fields stored in a snapshot, in layout order."""
+
+    MAGIC = "magic"
+    VERSION = "version"
+    N_HARMONICS = "n_harmonics"
+    AO_STATE = "ao_state"
+    AO_LAST_T = "ao_last_t"
+    THETA_HAT = "theta_hat"
+    LAST_T_START = "last_t_start"
+    PHI_ERROR = "phi_error"
+    PHI_GP = "phi_gp"
+    PID_INTEGRAL = "pid_integral"
+    PID_LAST_ERROR = "pid_last_error"
+    THETA_M = "theta_m"
+    LAST_TIME = "last_time"
+
+
+class SnapshotLayout:
+    """Fixed float64 layout of a snapshot for a number of harmonics.
+
+    The buffer starts with a header of magic number, layout version and number
+    of harmonics, followed by the oscillator state ``[omega, alpha_0, alpha,
+    phi]`` and the scalar states of the estimator, the PID and the controller.
+    A controller that has not stepped yet stores NaN as its last time.
+    """
+
+    def __init__(self, n_harmonics: int) -> None:
+        self.n_harmonics = n_harmonics
+        sizes = {
+            SnapshotFields.MAGIC: 1,
+            SnapshotFields.VERSION: 1,
+            SnapshotFields.N_HARMONICS: 1,
+            SnapshotFields.AO_STATE: 2 + 2 * n_harmonics,
+            SnapshotFields.AO_LAST_T: 1,
+            SnapshotFields.THETA_HAT: 1,
+            SnapshotFields.LAST_T_START: 1,
+            SnapshotFields.PHI_ERROR: 1,
+            SnapshotFields.PHI_GP: 1,
+            SnapshotFields.PID_INTEGRAL: 1,
+            SnapshotFields.PID_LAST_ERROR: 1,
+            SnapshotFields.THETA_M: 1,
+            SnapshotFields.LAST_TIME: 1,
+        }
+        self.slices: dict[str, slice] = {}
+        offset = 0
+        for name, size in sizes.items():
+            self.slices[name] = slice(offset, offset + size)
+            offset += size
+        self.size = offset
+
+    def index(self, name: str) -> int:
+        """Return the buffer index of a scalar field."""
+        return self.slices[name].start
+
+    def validate(self, snapshot: NDArray) -> None:
+        """Check that a buffer is a snapshot with this layout.
+
+        :raises ValueError: If the header or size does not match.
+        """
+        if snapshot.ndim != 1 or len(snapshot) <= self.index(
+            SnapshotFields.N_HARMONICS
+        ):
+            raise ValueError("Snapshot must be a 1-D buffer with a header.")
+        if snapshot[self.index(SnapshotFields.MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError("Buffer is not a controller snapshot.")
+        version = snapshot[self.index(SnapshotFields.VERSION)]
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot version {version:g} is not supported, "
+                f"expected {SNAPSHOT_VERSION}."
+            )
+        n_harmonics = snapshot[self.index(SnapshotFields.N_HARMONICS)]
+        if n_harmonics != self.n_harmonics or len(snapshot) != self.size:
+            raise ValueError(
+                f"Snapshot has {n_harmonics:g} harmonics, "
+                f"the controller {self.n_harmonics}."
+            )
+
+
+def take_snapshot(controller: "AOController", out: NDArray | None = None) -> NDArray:
+    """Copy the state of a controller into a snapshot buffer.
+
+    :param controller: Controller to snapshot.
+    :param out: Buffer of the layout's size to write into, e.g. a row of a
+        checkpoint matrix.
+    :return: Snapshot buffer.
+    """
+    estimator = controller.estimator
+    ao = estimator.ao
+    pid = controller.controller.pid
+    layout = SnapshotLayout(ao.n)
+    snapshot = np.empty(layout.size) if out is None else out
+    if snapshot.shape != (layout.size,):
+        raise ValueError(f"Expected out of shape ({layout.size},).")
+
+    scalars = {
+        SnapshotFields.MAGIC: SNAPSHOT_MAGIC,
+        SnapshotFields.VERSION: SNAPSHOT_VERSION,
+        SnapshotFields.N_HARMONICS: ao.n,
+        SnapshotFields.AO_LAST_T: ao.last_t,
+        SnapshotFields.THETA_HAT: ao.theta_hat,
+        SnapshotFields.LAST_T_START: estimator.last_t_start,
+        SnapshotFields.PHI_ERROR: estimator.phi_error,
+        SnapshotFields.PHI_GP: estimator.phi_gp,
+        SnapshotFields.PID_INTEGRAL: pid.integral,
+        SnapshotFields.PID_LAST_ERROR: pid.last_error,
+        SnapshotFields.THETA_M: controller.theta_m,
+        SnapshotFields.LAST_TIME: (
+            np.nan if controller.last_time is None else controller.last_time
+        ),
+    }
+    for name, value in scalars.items():
+        snapshot[layout.index(name)] = value
+    snapshot[layout.slices[SnapshotFields.AO_STATE]] = ao.state
+    return snapshot
+
+
+def restore_snapshot(
+    controller: "AOController", snapshot: NDArray, time: float | None = None
+) -> None:
+    """Load the state of a snapshot into a controller.
+
+    :param controller: Controller with the same number of harmonics.
+    :param snapshot: Snapshot buffer.
+    :param time: Shift every stored timestamp so the snapshot's last step lands
+        at this time, e.g. to continue on a log with a different time origin.
+    :raises ValueError: If the snapshot does not match the controller.
+    """
+    estimator = controller.estimator
+    ao = estimator.ao
+    pid = controller.controller.pid
+    layout = SnapshotLayout(ao.n)
+    layout.validate(snapshot)
+
+    def scalar(name: str) -> float:
+        return float(snapshot[layout.index(name)])
+
+    last_time = scalar(SnapshotFields.LAST_TIME)
+    shift = 0.0 if time is None or np.isnan(last_time) else time - last_time
+
+    ao.state[:] = snapshot[layout.slices[SnapshotFields.AO_STATE]]
+    ao.last_t = scalar(SnapshotFields.AO_LAST_T) + shift
+    ao.theta_hat = scalar(SnapshotFields.THETA_HAT)
+    estimator.last_t_start = scalar(SnapshotFields.LAST_T_START) + shift
+    estimator.phi_error = scalar(SnapshotFields.PHI_ERROR)
+    estimator.phi_gp = scalar(SnapshotFields.PHI_GP)
+    pid.integral = scalar(SnapshotFields.PID_INTEGRAL)
+    pid.last_error = scalar(SnapshotFields.PID_LAST_ERROR)
+    controller.theta_m = scalar(SnapshotFields.THETA_M)
+    controller.last_time = None if np.isnan(last_time) else last_time + shift
+
+
+def save_snapshot(path: str | Path, snapshot: NDArray) -> None:
+    """Write a snapshot buffer to a ``.npy`` file."""
+    np.save(path, snapshot)
+
+
+def load_snapshot(path: str | Path) -> NDArray:
+    """Read a snapshot buffer from a ``.npy`` file."""
+    return np.load(path)
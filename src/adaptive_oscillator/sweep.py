@@ -0,0 +1,356 @@
+"""Parallel parameter sweeps of the gait phase estimator over recorded logs."""
+
+import argparse
+import itertools
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from numpy.typing import NDArray
+from pandas.api.types import is_numeric_dtype
+
+from adaptive_oscillator.definitions import (
+    CONVERGENCE_TOLERANCE,
+    WARM_START_WINDOW,
+    AnglesHeader,
+)
+from adaptive_oscillator.oscillator import AOParameters, GaitPhaseEstimator
+from adaptive_oscillator.utils.cache_utils import LogCache
+from adaptive_oscillator.utils.derivative_utils import backward_difference
+from adaptive_oscillator.utils.parser_utils import LogFiles, create_executor
+from adaptive_oscillator.utils.spectral_utils import local_fundamental
+
+PARAMETER_COLUMNS = tuple(field.name for field in fields(AOParameters))
+METRIC_COLUMNS = ("convergence_time", "omega_error", "phase_error", "runtime")
+LOG_COLUMN = "log_dir"
+WARM_START_COLUMN = "warm_start"
+
+
+@dataclass
+class SweepCell:
+    """One (parameters, log) combination of a sweep."""
+
+    params: AOParameters
+    log_dir: str
+    column: str
+    warm_start: float | None
+
+    @property
+    def key(self) -> tuple:
+        """Return the values that identify the cell in a results table."""
+        return (self.log_dir, self.warm_start or 0.0, *asdict(self.params).values())
+
+
+def parameter_grid(**values: Sequence) -> list[AOParameters]:
+    """Return the parameters of every combination of the given values.
+
+    Example: ``parameter_grid(eta=[0.02, 0.05], n_harmonics=[1, 3])``. Fields that
+    are not given keep their defaults.
+
+    :raises ValueError: If a name is not an ``AOParameters`` field.
+    """
+    _check_names(values)
+    names = list(values)
+    return [
+        AOParameters(**dict(zip(names, combination, strict=True)))
+        for combination in itertools.product(*values.values())
+    ]
+
+
+def random_design(
+    n_samples: int,
+    seed: int | None = None,
+    **ranges: tuple[float, float],
+) -> list[AOParameters]:
+    """Return parameters drawn uniformly from ranges.
+
+    Integer fields are drawn from the inclusive integer range.
+
+    :param n_samples: Number of parameter sets.
+    :param seed: Seed of the random generator.
+    :param ranges: Lowest and highest value per ``AOParameters`` field.
+    :raises ValueError: If a name is not an ``AOParameters`` field.
+    """
+    _check_names(ranges)
+    rng = np.random.default_rng(seed)
+    defaults = AOParameters()
+    samples: dict[str, list] = {}
+    for name, (low, high) in ranges.items():
+        if isinstance(getattr(defaults, name), int):
+            values = rng.integers(low, high, size=n_samples, endpoint=True)
+        else:
+            values = rng.uniform(low, high, size=n_samples)
+        samples[name] = values.tolist()
+    return [
+        replace(defaults, **{name: values[ii] for name, values in samples.items()})
+        for ii in range(n_samples)
+    ]
+
+
+def run_sweep(  # noqa: PLR0913
+    designs: Sequence[AOParameters],
+    log_dirs: Sequence[str | Path],
+    results_path: str | Path | None = None,
+    *,
+    cache: LogCache | None = None,
+    executor: str | Executor = "process",
+    n_jobs: int | None = None,
+    column: str = AnglesHeader.HIP_X,
+    warm_start: float | None = None,
+) -> pd.DataFrame:
+    """Run the estimator for every combination of parameters and log.
+
+    Every log is parsed once into the binary cache up front; the workers then
+    memory-map the cached arrays, so the parsed logs are shared through the page
+    cache instead of being parsed or pickled per cell. With ``results_path``,
+    the table is written after every finished cell and cells already in the file
+    are not run again, so an interrupted sweep resumes where it stopped.
+
+    :param designs: Parameter sets to evaluate.
+    :param log_dirs: Log directories to replay the left Angles log of.
+    :param results_path: ``.npz`` file to resume from and write to, if any.
+    :param cache: Binary cache to share the logs through, one next to every log
+        if None.
+    :param executor: "process", "thread", "serial" or an executor to run cells on.
+    :param n_jobs: Maximum number of workers, the CPU count if None.
+    :param column: Angles column to estimate the gait phase from.
+    :param warm_start: Seed every oscillator from a Fourier fit of this many
+        seconds of the log instead of starting it cold.
+    :return: One row per cell with the log, the warm-start window (0 for a cold
+        start), the parameters and the metrics of ``evaluate``.
+    """
+    cache = cache if cache is not None else LogCache()
+    results_path = Path(results_path) if results_path is not None else None
+    results = load_results(results_path)
+    key_columns = [LOG_COLUMN, WARM_START_COLUMN, *PARAMETER_COLUMNS]
+    done = set(results[key_columns].itertuples(index=False))
+
+    cells: list[SweepCell] = []
+    for log_dir in log_dirs:
+        cache.load(LogFiles(log_dir).angle.left)
+        for params in designs:
+            cell = SweepCell(params, str(log_dir), column, warm_start)
+            if cell.key not in done:
+                cells.append(cell)
+    logger.info(
+        f"Running {len(cells)} sweep cells, {len(results)} already in the results."
+    )
+
+    rows = results.to_dict("records")
+    if executor == "serial" or not cells:
+        for cell in cells:
+            rows.append(_run_cell(cell, cache))
+            save_results(results_path, rows)
+    elif isinstance(executor, str):
+        with create_executor(executor, n_jobs or os.cpu_count() or 1) as pool:
+            _collect(pool, cells, cache, rows, results_path)
+    else:
+        _collect(executor, cells, cache, rows, results_path)
+    return _to_frame(rows)
+
+
+def evaluate(
+    t: NDArray,
+    theta_il: NDArray,
+    params: AOParameters,
+    warm_start: float | None = None,
+    reference: tuple[NDArray, NDArray] | None = None,
+) -> dict[str, float]:
+    """Run the estimator over a signal and score it against the local gait rhythm.
+
+    :param t: Sample times from zero.
+    :param theta_il: Input signal.
+    :param params: Estimator parameters.
+    :param warm_start: Seconds of signal to warm-start the oscillator from, if any.
+    :param reference: Angular frequency and phase per sample to score against,
+        ``local_fundamental`` of the signal if None.
+    :return: Time after which omega stays within ``CONVERGENCE_TOLERANCE`` of the
+        reference (inf if it never settles), mean relative omega error, RMS phase
+        error in rad and run time in seconds.
+    """
+    omega_ref, phase_ref = (
+        reference if reference is not None else local_fundamental(t, theta_il)
+    )
+    start = time.perf_counter()
+    estimator = GaitPhaseEstimator(params)
+    if warm_start is not None:
+        window = t <= t[0] + warm_start
+        estimator.ao.warm_start(t[window], theta_il[window])
+    trajectory = estimator.run(
+        t, theta_il, backward_difference(t, theta_il), solver=params.solver
+    )
+    runtime = time.perf_counter() - start
+
+    phase_error = np.angle(np.exp(1j * (trajectory.phi_gp - phase_ref)))
+    return {
+        "convergence_time": convergence_time(t, trajectory.omega, omega_ref),
+        "omega_error": float(np.mean(np.abs(trajectory.omega / omega_ref - 1))),
+        "phase_error": float(np.sqrt(np.mean(phase_error**2))),
+        "runtime": runtime,
+    }
+
+
+def convergence_time(
+    t: NDArray,
+    omega: NDArray,
+    omega_ref: NDArray,
+    tolerance: float = CONVERGENCE_TOLERANCE,
+) -> float:
+    """Return the time after which omega stays within a tolerance of a reference.
+
+    :param t: Sample times.
+    :param omega: Estimated angular frequency per sample.
+    :param omega_ref: Reference angular frequency per sample.
+    :param tolerance: Largest relative error that counts as converged.
+    :return: Time of the first sample of the final converged stretch, or inf if
+        the last sample is not converged.
+    """
+    outside = np.flatnonzero(np.abs(omega - omega_ref) > tolerance * omega_ref)
+    if len(outside) == 0:
+        return float(t[0])
+    if outside[-1] == len(t) - 1:
+        return float("inf")
+    return float(t[outside[-1] + 1])
+
+
+def load_results(path: Path | None) -> pd.DataFrame:
+    """Return the results table of a file, or an empty table if it does not exist."""
+    if path is None or not path.is_file():
+        return _to_frame([])
+    with np.load(path) as stored:
+        return pd.DataFrame({name: stored[name] for name in stored.files})
+
+
+def save_results(path: Path | None, rows: list[dict]) -> None:
+    """Write the results table as one array per column.
+
+    The file is replaced atomically, so an interrupted sweep never leaves a
+    truncated table behind.
+    """
+    if path is None:
+        return
+    frame = _to_frame(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as file:
+        np.savez(
+            file,
+            **{
+                name: frame[name].to_numpy(
+                    dtype=None if is_numeric_dtype(frame[name]) else str
+                )
+                for name in frame.columns
+            },
+        )
+    tmp_path.replace(path)
+
+
+def _collect(
+    executor: Executor,
+    cells: list[SweepCell],
+    cache: LogCache,
+    rows: list[dict],
+    results_path: Path | None,
+) -> None:
+    futures = [executor.submit(_run_cell, cell, cache) for cell in cells]
+    for n_done, future in enumerate(as_completed(futures), start=1):
+        rows.append(future.result())
+        save_results(results_path, rows)
+        logger.debug(f"Finished sweep cell {n_done}/{len(cells)}")
+
+
+def _run_cell(cell: SweepCell, cache: LogCache) -> dict:
+    t, theta, reference = _load_signal(cell.log_dir, cell.column, cache)
+    metrics = evaluate(t, theta, cell.params, cell.warm_start, reference)
+    return {
+        LOG_COLUMN: cell.log_dir,
+        WARM_START_COLUMN: cell.warm_start or 0.0,
+        **asdict(cell.params),
+        **metrics,
+    }
+
+
+# Signals and references already loaded by this process, keyed on the cache entry
+# so a changed log is loaded again.
+_SIGNALS: dict[tuple[str, str], tuple[NDArray, NDArray, tuple[NDArray, NDArray]]] = {}
+
+
+def _load_signal(
+    log_dir: str, column: str, cache: LogCache
+) -> tuple[NDArray, NDArray, tuple[NDArray, NDArray]]:
+    filepath = LogFiles(log_dir).angle.left
+    key = (str(cache.entry_for(filepath)), column)
+    if key not in _SIGNALS:
+        table = cache.load(filepath)
+        t = table.time - table.time[0]
+        theta = np.deg2rad(table[column])
+        _SIGNALS[key] = (t, theta, local_fundamental(t, theta))
+    return _SIGNALS[key]
+
+
+def _to_frame(rows: list[dict]) -> pd.DataFrame:
+    columns = [LOG_COLUMN, WARM_START_COLUMN, *PARAMETER_COLUMNS, *METRIC_COLUMNS]
+    frame = pd.DataFrame(rows, columns=columns)
+    frame[LOG_COLUMN] = frame[LOG_COLUMN].astype(str)
+    frame["solver"] = frame["solver"].astype(str)
+    return frame
+
+
+def _check_names(names: dict) -> None:
+    unknown = set(names) - set(PARAMETER_COLUMNS)
+    if unknown:
+        raise ValueError(
+            f"Unknown parameters {sorted(unknown)}, expected {PARAMETER_COLUMNS}."
+        )
+
+
+def main() -> None:
+    """Run a grid sweep from the command line."""
+    parser = argparse.ArgumentParser(description="Sweep the estimator parameters.")
+    parser.add_argument(
+        "-l", "--log-dirs", nargs="+", required=True, help="Log directories."
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, help="Results .npz file to resume."
+    )
+    parser.add_argument("--eta", type=float, nargs="+", default=None)
+    parser.add_argument("--nu-phi", type=float, nargs="+", default=None)
+    parser.add_argument("--nu-omega", type=float, nargs="+", default=None)
+    parser.add_argument("--n-harmonics", type=int, nargs="+", default=None)
+    parser.add_argument("--solver", nargs="+", default=None)
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Number of worker processes."
+    )
+    parser.add_argument(
+        "-w",
+        "--warm-start",
+        type=float,
+        nargs="?",
+        const=WARM_START_WINDOW,
+        default=None,
+        help="Warm-start every oscillator from the first seconds of the log.",
+    )
+    args = parser.parse_args()
+    grid = {
+        name: getattr(args, name)
+        for name in ("eta", "nu_phi", "nu_omega", "n_harmonics", "solver")
+        if getattr(args, name) is not None
+    }
+    results = run_sweep(
+        parameter_grid(**grid),
+        args.log_dirs,
+        args.output,
+        n_jobs=args.jobs,
+        warm_start=args.warm_start,
+    )
+    logger.success(f"Wrote {len(results)} sweep results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Rate-limited structured telemetry for the control loop."""
+
+from collections.abc import Callable, Iterable
+
+from loguru import logger
+
+from adaptive_oscillator.definitions import TELEMETRY_LEVEL, TELEMETRY_RATE_HZ
+
+
+class TelemetryRecord:
+    """One numeric telemetry record, formatted only when it is turned into text."""
+
+    __slots__ = ("fields", "values")
+
+    def __init__(self, fields: tuple[str, ...], values: tuple[float, ...]) -> None:
+        self.fields = fields
+        self.values = values
+
+    def __str__(self) -> str:
+        """Return the record as 'name: value' pairs."""
+        return ", ".join(
+            f"{name}: {value:.2f}"
+            for name, value in zip(self.fields, self.values, strict=True)
+        )
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the record as a field-to-value mapping."""
+        return dict(zip(self.fields, self.values, strict=True))
+
+
+TelemetrySink = Callable[[TelemetryRecord], None]
+
+
+class LoguruSink:
+    """Telemetry sink that forwards records to loguru.
+
+    The record is passed as a format argument, so loguru only formats it when a
+    handler actually accepts the level.
+    """
+
+    def __init__(self, level: str = TELEMETRY_LEVEL) -> None:
+        self.level = level
+
+    def __call__(self, record: TelemetryRecord) -> None:
+        """Log one record."""
+        logger.log(self.level, "{}", record)
+
+
+class Telemetry:
+    """Publish structured numeric records to sinks with decimation and rate limits.
+
+    Rate limiting uses the record time rather than the wall clock, so a replay
+    emits the same records however fast it runs.
+    """
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        sinks: Iterable[TelemetrySink] | None = None,
+        decimation: int = 1,
+        max_rate_hz: float | None = TELEMETRY_RATE_HZ,
+    ) -> None:
+        """Initialize telemetry.
+
+        :param fields: Names of the values in every record, time first.
+        :param sinks: Consumers of the records, a loguru sink if None.
+        :param decimation: Only consider every n-th record.
+        :param max_rate_hz: Upper bound on the emitted record rate, None for no limit.
+        """
+        if decimation < 1:
+            raise ValueError(f"Decimation must be positive, got {decimation}.")
+        self.fields = fields
+        self.sinks = list(sinks) if sinks is not None else [LoguruSink()]
+        self.decimation = decimation
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Start over with the counters and rate limit of a new run."""
+        self.n_received = 0
+        self.n_emitted = 0
+        self._last_t = float("-inf")
+
+    def record(self, *values: float) -> bool:
+        """Offer one record, given in the order of ``fields``.
+
+        :return: True if the record was passed on to the sinks.
+        """
+        self.n_received += 1
+        if not self.sinks or (self.n_received - 1) % self.decimation:
+            return False
+        t = values[0]
+        if t < self._last_t:
+            # Time went back, e.g. a new replay or a restored snapshot.
+            self._last_t = float("-inf")
+        if t - self._last_t < self.min_interval:
+            return False
+        self._last_t = t
+        self.n_emitted += 1
+
+        record = TelemetryRecord(self.fields, values)
+        for sink in self.sinks:
+            sink(record)
+        return True
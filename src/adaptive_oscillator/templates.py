@@ -0,0 +1,293 @@
+"""Gait shape templates learned from recordings by phase-binned cycle averages."""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import (
+    GAIT_SHAPE_SAMPLES,
+    GAIT_TEMPLATE_BINS,
+    LOG_CACHE_DIR,
+    TEMPLATE_CHUNK_SIZE,
+    WARM_START_WINDOW,
+    AnglesHeader,
+)
+from adaptive_oscillator.oscillator import AOParameters, GaitPhaseEstimator
+from adaptive_oscillator.utils.derivative_utils import BackwardDifference
+from adaptive_oscillator.utils.stream_utils import follow_log_file
+
+TWO_PI = 2 * np.pi
+
+
+@dataclass
+class GaitTemplate:
+    """Mean and spread of a signal over the gait cycle, per phase bin.
+
+    Bin ``i`` covers the phases ``[i, i + 1) * 2π / n_bins``. Signals with K
+    channels give (n_bins, K) means and standard deviations.
+    """
+
+    mean: NDArray
+    std: NDArray
+    count: NDArray
+
+    @property
+    def n_bins(self) -> int:
+        """Return the number of phase bins."""
+        return len(self.count)
+
+    @property
+    def phase(self) -> NDArray:
+        """Return the centre phase of every bin."""
+        return (np.arange(self.n_bins) + 0.5) * TWO_PI / self.n_bins
+
+    def evaluate(self, phi: float | NDArray) -> NDArray:
+        """Interpolate the mean periodically between the bin centres.
+
+        Empty bins are skipped, so they are bridged by their filled neighbours.
+        """
+        filled = self.count > 0
+        if not filled.any():
+            raise ValueError("The template has no samples.")
+        phi = np.asarray(phi, dtype=float)
+        mean = self.mean.reshape(self.n_bins, -1)[filled]
+        result = np.stack(
+            [
+                np.interp(phi, self.phase[filled], channel, period=TWO_PI)
+                for channel in mean.T
+            ],
+            axis=-1,
+        )
+        return result if self.mean.ndim > 1 else result[..., 0]
+
+    def gait_shape(self, n_samples: int = GAIT_SHAPE_SAMPLES) -> NDArray:
+        """Return the mean on the phase grid of ``LowLevelController.gait_shape``.
+
+        The controller evaluates its spline at ``phi - π``, so the mean is
+        sampled half a cycle on, and its reference follows the template.
+        """
+        return self.evaluate(np.linspace(0.0, TWO_PI, n_samples) + np.pi)
+
+    def save(self, path: Path, **metadata: object) -> None:
+        """Write the template and JSON-serializable metadata to a ``.npz`` file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                mean=self.mean,
+                std=self.std,
+                count=self.count,
+                metadata=json.dumps(metadata),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> tuple["GaitTemplate", dict]:
+        """Read a template and its metadata from a ``.npz`` file."""
+        with np.load(path) as stored:
+            template = cls(
+                mean=stored["mean"], std=stored["std"], count=stored["count"]
+            )
+            return template, json.loads(str(stored["metadata"]))
+
+
+class TemplateAccumulator:
+    """Running per-bin sums of a signal over the gait phase.
+
+    Every ``update`` bins a block of samples in one vectorized pass with
+    ``np.bincount``, so memory stays constant however many samples are added.
+    """
+
+    def __init__(self, n_bins: int = GAIT_TEMPLATE_BINS, n_channels: int = 1) -> None:
+        """Initialize empty sums.
+
+        :param n_bins: Number of phase bins over [0, 2π).
+        :param n_channels: Number of signal channels.
+        """
+        if n_bins < 1:
+            raise ValueError(f"Number of bins must be positive, got {n_bins}.")
+        self.n_bins = n_bins
+        self.n_channels = n_channels
+        self.count = np.zeros(n_bins, dtype=np.int64)
+        self.total = np.zeros(n_bins * n_channels)
+        self.total_sq = np.zeros(n_bins * n_channels)
+        self._channel = np.arange(n_channels)
+
+    def update(self, phase: NDArray, values: NDArray) -> None:
+        """Add samples to the sums.
+
+        :param phase: Gait phases of shape (N,), wrapped to [0, 2π) here.
+        :param values: Signal of shape (N,) or (N, n_channels).
+        """
+        values = np.asarray(values, dtype=float).reshape(len(phase), self.n_channels)
+        bins = (np.mod(phase, TWO_PI) * (self.n_bins / TWO_PI)).astype(np.intp)
+        np.minimum(bins, self.n_bins - 1, out=bins)
+        self.count += np.bincount(bins, minlength=self.n_bins)
+        flat = (bins[:, np.newaxis] * self.n_channels + self._channel).ravel()
+        size = self.n_bins * self.n_channels
+        self.total += np.bincount(flat, weights=values.ravel(), minlength=size)
+        self.total_sq += np.bincount(flat, weights=values.ravel() ** 2, minlength=size)
+
+    def template(self) -> GaitTemplate:
+        """Return the per-bin mean and standard deviation, NaN for empty bins."""
+        count = self.count[:, np.newaxis]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.total.reshape(self.n_bins, -1) / count
+            variance = self.total_sq.reshape(self.n_bins, -1) / count - mean**2
+        std = np.sqrt(np.maximum(variance, 0.0))
+        if self.n_channels == 1:
+            mean, std = mean[:, 0], std[:, 0]
+        return GaitTemplate(mean=mean, std=std, count=self.count.copy())
+
+
+def phase_template(
+    phase: NDArray, values: NDArray, n_bins: int = GAIT_TEMPLATE_BINS
+) -> GaitTemplate:
+    """Average a signal over the gait cycle by binning it on the phase.
+
+    :param phase: Gait phase per sample, e.g. ``GaitPhaseTrajectory.phi``.
+    :param values: Signal of shape (N,) or (N, K), e.g. a joint's angles.
+    :param n_bins: Number of phase bins over [0, 2π).
+    """
+    values = np.asarray(values)
+    accumulator = TemplateAccumulator(
+        n_bins, 1 if values.ndim == 1 else values.shape[1]
+    )
+    accumulator.update(phase, values)
+    template = accumulator.template()
+    if values.ndim > 1 and values.shape[1] == 1:
+        return GaitTemplate(
+            template.mean[:, np.newaxis], template.std[:, np.newaxis], template.count
+        )
+    return template
+
+
+def learn_template(  # noqa: PLR0913
+    filepath: str | Path,
+    column: str,
+    *,
+    phase_column: str = AnglesHeader.HIP_X,
+    params: AOParameters | None = None,
+    n_bins: int = GAIT_TEMPLATE_BINS,
+    chunk_size: int = TEMPLATE_CHUNK_SIZE,
+    warm_start: float | None = WARM_START_WINDOW,
+) -> GaitTemplate:
+    """Learn the cycle template of a joint angle from an Angles log in one pass.
+
+    The log is streamed in chunks through the gait phase estimator, driven by
+    ``phase_column`` as in ``AOController.replay``, and every chunk is binned on
+    the corrected phase. Memory is bounded by the chunk size, so multi-hour
+    recordings work as well as short ones.
+
+    :param filepath: Angles log file, plain or compressed.
+    :param column: Angles column to learn the template of.
+    :param phase_column: Angles column the phase is estimated from.
+    :param params: Estimator parameters, the defaults if None.
+    :param n_bins: Number of phase bins.
+    :param chunk_size: Samples per streamed chunk.
+    :param warm_start: Seed the oscillator from a fit of this many seconds at the
+        start of the log, or start it cold if None. The fit window must fit in
+        the first chunk.
+    :return: Template of the angle in radians.
+    """
+    estimator = GaitPhaseEstimator(params if params is not None else AOParameters())
+    accumulator = TemplateAccumulator(n_bins)
+    columns = list(dict.fromkeys([phase_column, column]))
+    derivative = BackwardDifference()
+    start_time = None
+    for chunk in follow_log_file(
+        filepath, columns, chunk_size=chunk_size, idle_timeout=0.0
+    ):
+        first_chunk = start_time is None
+        if start_time is None:
+            start_time = chunk.time[0]
+        t = chunk.time - start_time
+        theta = np.deg2rad(chunk[phase_column])
+        if first_chunk and warm_start is not None:
+            window = t <= warm_start
+            estimator.ao.warm_start(t[window], theta[window])
+        trajectory = estimator.run(t, theta, derivative(t, theta))
+        accumulator.update(trajectory.phi, np.deg2rad(chunk[column]))
+    logger.debug(f"Learned {column} template from {accumulator.count.sum()} samples")
+    return accumulator.template()
+
+
+class TemplateCache:
+    """Learned templates on disk, one file per subject and joint.
+
+    A template is stored with the size and modification time of its log and the
+    settings it was learned with, and learned again once any of them changes.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """Initialize the cache.
+
+        :param cache_dir: Directory for all templates, or None to keep them in
+            the cache directory next to every log file.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def path_for(self, filepath: Path, subject: str, joint: str) -> Path:
+        """Return the file of a subject's joint template."""
+        cache_dir = (
+            self.cache_dir
+            if self.cache_dir is not None
+            else filepath.parent / LOG_CACHE_DIR
+        )
+        return cache_dir / "templates" / subject / f"{joint}.npz"
+
+    def load(  # noqa: PLR0913
+        self,
+        filepath: str | Path,
+        column: str,
+        *,
+        subject: str | None = None,
+        joint: str | None = None,
+        params: AOParameters | None = None,
+        n_bins: int = GAIT_TEMPLATE_BINS,
+        warm_start: float | None = WARM_START_WINDOW,
+    ) -> GaitTemplate:
+        """Return a joint template, learning it with ``learn_template`` if needed.
+
+        :param filepath: Angles log file of the subject.
+        :param column: Angles column of the joint.
+        :param subject: Subject name, the log directory's name if None.
+        :param joint: Joint name, the column if None.
+        :param params: Estimator parameters, the defaults if None.
+        :param n_bins: Number of phase bins.
+        :param warm_start: Warm-start window, see ``learn_template``.
+        """
+        filepath = Path(filepath)
+        params = params if params is not None else AOParameters()
+        path = self.path_for(
+            filepath,
+            subject if subject is not None else filepath.parent.name,
+            joint if joint is not None else column,
+        )
+        stat = filepath.stat()
+        metadata = {
+            "source": str(filepath.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "column": column,
+            "n_bins": n_bins,
+            "warm_start": warm_start,
+            "params": hashlib.sha256(
+                json.dumps(asdict(params), sort_keys=True).encode()
+            ).hexdigest(),
+        }
+        if path.is_file():
+            template, stored = GaitTemplate.load(path)
+            if stored == metadata:
+                return template
+
+        logger.debug(f"Learning {column} template of {filepath}")
+        template = learn_template(
+            filepath, column, params=params, n_bins=n_bins, warm_start=warm_start
+        )
+        template.save(path, **metadata)
+        return template
@@ -0,0 +1,154 @@
+"""Persistent binary cache of parsed sensor log files."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from numpy.typing import DTypeLike
+
+from adaptive_oscillator.definitions import LOG_CACHE_DIR, LOG_CACHE_MAX_BYTES
+from adaptive_oscillator.utils.reader_utils import LogTable, read_log_file
+
+_TIME_FILE = "time.npy"
+_VALUES_FILE = "values.npy"
+_COLUMNS_FILE = "columns.json"
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+class LogCache:
+    """Cache parsed log files as memory-mappable ``.npy`` arrays.
+
+    Every log file gets one entry directory holding its time and value arrays.
+    The entry name is derived from the file's path, size and modification time,
+    and optionally from a hash of its content, so a changed log misses the cache
+    and its stale entry is removed. Later loads memory-map the arrays instead of
+    parsing text. The least recently used entries are evicted once the cache
+    directory grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int | None = LOG_CACHE_MAX_BYTES,
+        content_hash: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        :param cache_dir: Directory for all entries, or None to keep a cache
+            directory next to every log file.
+        :param max_bytes: Size bound of a cache directory, or None for no bound.
+        :param content_hash: Also key entries on a SHA-256 of the file content.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+
+    def directory_for(self, filepath: Path) -> Path:
+        """Return the cache directory used for a log file."""
+        return (
+            self.cache_dir
+            if self.cache_dir is not None
+            else filepath.parent / LOG_CACHE_DIR
+        )
+
+    def entry_for(self, filepath: str | Path, dtype: DTypeLike = np.float64) -> Path:
+        """Return the entry directory that holds the current version of a log file."""
+        filepath = Path(filepath).resolve()
+        stat = filepath.stat()
+        key = hashlib.sha256(
+            f"{stat.st_size}|{stat.st_mtime_ns}|{np.dtype(dtype).str}".encode()
+        )
+        if self.content_hash:
+            with open(filepath, "rb") as file:
+                for chunk in iter(lambda: file.read(_HASH_CHUNK_BYTES), b""):
+                    key.update(chunk)
+        entry_name = f"{_entry_prefix(filepath, dtype)}-{key.hexdigest()[:16]}"
+        return self.directory_for(filepath) / entry_name
+
+    def load(self, filepath: str | Path, dtype: DTypeLike = np.float64) -> LogTable:
+        """Return a log file's table, memory-mapped from the cache when possible."""
+        entry = self.entry_for(filepath, dtype)
+        if entry.is_dir():
+            logger.debug(f"Loading {filepath} from cache {entry}")
+            os.utime(entry)
+            return _read_entry(entry)
+
+        table = read_log_file(filepath, dtype=dtype)
+        self._write_entry(entry, table)
+        self._remove_stale(entry)
+        self.evict(entry.parent, keep=entry)
+        return _read_entry(entry)
+
+    def evict(self, cache_dir: Path, keep: Path | None = None) -> None:
+        """Remove the least recently used entries until the size bound holds."""
+        if self.max_bytes is None or not cache_dir.is_dir():
+            return
+        entries = sorted(
+            (
+                path
+                for path in cache_dir.iterdir()
+                if path.is_dir() and not path.name.startswith(".")
+            ),
+            key=lambda path: path.stat().st_mtime,
+        )
+        sizes = {entry: _entry_size(entry) for entry in entries}
+        total = sum(sizes.values())
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            logger.debug(f"Evicting cache entry {entry}")
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+
+    def clear(self, cache_dir: Path | None = None) -> None:
+        """Remove every entry of a cache directory."""
+        cache_dir = cache_dir if cache_dir is not None else self.cache_dir
+        if cache_dir is not None and cache_dir.is_dir():
+            shutil.rmtree(cache_dir)
+
+    def _write_entry(self, entry: Path, table: LogTable) -> None:
+        # Write into a temporary directory first, so readers never see half an entry.
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+        try:
+            np.save(tmp_dir / _TIME_FILE, table.time)
+            np.save(tmp_dir / _VALUES_FILE, table.values)
+            (tmp_dir / _COLUMNS_FILE).write_text(json.dumps(list(table.columns)))
+            tmp_dir.rename(entry)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not entry.is_dir():
+                raise
+        logger.debug(f"Cached {table.shape} table in {entry}")
+
+    def _remove_stale(self, entry: Path) -> None:
+        # Older versions of the same file and dtype; other dtypes stay cached.
+        prefix = entry.name.rsplit("-", 1)[0]
+        for path in entry.parent.glob(f"{prefix}-*"):
+            if path != entry:
+                logger.debug(f"Removing stale cache entry {path}")
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _entry_prefix(filepath: Path, dtype: DTypeLike) -> str:
+    path_hash = hashlib.sha256(str(filepath).encode()).hexdigest()[:8]
+    return f"{filepath.name}-{path_hash}-{np.dtype(dtype).name}"
+
+
+def _read_entry(entry: Path) -> LogTable:
+    return LogTable(
+        time=np.load(entry / _TIME_FILE, mmap_mode="r"),
+        columns=tuple(json.loads((entry / _COLUMNS_FILE).read_text())),
+        values=np.load(entry / _VALUES_FILE, mmap_mode="r"),
+    )
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(path.stat().st_size for path in entry.iterdir())
@@ -0,0 +1,178 @@
+"""Transparent reading and conversion of compressed sensor logs."""
+
+import argparse
+import bz2
+import gzip
+import importlib.util
+import lzma
+import shutil
+from pathlib import Path
+from typing import IO, cast
+
+from loguru import logger
+
+from adaptive_oscillator.definitions import LOG_FILE_EXT
+
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz", ".zst")
+_COPY_BYTES = 1 << 20
+
+
+def zstd_available() -> bool:
+    """Return whether the optional ``zstandard`` package is installed."""
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def available_codecs() -> list[str]:
+    """Return the compression suffixes that can be read and written."""
+    return [
+        suffix
+        for suffix in COMPRESSION_SUFFIXES
+        if suffix != ".zst" or zstd_available()
+    ]
+
+
+def compression_of(filepath: str | Path) -> str:
+    """Return the compression suffix of a log file, or "" for plain text."""
+    suffix = Path(filepath).suffix
+    return suffix if suffix in COMPRESSION_SUFFIXES else ""
+
+
+def find_log_file(filepath: Path) -> Path:
+    """Return the plain or compressed variant of a log file that exists.
+
+    :param filepath: Path of the plain text log, e.g. ``Angles_left.txt``.
+    :return: The plain file if it exists, else the first existing compressed
+        variant in ``COMPRESSION_SUFFIXES`` order, else ``filepath``.
+    """
+    if filepath.exists():
+        return filepath
+    for suffix in COMPRESSION_SUFFIXES:
+        candidate = filepath.with_name(filepath.name + suffix)
+        if candidate.exists():
+            return candidate
+    return filepath
+
+
+def open_log(
+    filepath: str | Path, mode: str = "rb", level: int | None = None
+) -> IO[bytes]:
+    """Open a plain or compressed log file as a binary stream.
+
+    Compressed files are decompressed on the fly while reading, so they are never
+    inflated to disk or fully into memory.
+
+    :param filepath: Log file, compressed if its suffix is in
+        ``COMPRESSION_SUFFIXES``.
+    :param mode: "rb" to read or "wb" to write.
+    :param level: Compression level when writing, or the codec's default.
+    :return: Binary file object.
+    :raises ImportError: If a ``.zst`` file is opened without ``zstandard``.
+    """
+    filepath = Path(filepath)
+    codec = compression_of(filepath)
+    if codec == ".gz":
+        gzip_file = gzip.GzipFile(
+            filepath, mode, compresslevel=9 if level is None else level
+        )
+        return cast(IO[bytes], gzip_file)
+    if codec == ".bz2":
+        return bz2.BZ2File(filepath, mode, compresslevel=9 if level is None else level)
+    if codec == ".xz":
+        return lzma.LZMAFile(filepath, mode, preset=level)
+    if codec == ".zst":
+        return _open_zstd(filepath, mode, level)
+    return open(filepath, mode)
+
+
+def _open_zstd(filepath: Path, mode: str, level: int | None) -> IO[bytes]:
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "Reading and writing .zst logs requires the 'zstandard' package."
+        ) from error
+    if "w" in mode:
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return zstandard.open(filepath, mode, cctx=compressor)
+    return zstandard.open(filepath, mode)
+
+
+def convert_log_dir(
+    log_dir: str | Path,
+    codec: str = ".xz",
+    output_dir: str | Path | None = None,
+    level: int | None = None,
+    remove_source: bool = False,
+) -> list[Path]:
+    """Recompress every log file of a directory.
+
+    Files are streamed from the source to the target codec in fixed-size blocks.
+
+    :param log_dir: Directory with plain or compressed log files.
+    :param codec: Target suffix out of ``COMPRESSION_SUFFIXES``, or "" to write
+        plain text.
+    :param output_dir: Directory to write to, or None for ``log_dir``.
+    :param level: Compression level, or the codec's default.
+    :param remove_source: Delete every source file after converting it.
+    :return: The written files.
+    :raises ValueError: If the codec is unknown.
+    """
+    if codec and codec not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown codec '{codec}', expected {COMPRESSION_SUFFIXES}.")
+    log_dir = Path(log_dir)
+    output_dir = Path(output_dir) if output_dir is not None else log_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for source in sorted(log_dir.glob(f"*{LOG_FILE_EXT}*")):
+        plain_name = source.name.removesuffix(compression_of(source))
+        if not plain_name.endswith(LOG_FILE_EXT):
+            continue
+        target = output_dir / f"{plain_name}{codec}"
+        if target == source:
+            continue
+        with open_log(source) as reader, open_log(target, "wb", level) as writer:
+            shutil.copyfileobj(reader, writer, _COPY_BYTES)
+        logger.debug(
+            f"Converted {source} ({source.stat().st_size} B) "
+            f"to {target} ({target.stat().st_size} B)"
+        )
+        if remove_source:
+            source.unlink()
+        written.append(target)
+    return written
+
+
+def main() -> None:
+    """Recompress a log directory from the command line."""
+    parser = argparse.ArgumentParser(description="Recompress a log directory.")
+    parser.add_argument(
+        "-l", "--log-dir", required=True, help="Path to the log directory."
+    )
+    parser.add_argument(
+        "-c",
+        "--codec",
+        default=".xz",
+        choices=[*COMPRESSION_SUFFIXES, ""],
+        help="Target compression suffix, or '' for plain text.",
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default=None, help="Directory to write to."
+    )
+    parser.add_argument("--level", type=int, default=None, help="Compression level.")
+    parser.add_argument(
+        "--remove-source", action="store_true", help="Delete the source files."
+    )
+    args = parser.parse_args()
+    written = convert_log_dir(
+        args.log_dir,
+        codec=args.codec,
+        output_dir=args.output_dir,
+        level=args.level,
+        remove_source=args.remove_source,
+    )
+    logger.success(f"Wrote {len(written)} log files.")
+
+
+if __name__ == "__main__":
+    main()
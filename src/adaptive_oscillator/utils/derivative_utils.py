@@ -0,0 +1,47 @@
+"""Time derivatives of sampled signals, in one pass or chunk by chunk."""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def backward_difference(
+    t: NDArray, x: NDArray, previous: tuple[float, float] | None = None
+) -> NDArray:
+    """Return the backward-difference derivative of a signal at every sample.
+
+    Every sample gets the slope from the sample before it. The first sample gets
+    the slope from ``previous``, or that of the first interval if there is none.
+    Repeated timestamps get a slope of zero.
+
+    :param t: Sample times of shape (N,).
+    :param x: Signal of shape (N,).
+    :param previous: Time and value of the sample before ``t[0]``, if any.
+    """
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+    if previous is not None:
+        t = np.concatenate([[previous[0]], t])
+        x = np.concatenate([[previous[1]], x])
+    dt = np.diff(t)
+    slope = np.divide(np.diff(x), dt, out=np.zeros(len(dt)), where=dt > 0)
+    if previous is None and len(t):
+        slope = np.concatenate([slope[:1] if len(slope) else [0.0], slope])
+    return slope
+
+
+class BackwardDifference:
+    """Backward-difference derivative of a signal that arrives in chunks.
+
+    The last sample of every chunk is kept for the next one, so the chunks give
+    the same slopes as ``backward_difference`` of the whole signal.
+    """
+
+    def __init__(self) -> None:
+        self._previous: tuple[float, float] | None = None
+
+    def __call__(self, t: NDArray, x: NDArray) -> NDArray:
+        """Return the slopes of the next chunk of samples."""
+        slope = backward_difference(t, x, self._previous)
+        if len(slope):
+            self._previous = (float(t[-1]), float(x[-1]))
+        return slope
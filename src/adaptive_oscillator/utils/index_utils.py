@@ -0,0 +1,234 @@
+"""Sidecar time index for seeking into long sensor logs."""
+
+import hashlib
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from numpy.typing import DTypeLike, NDArray
+
+from adaptive_oscillator.definitions import LOG_CACHE_DIR, LOG_INDEX_STRIDE
+from adaptive_oscillator.utils.compression_utils import open_log
+from adaptive_oscillator.utils.reader_utils import LogTable, read_header, read_log_body
+from adaptive_oscillator.utils.time_utils import SECONDS_PER_DAY, time_strs_to_seconds
+
+_INDEX_SUFFIX = ".index.npz"
+_READ_BYTES = 1 << 20
+_TIME_BYTES = 32
+_NEWLINE = ord("\n")
+
+
+@dataclass
+class LogIndex:
+    """Timestamps and byte offsets of every ``stride``-th sample line of a log.
+
+    ``size`` and ``mtime_ns`` identify the version of the file the index was
+    built from, so an index of a file that has changed since is not used.
+    """
+
+    times: NDArray
+    offsets: NDArray
+    stride: int
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def build(cls, filepath: str | Path, stride: int = LOG_INDEX_STRIDE) -> "LogIndex":
+        """Index a log file in one streaming pass over its bytes.
+
+        Only line breaks are searched and only the indexed timestamps are parsed,
+        so building is much cheaper than reading the file.
+
+        :param filepath: Log file to index.
+        :param stride: Number of sample lines between index entries.
+        :return: Index with one entry per ``stride`` lines, from the first sample.
+        """
+        if stride < 1:
+            raise ValueError(f"Index stride must be positive, got {stride}.")
+        stat = Path(filepath).stat()
+        offsets = []
+        n_lines = -1  # the header is not a sample line
+        position = 0
+        with open_log(filepath) as file:
+            while block := file.read(_READ_BYTES):
+                breaks = np.flatnonzero(
+                    np.frombuffer(block, dtype=np.uint8) == _NEWLINE
+                )
+                line_numbers = n_lines + 1 + np.arange(len(breaks))
+                picked = line_numbers % stride == 0
+                offsets.append(breaks[picked] + position + 1)
+                n_lines += len(breaks)
+                position += len(block)
+
+            all_offsets = np.concatenate(offsets) if offsets else np.zeros(0, int)
+            all_offsets = all_offsets[all_offsets < position].astype(np.int64)
+            time_strs = []
+            for offset in all_offsets.tolist():
+                file.seek(offset)
+                time_strs.append(file.read(_TIME_BYTES).split(b"\t", 1)[0])
+
+        return cls(
+            times=time_strs_to_seconds(np.array(time_strs, dtype=np.bytes_)),
+            offsets=all_offsets,
+            stride=stride,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        filepath: str | Path,
+        stride: int = LOG_INDEX_STRIDE,
+        index_dir: str | Path | None = None,
+    ) -> "LogIndex":
+        """Return the sidecar index of a log file, building it when missing or stale.
+
+        A built index that cannot be written, e.g. next to a log in a read-only
+        archive, is used without being kept.
+
+        :param filepath: Log file to index.
+        :param stride: Number of sample lines between index entries.
+        :param index_dir: Directory for the sidecar, e.g. a ``LogCache`` root, or
+            None for the cache directory next to the log.
+        """
+        filepath = Path(filepath)
+        sidecar = index_path_for(filepath, index_dir)
+        stat = filepath.stat()
+        if sidecar.is_file():
+            with np.load(sidecar) as stored:
+                index = cls(
+                    times=stored["times"],
+                    offsets=stored["offsets"],
+                    stride=int(stored["stride"]),
+                    size=int(stored["size"]),
+                    mtime_ns=int(stored["mtime_ns"]),
+                )
+            if (index.size, index.mtime_ns, index.stride) == (
+                stat.st_size,
+                stat.st_mtime_ns,
+                stride,
+            ):
+                return index
+
+        logger.debug(f"Building time index of {filepath}")
+        index = cls.build(filepath, stride)
+        try:
+            index.save(sidecar)
+        except OSError as error:
+            logger.debug(f"Not keeping the time index of {filepath}: {error}")
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of index entries."""
+        return len(self.offsets)
+
+    def save(self, path: Path) -> None:
+        """Write the index to a ``.npz`` file.
+
+        The index is written to a temporary file first and moved into place, so
+        readers never see half an index, even with concurrent writers.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(
+                    file,
+                    times=self.times,
+                    offsets=self.offsets,
+                    stride=self.stride,
+                    size=self.size,
+                    mtime_ns=self.mtime_ns,
+                )
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def byte_range(
+        self, start: float | None, end: float | None
+    ) -> tuple[int, int | None]:
+        """Return the byte range of the file that holds a time window.
+
+        Offsets count decompressed bytes, so they also apply to compressed logs.
+
+        :param start: Absolute start time, or None for the first sample.
+        :param end: Absolute end time, or None for the last sample.
+        :return: Offset of the first line to read and the offset to stop at, or
+            None to read to the end of the file.
+        """
+        if len(self.offsets) == 0:
+            return 0, 0
+        first = 0
+        if start is not None:
+            first = max(int(np.searchsorted(self.times, start, side="right")) - 1, 0)
+        stop = None
+        if end is not None:
+            after = int(np.searchsorted(self.times, end, side="right"))
+            if after < len(self.offsets):
+                stop = int(self.offsets[after])
+        return int(self.offsets[first]), stop
+
+
+def index_path_for(filepath: Path, index_dir: str | Path | None = None) -> Path:
+    """Return the sidecar index path of a log file.
+
+    :param filepath: Log file.
+    :param index_dir: Directory shared by the indexes of many logs, where they
+        are told apart by a hash of their path, or None for the cache directory
+        next to the log.
+    """
+    if index_dir is None:
+        return filepath.parent / LOG_CACHE_DIR / f"{filepath.name}{_INDEX_SUFFIX}"
+    path_hash = hashlib.sha256(str(filepath.resolve()).encode()).hexdigest()[:8]
+    return Path(index_dir) / f"{filepath.name}-{path_hash}{_INDEX_SUFFIX}"
+
+
+def read_log_window(
+    filepath: str | Path,
+    start: float | None = None,
+    end: float | None = None,
+    dtype: DTypeLike = np.float64,
+    index_dir: str | Path | None = None,
+) -> LogTable:
+    """Read only the samples of a log file within a time window.
+
+    The sidecar index is used to seek close to the window, so only about the
+    window plus one index stride is parsed.
+
+    :param filepath: Log file to read.
+    :param start: Start in seconds since the first sample, or None.
+    :param end: End in seconds since the first sample, or None.
+    :param dtype: Floating point type of the sensor values.
+    :param index_dir: Directory for the sidecar index, see ``LogIndex.load``.
+    :return: Samples with ``start <= t - t_first <= end``.
+    """
+    filepath = Path(filepath)
+    index = LogIndex.load(filepath, index_dir=index_dir)
+    names = read_header(filepath)
+    first_time = index.times[0] if len(index.times) else 0.0
+    abs_start = None if start is None else first_time + start
+    abs_end = None if end is None else first_time + end
+    begin, stop = index.byte_range(abs_start, abs_end)
+    if stop is not None and stop <= begin:
+        return LogTable(
+            time=np.array([]),
+            columns=tuple(names[1:]),
+            values=np.empty((0, len(names) - 1), dtype=dtype),
+        )
+
+    with open_log(filepath) as file:
+        file.seek(begin)
+        data = file.read(-1 if stop is None else stop - begin)
+    table = read_log_body(io.BytesIO(data), names, dtype=dtype)
+    if len(table):
+        # Align the slice with the index times, which continue past midnight.
+        entry_time = index.times[np.searchsorted(index.offsets, begin)]
+        days = np.round((entry_time - table.time[0]) / SECONDS_PER_DAY)
+        table.time += days * SECONDS_PER_DAY
+    return table.between(abs_start, abs_end)
@@ -0,0 +1,206 @@
+"""Uniformly sampled lookup tables of functions of the gait phase."""
+
+import hashlib
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import (
+    PHASE_TABLE_CACHE_SIZE,
+    PHASE_TABLE_METHOD,
+    PHASE_TABLE_SIZE,
+)
+
+TWO_PI = 2 * np.pi
+TABLE_METHODS = ("linear", "hermite")
+_ERROR_SUBSAMPLES = 8
+
+
+class PhaseTable:
+    """Values and slopes of functions of the phase, sampled uniformly on [0, 2π].
+
+    A lookup finds the table cell of a phase by one multiplication and evaluates
+    the cell's interpolating polynomial, either linear or the cubic Hermite
+    polynomial through the sampled values and slopes. Phases are wrapped to
+    [0, 2π) first. All arrays are read-only, so one table can be shared by any
+    number of controllers.
+
+    Tables of shape (J, size + 1) hold J functions that are looked up together.
+    """
+
+    def __init__(self, values: NDArray, slopes: NDArray, method: str) -> None:
+        """Initialize the table.
+
+        :param values: Function values at ``size + 1`` uniform phases from 0 to
+            2π, along the last axis.
+        :param slopes: Derivatives with respect to the phase at the same phases.
+        :param method: "linear" or "hermite".
+        :raises ValueError: If the method is unknown or the shapes do not match.
+        """
+        if method not in TABLE_METHODS:
+            raise ValueError(f"Unknown method '{method}', expected {TABLE_METHODS}.")
+        if values.shape != slopes.shape or values.shape[-1] < 2:
+            raise ValueError("Values and slopes need the same shape of 2+ samples.")
+        self.method = method
+        self.size = values.shape[-1] - 1
+        self.step = TWO_PI / self.size
+        self.max_error = 0.0
+        self.values = _read_only(np.array(values, dtype=float))
+        self.slopes = _read_only(np.array(slopes, dtype=float))
+        self.coeffs = _read_only(self._cell_polynomials())
+        # Coefficients per cell as plain floats for scalar lookups, of shape
+        # (size, 4) for one function and (size, J, 4) for a stack.
+        self._cells = (
+            np.moveaxis(self.coeffs, -2, 0).tolist()
+            if self.coeffs.ndim in (2, 3)
+            else None
+        )
+
+    @classmethod
+    def sample(
+        cls,
+        func: Callable[[NDArray], NDArray],
+        derivative: Callable[[NDArray], NDArray],
+        size: int = PHASE_TABLE_SIZE,
+        method: str = PHASE_TABLE_METHOD,
+    ) -> "PhaseTable":
+        """Tabulate a function and record the largest lookup error against it.
+
+        :param func: Function of an (N,) phase array, returning (N,) or (J, N).
+        :param derivative: Its derivative with respect to the phase.
+        :param size: Number of table cells.
+        :param method: "linear" or "hermite".
+        :return: Table whose ``max_error`` is the largest deviation from ``func``
+            at the samples and ``_ERROR_SUBSAMPLES`` points within every cell.
+        """
+        if size < 1:
+            raise ValueError(f"Table size must be positive, got {size}.")
+        phases = np.linspace(0.0, TWO_PI, size + 1)
+        table = cls(func(phases), derivative(phases), method)
+        check = np.linspace(0.0, TWO_PI, size * _ERROR_SUBSAMPLES, endpoint=False)
+        table.max_error = float(np.max(np.abs(table(check) - func(check))))
+        return table
+
+    def __call__(self, phi: float | NDArray) -> Any:
+        """Return the interpolated function values at one or many phases.
+
+        A NaN or infinite scalar phase gives NaN, as the array path does.
+
+        :return: A float for a scalar phase and a one-function table, else an
+            array of shape ``(J,) + np.shape(phi)`` or ``np.shape(phi)``.
+        """
+        if self._cells is not None and isinstance(phi, float | int):
+            # NumPy call overhead dominates a single lookup, so avoid it.
+            if not math.isfinite(phi):
+                return (
+                    math.nan
+                    if self.coeffs.ndim == 2
+                    else np.full(len(self.coeffs), np.nan)
+                )
+            position = (phi % math.tau) / self.step
+            index = min(int(position), self.size - 1)
+            frac = position - index
+            if self.coeffs.ndim == 3:
+                return np.array(
+                    [
+                        c0 + frac * (c1 + frac * (c2 + frac * c3))
+                        for c0, c1, c2, c3 in self._cells[index]
+                    ]
+                )
+            c0, c1, c2, c3 = self._cells[index]
+            return c0 + frac * (c1 + frac * (c2 + frac * c3))
+        cells, frac = self._locate(phi)
+        result = cells[..., 3] * frac
+        result += cells[..., 2]
+        result *= frac
+        result += cells[..., 1]
+        result *= frac
+        result += cells[..., 0]
+        return result
+
+    def derivative(self, phi: float | NDArray) -> NDArray:
+        """Return the derivative of the interpolant with respect to the phase."""
+        cells, frac = self._locate(phi)
+        result = 3 * cells[..., 3] * frac
+        result += 2 * cells[..., 2]
+        result *= frac
+        result += cells[..., 1]
+        result /= self.step
+        return result
+
+    def _locate(self, phi: float | NDArray) -> tuple[NDArray, NDArray]:
+        position = np.asarray(phi, dtype=float) / self.step
+        cell = np.floor(position)
+        frac = position - cell
+        index = cell.astype(np.intp)
+        index %= self.size
+        return self.coeffs.take(index, axis=-2), frac
+
+    def _cell_polynomials(self) -> NDArray:
+        """Return the power-basis coefficients of every cell, in the cell fraction.
+
+        :return: Array of shape (..., size, 4) with the constant term first.
+        """
+        start, end = self.values[..., :-1], self.values[..., 1:]
+        coeffs = np.zeros((*start.shape, 4))
+        coeffs[..., 0] = start
+        if self.method == "linear":
+            coeffs[..., 1] = end - start
+            return coeffs
+        slope_start = self.step * self.slopes[..., :-1]
+        slope_end = self.step * self.slopes[..., 1:]
+        coeffs[..., 1] = slope_start
+        coeffs[..., 2] = 3 * (end - start) - 2 * slope_start - slope_end
+        coeffs[..., 3] = 2 * (start - end) + slope_start + slope_end
+        return coeffs
+
+
+def _read_only(array: NDArray) -> NDArray:
+    array.flags.writeable = False
+    return array
+
+
+# Tables recently built in this process, keyed on the shape content, size and
+# method, from least to most recently used.
+_TABLES: OrderedDict[tuple[str, int, str], PhaseTable] = OrderedDict()
+
+
+def shape_key(shape: NDArray | None) -> str:
+    """Return a digest of a gait shape's samples, or "sine" for the default."""
+    if shape is None:
+        return "sine"
+    shape = np.ascontiguousarray(shape, dtype=float)
+    digest = hashlib.sha256(str(shape.shape).encode())
+    digest.update(shape.tobytes())
+    return digest.hexdigest()
+
+
+def cached_table(
+    key: str,
+    build: Callable[[], PhaseTable],
+    size: int = PHASE_TABLE_SIZE,
+    method: str = PHASE_TABLE_METHOD,
+) -> PhaseTable:
+    """Return the table stored under a key, building it on the first request.
+
+    Only the ``PHASE_TABLE_CACHE_SIZE`` most recently used tables are kept, so
+    e.g. a sweep over many gait shapes does not accumulate them. Controllers
+    keep their own reference, so dropping a table never affects them.
+
+    :param key: Content key of the tabulated function, e.g. from ``shape_key``.
+    :param build: Builds the table of the given size and method.
+    :param size: Number of table cells, part of the key.
+    :param method: Interpolation method, part of the key.
+    """
+    cache_key = (key, size, method)
+    if cache_key in _TABLES:
+        _TABLES.move_to_end(cache_key)
+        return _TABLES[cache_key]
+    table = _TABLES[cache_key] = build()
+    while len(_TABLES) > PHASE_TABLE_CACHE_SIZE:
+        _TABLES.popitem(last=False)
+    return table
@@ -1,11 +1,15 @@
 """Parser utils for log file data."""
 
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 from loguru import logger
 from matplotlib import pyplot as plt
+from numpy.typing import DTypeLike, NDArray
 
 from adaptive_oscillator.base_classes import (
     AngleXYZ,
@@ -22,12 +26,15 @@ from adaptive_oscillator.definitions import (
     ANGLES_SEGMENT_FIELDS,
     FIG_SIZE,
     IMU_SEGMENT_FIELDS,
+    JOINT_EULER_SEQUENCE,
+    JOINT_SEGMENTS,
     QUATERNION_SEGMENT_FIELDS,
-    AnglesHeader,
     LogFileKeys,
-    QuaternionHeader,
 )
-from adaptive_oscillator.utils.time_utils import time_str_to_seconds
+from adaptive_oscillator.utils.cache_utils import LogCache
+from adaptive_oscillator.utils.index_utils import read_log_window
+from adaptive_oscillator.utils.reader_utils import LogTable, read_log_file
+from adaptive_oscillator.utils.resample_utils import ResampleTable, align_time_bases
 
 
 class LogFiles:
@@ -57,39 +64,68 @@ class LogFiles:
             f"\n\t{self.quat.right})"
         )
 
-    def plot(self):
-        """Plot log files."""
-        logger.info("Plotting data.")
-        accel_data = IMUParser(self.accel.right)
-        accel_data.parse()
-        accel_data.plot()
-
-        gyro_data = IMUParser(self.gyro.right)
-        gyro_data.parse()
-        gyro_data.plot()
-
-        quat_data = QuaternionParser(self.quat.right)
-        quat_data.parse()
-        quat_data.plot()
-
-        accel_data = IMUParser(self.accel.left)
-        accel_data.parse()
-        accel_data.plot()
-
-        gyro_data = IMUParser(self.gyro.left)
-        gyro_data.parse()
-        gyro_data.plot()
+    def plot(self, log_parser: "LogParser | None" = None):
+        """Plot log files.
 
-        quat_data = QuaternionParser(self.quat.left)
-        quat_data.parse()
-        quat_data.plot()
+        :param log_parser: Parsed log data to plot from instead of re-reading the
+            files. Files it did not parse are still read here.
+        """
+        logger.info("Plotting data.")
+        for side in ("right", "left"):
+            for category in (LogFileKeys.ACCEL, LogFileKeys.GYRO, LogFileKeys.QUAT):
+                parser = (
+                    log_parser.parsers.get((category, side)) if log_parser else None
+                )
+                if parser is None:
+                    attribute, parser_type = _PARSER_TYPES[category]
+                    parser = parser_type(getattr(getattr(self, attribute), side))
+                    parser.parse()
+                assert isinstance(parser, IMUParser | QuaternionParser)
+                parser.plot()
+
+
+def _read_table(  # noqa: PLR0913
+    filepath: Path,
+    dtype: DTypeLike,
+    cache: LogCache | None,
+    start: float | None = None,
+    end: float | None = None,
+    *,
+    index_dir: str | Path | None = None,
+) -> LogTable:
+    if start is None and end is None:
+        if cache is not None:
+            return cache.load(filepath, dtype=dtype)
+        return read_log_file(filepath, dtype=dtype)
+    if cache is not None:
+        table = cache.load(filepath, dtype=dtype)
+        first_time = table.time[0] if len(table) else 0.0
+        return table.between(
+            None if start is None else first_time + start,
+            None if end is None else first_time + end,
+        )
+    return read_log_window(filepath, start, end, dtype=dtype, index_dir=index_dir)
 
 
 class IMUParser:
     """Parser for log files with limb information."""
 
-    def __init__(self, filepath: Path):
+    def __init__(  # noqa: PLR0913
+        self,
+        filepath: Path,
+        dtype: DTypeLike = np.float64,
+        cache: LogCache | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        *,
+        index_dir: str | Path | None = None,
+    ):
         self.filepath = filepath
+        self.dtype = dtype
+        self.cache = cache
+        self.start = start
+        self.end = end
+        self.index_dir = index_dir
         self.time = np.array([])
         self.pelvis = VectorXYZ()
         self.upper_leg = VectorXYZ()
@@ -98,18 +134,28 @@ class IMUParser:
 
     def parse(self):
         """Parse the log file and return a DataFrame."""
-        raw_data = pd.read_csv(self.filepath, sep="\t+", engine="python")
+        raw_data = _read_table(
+            self.filepath,
+            self.dtype,
+            self.cache,
+            self.start,
+            self.end,
+            index_dir=self.index_dir,
+        )
         logger.debug(f"Parsing {self.filepath}")
         logger.debug(f"Columns: {raw_data.shape}")
 
-        time_str = raw_data[AnglesHeader.TIME]
-        self.time = np.array([time_str_to_seconds(t) for t in time_str])
+        self.time = raw_data.time
 
         for segment_name, fields in IMU_SEGMENT_FIELDS.items():
-            x = raw_data[fields[0]].to_numpy()
-            y = raw_data[fields[1]].to_numpy()
-            z = raw_data[fields[2]].to_numpy()
-            setattr(self, segment_name, VectorXYZ(x, y, z))
+            setattr(self, segment_name, VectorXYZ(data=raw_data.select(fields)))
+
+    def resample(self, table: ResampleTable, grid: NDArray) -> None:
+        """Resample every segment onto a time grid."""
+        self.time = grid
+        for segment_name in IMU_SEGMENT_FIELDS:
+            segment = getattr(self, segment_name)
+            setattr(self, segment_name, VectorXYZ(data=table.interpolate(segment.data)))
 
     def plot(self):  # pragma: no cover
         """Plot the x, y, z data."""
@@ -136,8 +182,22 @@ class IMUParser:
 class AngleParser:
     """Parser for log files with angle."""
 
-    def __init__(self, filepath: Path):
+    def __init__(  # noqa: PLR0913
+        self,
+        filepath: Path,
+        dtype: DTypeLike = np.float64,
+        cache: LogCache | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        *,
+        index_dir: str | Path | None = None,
+    ):
         self.filepath = filepath
+        self.dtype = dtype
+        self.cache = cache
+        self.start = start
+        self.end = end
+        self.index_dir = index_dir
         self.time = np.array([])
         self.hip = AngleXYZ()
         self.knee = AngleXYZ()
@@ -145,25 +205,70 @@ class AngleParser:
 
     def parse(self):
         """Parse the log file and return a DataFrame."""
-        raw_data = pd.read_csv(self.filepath, sep="\t+", engine="python")
+        raw_data = _read_table(
+            self.filepath,
+            self.dtype,
+            self.cache,
+            self.start,
+            self.end,
+            index_dir=self.index_dir,
+        )
         logger.debug(f"Parsing {self.filepath}")
         logger.debug(f"Columns: {raw_data.shape}")
 
-        time_str = raw_data[AnglesHeader.TIME]
-        self.time = np.array([time_str_to_seconds(t) for t in time_str])
+        self.time = raw_data.time
 
         for segment_name, fields in ANGLES_SEGMENT_FIELDS.items():
-            x_deg = raw_data[fields[0]].to_numpy()
-            y_deg = raw_data[fields[1]].to_numpy()
-            z_deg = raw_data[fields[2]].to_numpy()
-            setattr(self, segment_name, AngleXYZ(x_deg, y_deg, z_deg))
+            setattr(self, segment_name, AngleXYZ(data=raw_data.select(fields)))
+
+    def resample(self, table: ResampleTable, grid: NDArray) -> None:
+        """Resample every joint onto a time grid."""
+        self.time = grid
+        for joint_name in ANGLES_SEGMENT_FIELDS:
+            angles = getattr(self, joint_name)
+            setattr(
+                self,
+                joint_name,
+                AngleXYZ(data=table.interpolate_angles(angles.data)),
+            )
+
+    @classmethod
+    def from_quaternions(cls, quat_data: "QuaternionParser") -> "AngleParser":
+        """Derive the joint angles from parsed segment orientations.
+
+        Every joint angle is the child segment's orientation relative to its
+        parent segment, converted to the Euler sequence of the Angles logs.
+
+        :param quat_data: Parsed quaternion log of the same side.
+        :return: Angle data without reading an Angles log.
+        """
+        angle_data = cls(quat_data.filepath, dtype=quat_data.dtype)
+        angle_data.time = quat_data.time
+        for joint_name, (parent, child) in JOINT_SEGMENTS.items():
+            relative = getattr(quat_data, child).relative_to(getattr(quat_data, parent))
+            setattr(angle_data, joint_name, relative.to_euler(JOINT_EULER_SEQUENCE))
+        return angle_data
 
 
 class QuaternionParser:
     """Parser for log files with quaternion information."""
 
-    def __init__(self, filepath: Path):
+    def __init__(  # noqa: PLR0913
+        self,
+        filepath: Path,
+        dtype: DTypeLike = np.float64,
+        cache: LogCache | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        *,
+        index_dir: str | Path | None = None,
+    ):
         self.filepath = filepath
+        self.dtype = dtype
+        self.cache = cache
+        self.start = start
+        self.end = end
+        self.index_dir = index_dir
         self.time = np.array([])
         self.pelvis = Quaternion()
         self.upper_leg = Quaternion()
@@ -172,19 +277,32 @@ class QuaternionParser:
 
     def parse(self):
         """Parse the log file and return a DataFrame."""
-        raw_data = pd.read_csv(self.filepath, sep="\t")
+        raw_data = _read_table(
+            self.filepath,
+            self.dtype,
+            self.cache,
+            self.start,
+            self.end,
+            index_dir=self.index_dir,
+        )
         logger.debug(f"Parsing {self.filepath}")
         logger.debug(f"Columns: {raw_data.shape}")
 
-        time_str = raw_data[QuaternionHeader.TIME]
-        self.time = np.array([time_str_to_seconds(t) for t in time_str])
+        self.time = raw_data.time
 
         for segment_name, fields in QUATERNION_SEGMENT_FIELDS.items():
-            w = raw_data[fields[0]].to_numpy()
-            x = raw_data[fields[1]].to_numpy()
-            y = raw_data[fields[2]].to_numpy()
-            z = raw_data[fields[3]].to_numpy()
-            setattr(self, segment_name, Quaternion(w, x, y, z))
+            setattr(self, segment_name, Quaternion(data=raw_data.select(fields)))
+
+    def resample(self, table: ResampleTable, grid: NDArray) -> None:
+        """Resample every segment onto a time grid."""
+        self.time = grid
+        for segment_name in QUATERNION_SEGMENT_FIELDS:
+            quat = getattr(self, segment_name)
+            setattr(
+                self,
+                segment_name,
+                Quaternion(data=table.interpolate_quaternions(quat.data)),
+            )
 
     def plot(self):  # pragma: no cover
         """Plot the Quaternion data."""
@@ -208,108 +326,209 @@ class QuaternionParser:
             plt.tight_layout()
 
 
+LOG_SIDES = ("left", "right")
+LOG_CATEGORIES = (
+    LogFileKeys.ACCEL,
+    LogFileKeys.GYRO,
+    LogFileKeys.QUAT,
+    LogFileKeys.ANGLE,
+)
+
+SensorParser = IMUParser | AngleParser | QuaternionParser
+
+_PARSER_TYPES: dict[str, tuple[str, type[SensorParser]]] = {
+    LogFileKeys.ACCEL: ("accel", IMUParser),
+    LogFileKeys.GYRO: ("gyro", IMUParser),
+    LogFileKeys.QUAT: ("quat", QuaternionParser),
+    LogFileKeys.ANGLE: ("angle", AngleParser),
+}
+
+
 class LogParser:
     """Parser for log files with limb information."""
 
-    def __init__(self, log_files: LogFiles):
-        logger.info(f"Parsing {log_files}")
-        accel_data_right = IMUParser(log_files.accel.right)
-        accel_data_right.parse()
-        accel_data_left = IMUParser(log_files.accel.left)
-        accel_data_left.parse()
-
-        gyro_data_right = IMUParser(log_files.gyro.right)
-        gyro_data_right.parse()
-        gyro_data_left = IMUParser(log_files.gyro.left)
-        gyro_data_left.parse()
-
-        quat_data_right = QuaternionParser(log_files.quat.right)
-        quat_data_right.parse()
-        quat_data_left = QuaternionParser(log_files.quat.left)
-        quat_data_left.parse()
-
-        angles_right = AngleParser(log_files.angle.right)
-        angles_right.parse()
-        angles_left = AngleParser(log_files.angle.left)
-        angles_left.parse()
-
-        time = accel_data_right.time
-
-        pelvis_right = Limb(
-            time=time,
-            accel=accel_data_right.pelvis,
-            gyro=gyro_data_right.pelvis,
-            quat=quat_data_right.pelvis,
-        )
-        upper_leg_right = Limb(
-            time=time,
-            accel=accel_data_right.upper_leg,
-            gyro=gyro_data_right.upper_leg,
-            quat=quat_data_right.upper_leg,
-        )
-        lower_leg_right = Limb(
-            time=time,
-            accel=accel_data_right.lower_leg,
-            gyro=gyro_data_right.lower_leg,
-            quat=quat_data_right.lower_leg,
+    def __init__(  # noqa: PLR0913
+        self,
+        log_files: LogFiles,
+        cache: LogCache | None = None,
+        sides: Iterable[str] | None = None,
+        categories: Iterable[str] | None = None,
+        *,
+        executor: Executor | str | None = None,
+        angles_from_quaternions: bool = False,
+        resample_hz: float | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        index_dir: str | Path | None = None,
+    ):
+        """Parse the sensor files of a log directory.
+
+        Only the selected sides and categories are read; the fields of everything
+        else are left empty. ``files_touched`` lists the files that were read.
+
+        :param log_files: Log files to parse.
+        :param cache: Binary cache to load the files through, if any.
+        :param sides: Sides to parse, out of ``LOG_SIDES``. All if None.
+        :param categories: Sensor categories to parse, out of ``LOG_CATEGORIES``.
+            All if None.
+        :param executor: Executor to parse the files concurrently with, or
+            "thread" / "process" for a pool with one worker per file up to the
+            number of cores. Files are parsed one after another if None.
+        :param angles_from_quaternions: Derive the joint angles from the
+            Quaternions logs instead of reading the Angles logs.
+        :param resample_hz: Resample every file onto one uniform grid at this
+            rate, covering the time span all files share. ``dropped`` then flags
+            the grid points that fall into a gap of any file. The files keep
+            their own timestamps if None.
+        :param start: Parse only samples from this many seconds after the first
+            sample of each file on. Files without a cache seek to it through
+            their sidecar time index instead of parsing everything before it.
+        :param end: Parse only samples up to this many seconds after the first
+            sample of each file.
+        :param index_dir: Directory for the sidecar time indexes, see
+            ``LogIndex.load``. Next to the logs if None.
+        """
+        self.sides = tuple(sides) if sides is not None else LOG_SIDES
+        self.categories = (
+            tuple(categories) if categories is not None else LOG_CATEGORIES
         )
-        foot_right = Limb(
-            time=time,
-            accel=accel_data_right.foot,
-            gyro=gyro_data_right.foot,
-            quat=quat_data_right.foot,
+        unknown = set(self.sides) - set(LOG_SIDES)
+        unknown |= set(self.categories) - set(LOG_CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown log sides or categories: {sorted(unknown)}")
+
+        logger.info(f"Parsing {log_files}")
+        self.log_files = log_files
+        self.cache = cache
+        self.angles_from_quaternions = angles_from_quaternions
+        self.start = start
+        self.end = end
+        self.index_dir = index_dir
+        self.files_touched: list[Path] = []
+        self.parsers: dict[tuple[str, str], SensorParser] = {}
+        self._parse_all(executor)
+        logger.info(f"Parsed {len(self.files_touched)} log files.")
+
+        self.rate_hz = resample_hz
+        self.dropped = np.array([], dtype=bool)
+        if resample_hz is not None and self.parsers:
+            self._resample(resample_hz)
+
+        first_parser = self.parsers.get(
+            (LogFileKeys.ACCEL, "right"), next(iter(self.parsers.values()), None)
         )
-        hip_right = Joint(time=time, angles=angles_right.hip)
-        knee_right = Joint(time=time, angles=angles_right.knee)
-        ankle_right = Joint(time=time, angles=angles_right.ankle)
-
-        pelvis_left = Limb(
-            time=time,
-            accel=accel_data_left.pelvis,
-            gyro=gyro_data_left.pelvis,
-            quat=quat_data_left.pelvis,
+        self.time = first_parser.time if first_parser is not None else np.array([])
+        self.data = LeftRight(
+            left=self._build_body("left"), right=self._build_body("right")
         )
-        upper_leg_left = Limb(
-            time=time,
-            accel=accel_data_left.upper_leg,
-            gyro=gyro_data_left.upper_leg,
-            quat=quat_data_left.upper_leg,
+
+    def _parse_all(self, executor: Executor | str | None) -> None:
+        categories = list(self.categories)
+        derive_angles = self.angles_from_quaternions and LogFileKeys.ANGLE in categories
+        if derive_angles:
+            categories.remove(LogFileKeys.ANGLE)
+            if LogFileKeys.QUAT not in categories:
+                categories.append(LogFileKeys.QUAT)
+        jobs = [(category, side) for category in categories for side in self.sides]
+        parser_types = [_PARSER_TYPES[category][1] for category, _ in jobs]
+        filepaths = [
+            getattr(getattr(self.log_files, _PARSER_TYPES[category][0]), side)
+            for category, side in jobs
+        ]
+        parse_file = partial(
+            _parse_file,
+            cache=self.cache,
+            start=self.start,
+            end=self.end,
+            index_dir=self.index_dir,
         )
-        lower_leg_left = Limb(
-            time=time,
-            accel=accel_data_left.lower_leg,
-            gyro=gyro_data_left.lower_leg,
-            quat=quat_data_left.lower_leg,
+
+        if executor is None:
+            parsers = list(map(parse_file, parser_types, filepaths))
+        elif isinstance(executor, str):
+            with create_executor(executor, len(jobs)) as pool:
+                parsers = list(pool.map(parse_file, parser_types, filepaths))
+        else:
+            parsers = list(executor.map(parse_file, parser_types, filepaths))
+
+        self.parsers.update(zip(jobs, parsers, strict=True))
+        self.files_touched.extend(filepaths)
+        if derive_angles:
+            for side in self.sides:
+                quat_data = self.parsers[(LogFileKeys.QUAT, side)]
+                assert isinstance(quat_data, QuaternionParser)
+                self.parsers[(LogFileKeys.ANGLE, side)] = AngleParser.from_quaternions(
+                    quat_data
+                )
+
+    def _resample(self, rate_hz: float) -> None:
+        parsers = list(self.parsers.values())
+        grid, tables, self.dropped = align_time_bases(
+            [parser.time for parser in parsers], rate_hz
         )
-        foot_left = Limb(
-            time=time,
-            accel=accel_data_left.foot,
-            gyro=gyro_data_left.foot,
-            quat=quat_data_left.foot,
+        for parser, table in zip(parsers, tables, strict=True):
+            parser.resample(table, grid)
+        logger.info(
+            f"Resampled {len(parsers)} log files onto {len(grid)} samples at "
+            f"{rate_hz} Hz, {np.count_nonzero(self.dropped)} in dropped gaps."
         )
-        hip_left = Joint(time=time, angles=angles_left.hip)
-        knee_left = Joint(time=time, angles=angles_left.knee)
-        ankle_left = Joint(time=time, angles=angles_left.ankle)
 
-        self.log_files = log_files
-        self.time = accel_data_right.time
-        self.data = LeftRight(
-            left=Body(
-                pelvis=pelvis_left,
-                upper_leg=upper_leg_left,
-                lower_leg=lower_leg_left,
-                foot=foot_left,
-                hip=hip_left,
-                knee=knee_left,
-                ankle=ankle_left,
-            ),
-            right=Body(
-                pelvis=pelvis_right,
-                upper_leg=upper_leg_right,
-                lower_leg=lower_leg_right,
-                foot=foot_right,
-                hip=hip_right,
-                knee=knee_right,
-                ankle=ankle_right,
-            ),
+    def _build_body(self, side: str) -> Body:
+        accel = self.parsers.get((LogFileKeys.ACCEL, side))
+        gyro = self.parsers.get((LogFileKeys.GYRO, side))
+        quat = self.parsers.get((LogFileKeys.QUAT, side))
+        angles = self.parsers.get((LogFileKeys.ANGLE, side))
+
+        def limb(segment: str) -> Limb:
+            return Limb(
+                time=self.time,
+                accel=getattr(accel, segment) if accel else VectorXYZ(),
+                gyro=getattr(gyro, segment) if gyro else VectorXYZ(),
+                quat=getattr(quat, segment) if quat else Quaternion(),
+            )
+
+        def joint(name: str) -> Joint:
+            return Joint(
+                time=self.time, angles=getattr(angles, name) if angles else AngleXYZ()
+            )
+
+        return Body(
+            pelvis=limb("pelvis"),
+            upper_leg=limb("upper_leg"),
+            lower_leg=limb("lower_leg"),
+            foot=limb("foot"),
+            hip=joint("hip"),
+            knee=joint("knee"),
+            ankle=joint("ankle"),
         )
+
+
+def _parse_file(  # noqa: PLR0913
+    parser_type: type[SensorParser],
+    filepath: Path,
+    *,
+    cache: LogCache | None,
+    start: float | None,
+    end: float | None,
+    index_dir: str | Path | None,
+) -> SensorParser:
+    parser = parser_type(
+        filepath, cache=cache, start=start, end=end, index_dir=index_dir
+    )
+    parser.parse()
+    return parser
+
+
+def create_executor(kind: str, n_jobs: int) -> Executor:
+    """Return a pool for ``n_jobs`` jobs with at most one worker per core.
+
+    :param kind: "thread" or "process".
+    :param n_jobs: Number of jobs the pool is for.
+    :raises ValueError: If the kind is unknown.
+    """
+    max_workers = max(1, min(n_jobs, os.cpu_count() or 1))
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor '{kind}', expected 'thread' or 'process'.")
@@ -0,0 +1,291 @@
+"""Vectorized kernels for arrays of unit quaternions.
+
+Quaternions are stored scalar first, as arrays of shape (..., 4) holding
+``(w, x, y, z)``. Every kernel works on whole arrays at once and accepts an
+optional ``out`` array, so repeated calls can reuse their buffers.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+_AXES = "xyz"
+
+# Terms of the Hamilton product: (sign, component of a, component of b).
+_PRODUCT_TERMS = (
+    ((1, 0, 0), (-1, 1, 1), (-1, 2, 2), (-1, 3, 3)),
+    ((1, 0, 1), (1, 1, 0), (1, 2, 3), (-1, 3, 2)),
+    ((1, 0, 2), (-1, 1, 3), (1, 2, 0), (1, 3, 1)),
+    ((1, 0, 3), (1, 1, 2), (-1, 2, 1), (1, 3, 0)),
+)
+
+_SLERP_LINEAR_THRESHOLD = 1e-6
+
+
+def _output(out: NDArray | None, shape: tuple[int, ...], *inputs: NDArray) -> NDArray:
+    dtype = np.result_type(*inputs, np.float64)
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"Expected out of shape {shape}, got {out.shape}.")
+    return out
+
+
+def _scratch(out: NDArray, *inputs: NDArray) -> NDArray:
+    # Results are accumulated component by component, so an output that aliases
+    # an input needs a separate buffer.
+    if any(np.shares_memory(out, array) for array in inputs):
+        return np.empty_like(out)
+    return out
+
+
+def quat_multiply(a: ArrayLike, b: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """Return the Hamilton product ``a * b``.
+
+    :param a: Left quaternions of shape (..., 4).
+    :param b: Right quaternions of shape (..., 4), broadcast against ``a``.
+    :param out: Array to write the product into.
+    :return: Products of shape (..., 4).
+    """
+    a, b = np.asarray(a), np.asarray(b)
+    result = _output(out, np.broadcast_shapes(a.shape, b.shape), a, b)
+    target = _scratch(result, a, b)
+    term = np.empty(target.shape[:-1], dtype=target.dtype)
+    for component, terms in enumerate(_PRODUCT_TERMS):
+        column = target[..., component]
+        for index, (sign, i, j) in enumerate(terms):
+            if index == 0:
+                np.multiply(a[..., i], b[..., j], out=column)
+                continue
+            np.multiply(a[..., i], b[..., j], out=term)
+            if sign > 0:
+                column += term
+            else:
+                column -= term
+    if target is not result:
+        result[...] = target
+    return result
+
+
+def quat_conjugate(q: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """Return the conjugates ``(w, -x, -y, -z)`` of quaternions of shape (..., 4)."""
+    q = np.asarray(q)
+    result = _output(out, q.shape, q)
+    result[..., 0] = q[..., 0]
+    np.negative(q[..., 1:], out=result[..., 1:])
+    return result
+
+
+def quat_norm(q: ArrayLike) -> NDArray:
+    """Return the norms of quaternions of shape (..., 4)."""
+    q = np.asarray(q)
+    return np.sqrt(np.einsum("...i,...i->...", q, q))
+
+
+def quat_normalize(q: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """Return quaternions of shape (..., 4) scaled to unit norm."""
+    q = np.asarray(q)
+    result = _output(out, q.shape, q)
+    np.divide(q, quat_norm(q)[..., np.newaxis], out=result)
+    return result
+
+
+def quat_inverse(q: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """Return the inverses of quaternions of shape (..., 4).
+
+    For unit quaternions this equals the conjugate.
+    """
+    q = np.asarray(q)
+    result = quat_conjugate(q, out=out)
+    result /= np.einsum("...i,...i->...", q, q)[..., np.newaxis]
+    return result
+
+
+def quat_relative(
+    parent: ArrayLike, child: ArrayLike, out: NDArray | None = None
+) -> NDArray:
+    """Return the rotation of ``child`` expressed in the frame of ``parent``.
+
+    This is ``conj(parent) * child``, e.g. the orientation of the upper leg
+    relative to the pelvis.
+
+    :param parent: Unit quaternions of the reference segment, shape (..., 4).
+    :param child: Unit quaternions of the moving segment, shape (..., 4).
+    :param out: Array to write the relative rotations into.
+    :return: Relative rotations of shape (..., 4).
+    """
+    return quat_multiply(quat_conjugate(parent), child, out=out)
+
+
+def quat_rotate(q: ArrayLike, v: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """Rotate vectors by unit quaternions.
+
+    Uses ``v' = v + 2 w (u x v) + 2 u x (u x v)`` with ``u = (x, y, z)``, which
+    avoids forming rotation matrices.
+
+    :param q: Unit quaternions of shape (..., 4).
+    :param v: Vectors of shape (..., 3), broadcast against ``q``.
+    :param out: Array to write the rotated vectors into.
+    :return: Rotated vectors of shape (..., 3).
+    """
+    q, v = np.asarray(q), np.asarray(v)
+    shape = (*np.broadcast_shapes(q.shape[:-1], v.shape[:-1]), 3)
+    result = _output(out, shape, q, v)
+    u = q[..., 1:]
+    uv = np.cross(u, v)
+    uv *= 2.0
+    uuv = np.cross(u, uv)
+    uv *= q[..., 0, np.newaxis]
+    np.add(v, uv, out=result)
+    result += uuv
+    return result
+
+
+def _parse_sequence(sequence: str) -> tuple[list[int], bool]:
+    if (
+        len(sequence) != 3
+        or not (sequence.islower() or sequence.isupper())
+        or sorted(sequence.lower()) != list(_AXES)
+    ):
+        raise ValueError(
+            f"Euler sequence '{sequence}' must be a permutation of 'xyz' "
+            "(extrinsic) or 'XYZ' (intrinsic)."
+        )
+    return [_AXES.index(axis) for axis in sequence.lower()], sequence.isupper()
+
+
+def _parity(axes: list[int]) -> int:
+    return 1 if (axes[1] - axes[0]) % 3 == 1 else -1
+
+
+def _rotation_element(q: NDArray, row: int, col: int) -> NDArray:
+    w, v = q[..., 0], q[..., 1:]
+    if row == col:
+        others = [axis for axis in range(3) if axis != row]
+        return 1.0 - 2.0 * (v[..., others[0]] ** 2 + v[..., others[1]] ** 2)
+    other = 3 - row - col
+    sign = -_parity([row, col, other])
+    return 2.0 * (v[..., row] * v[..., col] + sign * w * v[..., other])
+
+
+def quat_to_euler(
+    q: ArrayLike,
+    sequence: str = "xyz",
+    degrees: bool = True,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Convert unit quaternions to Tait-Bryan angles.
+
+    Only the three rotation matrix elements each angle needs are computed.
+
+    :param q: Unit quaternions of shape (..., 4).
+    :param sequence: Rotation axes, lower case for extrinsic and upper case for
+        intrinsic rotations, as in ``scipy.spatial.transform.Rotation``.
+    :param degrees: Return degrees instead of radians.
+    :param out: Array to write the angles into.
+    :return: Angles of shape (..., 3), in the order of ``sequence``.
+    :raises ValueError: If the sequence is not a Tait-Bryan sequence.
+    """
+    q = np.asarray(q)
+    axes, intrinsic = _parse_sequence(sequence)
+    # An extrinsic sequence equals the reversed intrinsic sequence.
+    i, j, k = axes if intrinsic else axes[::-1]
+    parity = _parity([i, j, k])
+    result = _output(out, (*q.shape[:-1], 3), q)
+    first, middle, last = (0, 1, 2) if intrinsic else (2, 1, 0)
+
+    np.clip(parity * _rotation_element(q, i, k), -1.0, 1.0, out=result[..., middle])
+    np.arcsin(result[..., middle], out=result[..., middle])
+    np.arctan2(
+        -parity * _rotation_element(q, j, k),
+        _rotation_element(q, k, k),
+        out=result[..., first],
+    )
+    np.arctan2(
+        -parity * _rotation_element(q, i, j),
+        _rotation_element(q, i, i),
+        out=result[..., last],
+    )
+    if degrees:
+        np.rad2deg(result, out=result)
+    return result
+
+
+def euler_to_quat(
+    angles: ArrayLike,
+    sequence: str = "xyz",
+    degrees: bool = True,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Convert Tait-Bryan angles to unit quaternions.
+
+    :param angles: Angles of shape (..., 3), in the order of ``sequence``.
+    :param sequence: Rotation axes, lower case for extrinsic and upper case for
+        intrinsic rotations.
+    :param degrees: The angles are in degrees instead of radians.
+    :param out: Array to write the quaternions into.
+    :return: Unit quaternions of shape (..., 4).
+    :raises ValueError: If the sequence is not a Tait-Bryan sequence.
+    """
+    angles = np.asarray(angles, dtype=float)
+    axes, intrinsic = _parse_sequence(sequence)
+    half = np.deg2rad(angles) / 2 if degrees else angles / 2
+    elementary = np.zeros((*angles.shape[:-1], 3, 4))
+    elementary[..., 0] = np.cos(half)
+    for position, axis in enumerate(axes):
+        elementary[..., position, axis + 1] = np.sin(half[..., position])
+
+    order = [0, 1, 2] if intrinsic else [2, 1, 0]
+    product = quat_multiply(elementary[..., order[0], :], elementary[..., order[1], :])
+    return quat_multiply(product, elementary[..., order[2], :], out=out)
+
+
+def quat_slerp(
+    time: ArrayLike,
+    q: ArrayLike,
+    new_time: ArrayLike,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Resample unit quaternions with spherical linear interpolation.
+
+    Each sample is interpolated along the shorter arc between its neighbours.
+    Times outside the sampled range are clamped to the first or last sample. An
+    interval between repeated sample times gives its first sample.
+
+    :param time: Increasing sample times of shape (N,).
+    :param q: Unit quaternions of shape (N, 4).
+    :param new_time: Times to resample at, of shape (M,).
+    :param out: Array to write the resampled quaternions into.
+    :return: Resampled unit quaternions of shape (M, 4).
+    """
+    time, q = np.asarray(time, dtype=float), np.asarray(q)
+    new_times = np.clip(np.asarray(new_time, dtype=float), time[0], time[-1])
+    result = _output(out, (*new_times.shape, 4), q)
+    if len(time) == 1:
+        result[...] = q[0]
+        return result
+
+    upper = np.clip(np.searchsorted(time, new_times, side="right"), 1, len(time) - 1)
+    lower = upper - 1
+    span = time[upper] - time[lower]
+    fraction = np.divide(
+        new_times - time[lower], span, out=np.zeros_like(new_times), where=span > 0
+    )
+    q0, q1 = q[lower], q[upper]
+
+    cos_angle = np.einsum("ij,ij->i", q0, q1)
+    flip = cos_angle < 0
+    q1[flip] *= -1
+    np.abs(cos_angle, out=cos_angle)
+    angle = np.arccos(np.minimum(cos_angle, 1.0))
+    sin_angle = np.sin(angle)
+    linear = sin_angle < _SLERP_LINEAR_THRESHOLD
+    safe_sin = np.where(linear, 1.0, sin_angle)
+    weight0 = np.where(
+        linear, 1.0 - fraction, np.sin((1 - fraction) * angle) / safe_sin
+    )
+    weight1 = np.where(linear, fraction, np.sin(fraction * angle) / safe_sin)
+
+    np.multiply(q0, weight0[:, np.newaxis], out=result)
+    q1 *= weight1[:, np.newaxis]
+    result += q1
+    return quat_normalize(result, out=result)
@@ -0,0 +1,117 @@
+"""Fast readers for the tab-separated sensor log files."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+import pandas as pd
+from numpy.typing import DTypeLike, NDArray
+
+from adaptive_oscillator.utils.compression_utils import compression_of, open_log
+from adaptive_oscillator.utils.time_utils import time_strs_to_seconds
+
+
+@dataclass
+class LogTable:
+    """Numeric contents of one sensor log file."""
+
+    time: NDArray
+    columns: tuple[str, ...]
+    values: NDArray
+
+    def __getitem__(self, name: str) -> NDArray:
+        """Return the values of one column."""
+        return self.values[:, self.columns.index(name)]
+
+    def select(self, names: list[str]) -> NDArray:
+        """Return the values of several columns as one contiguous (N, K) array."""
+        return self.values[:, [self.columns.index(name) for name in names]]
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.time)
+
+    def between(self, start: float | None, end: float | None) -> "LogTable":
+        """Return the samples with ``start <= time <= end`` as views.
+
+        :param start: First time to keep, or None for no lower bound.
+        :param end: Last time to keep, or None for no upper bound.
+        """
+        first = 0 if start is None else np.searchsorted(self.time, start, side="left")
+        stop = len(self) if end is None else np.searchsorted(self.time, end, "right")
+        return LogTable(
+            time=self.time[first:stop],
+            columns=self.columns,
+            values=self.values[first:stop],
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return the number of samples and columns, including the time column."""
+        return len(self.time), len(self.columns) + 1
+
+
+def read_header(filepath: str | Path) -> list[str]:
+    """Return the column names of a log file.
+
+    Some loggers write a doubled tab into the header line, so empty names are
+    dropped.
+    """
+    with open_log(filepath) as file:
+        header = file.readline().decode("utf-8")
+    return [name for name in header.rstrip("\r\n").split("\t") if name]
+
+
+def read_log_file(filepath: str | Path, dtype: DTypeLike = np.float64) -> LogTable:
+    """Read a tab-separated sensor log with the pandas C engine.
+
+    The header is read separately, so the body can be split on single tabs by the
+    C tokenizer instead of the regex separator of the Python engine. Compressed
+    logs are decompressed while they are parsed.
+
+    :param filepath: Path to the plain or compressed log file.
+    :param dtype: Floating point type of the sensor values.
+    :return: Time in seconds and the sensor values as an (N, C) array.
+    """
+    names = read_header(filepath)
+    if not compression_of(filepath):
+        return read_log_body(filepath, names, dtype=dtype, skiprows=1)
+    with open_log(filepath) as stream:
+        return read_log_body(stream, names, dtype=dtype, skiprows=1)
+
+
+def read_log_body(
+    source: str | Path | IO[bytes],
+    names: list[str],
+    dtype: DTypeLike = np.float64,
+    skiprows: int = 0,
+    columns: Sequence[str] | None = None,
+) -> LogTable:
+    """Read the tab-separated sample lines of a sensor log.
+
+    :param source: Log file, or a buffer with complete sample lines.
+    :param names: Column names from the header, starting with the time column.
+    :param dtype: Floating point type of the sensor values.
+    :param skiprows: Number of leading lines to skip, e.g. 1 for the header.
+    :param columns: Value columns to keep, or all if None.
+    :return: Time in seconds and the sensor values as an (N, C) array.
+    """
+    time_name = names[0]
+    value_names = list(columns) if columns is not None else names[1:]
+    raw_data = pd.read_csv(
+        source,
+        sep="\t",
+        header=None,
+        skiprows=skiprows,
+        names=names,
+        usecols=[time_name, *value_names],
+        dtype={time_name: str, **dict.fromkeys(value_names, dtype)},
+        engine="c",
+    )
+    return LogTable(
+        time=time_strs_to_seconds(raw_data[time_name].to_numpy()),
+        columns=tuple(value_names),
+        values=raw_data[value_names].to_numpy(dtype=dtype),
+    )
@@ -0,0 +1,138 @@
+"""Alignment of sensor logs onto one uniform time grid."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import DROPPED_SAMPLE_TOLERANCE
+
+
+@dataclass
+class ResampleTable:
+    """Precomputed linear interpolation from a log's timestamps onto a grid.
+
+    Every grid point is interpolated between the samples ``lower`` and
+    ``lower + 1`` with the fraction ``weight`` towards the later one, so all
+    channels of a log are resampled with the same index arithmetic.
+    """
+
+    lower: NDArray
+    weight: NDArray
+    dropped: NDArray
+
+    @classmethod
+    def build(
+        cls,
+        time: NDArray,
+        grid: NDArray,
+        tolerance: float = DROPPED_SAMPLE_TOLERANCE,
+    ) -> "ResampleTable":
+        """Build the table of one time base.
+
+        :param time: Increasing timestamps of the log, at least two.
+        :param grid: Times to resample at, within the range of ``time``.
+        :param tolerance: Gaps longer than this many median sample periods are
+            treated as dropped samples.
+        :return: Interpolation table with a dropped flag per grid point.
+        """
+        if len(time) < 2:
+            raise ValueError("Resampling needs at least two samples.")
+        lower = np.searchsorted(time, grid, side="right") - 1
+        np.clip(lower, 0, len(time) - 2, out=lower)
+        gap = time[lower + 1] - time[lower]
+        weight = np.clip((grid - time[lower]) / gap, 0.0, 1.0)
+        dropped = gap > tolerance * np.median(np.diff(time))
+        return cls(lower=lower, weight=weight, dropped=dropped)
+
+    def __len__(self) -> int:
+        """Return the number of grid points."""
+        return len(self.lower)
+
+    def interpolate(self, values: NDArray) -> NDArray:
+        """Resample an (N,) or (N, K) array of samples onto the grid."""
+        weight = self.weight.reshape((-1,) + (1,) * (values.ndim - 1))
+        start = values[self.lower]
+        result = values[self.lower + 1] - start
+        result *= weight
+        result += start
+        return result
+
+    def interpolate_angles(self, values_deg: NDArray) -> NDArray:
+        """Resample angles in degrees along the shorter way around the circle.
+
+        :return: Angles wrapped to [-180, 180).
+        """
+        unwrapped = np.unwrap(values_deg, period=360.0, axis=0)
+        result = self.interpolate(unwrapped)
+        result += 180.0
+        np.mod(result, 360.0, out=result)
+        result -= 180.0
+        return result
+
+    def interpolate_quaternions(self, q: NDArray) -> NDArray:
+        """Resample (N, 4) unit quaternions by normalized linear interpolation.
+
+        The later sample of every pair is flipped onto the same hemisphere as the
+        earlier one first, so the interpolation follows the shorter arc.
+        """
+        start, end = q[self.lower], q[self.lower + 1]
+        end[np.einsum("ij,ij->i", start, end) < 0] *= -1
+        end -= start
+        end *= self.weight[:, np.newaxis]
+        end += start
+        end /= np.linalg.norm(end, axis=1, keepdims=True)
+        return end
+
+
+def uniform_grid(times: Sequence[NDArray], rate_hz: float) -> NDArray:
+    """Return a uniform time grid covering the overlap of several logs.
+
+    :param times: Timestamps of every log to merge.
+    :param rate_hz: Sample rate of the grid.
+    :return: Grid from the latest start to the earliest end of the logs.
+    :raises ValueError: If the logs do not overlap.
+    """
+    if rate_hz <= 0:
+        raise ValueError(f"Sample rate must be positive, got {rate_hz}.")
+    start = max(time[0] for time in times)
+    end = min(time[-1] for time in times)
+    if end < start:
+        raise ValueError("The logs do not overlap in time.")
+    n_samples = int(np.floor((end - start) * rate_hz + 1e-9)) + 1
+    return start + np.arange(n_samples) / rate_hz
+
+
+def align_time_bases(
+    times: Sequence[NDArray],
+    rate_hz: float,
+    tolerance: float = DROPPED_SAMPLE_TOLERANCE,
+) -> tuple[NDArray, list[ResampleTable], NDArray]:
+    """Merge the time bases of several logs onto one uniform grid.
+
+    Logs with identical timestamps share one table.
+
+    :param times: Timestamps of every log.
+    :param rate_hz: Sample rate of the grid.
+    :param tolerance: Gaps longer than this many median sample periods are
+        treated as dropped samples.
+    :return: The grid, one table per log, and the grid points where any log
+        dropped samples.
+    """
+    grid = uniform_grid(times, rate_hz)
+    tables: list[ResampleTable] = []
+    built: list[tuple[NDArray, ResampleTable]] = []
+    for time in times:
+        table = next(
+            (table for other, table in built if np.array_equal(other, time)), None
+        )
+        if table is None:
+            table = ResampleTable.build(time, grid, tolerance)
+            built.append((time, table))
+        tables.append(table)
+
+    dropped = np.zeros(len(grid), dtype=bool)
+    for _, table in built:
+        dropped |= table.dropped
+    return grid, tables, dropped
@@ -0,0 +1,146 @@
+"""Spectral estimates of a rhythmic signal for warm-starting the oscillators."""
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adaptive_oscillator.definitions import GAIT_FREQ_BAND_HZ, REFERENCE_WINDOW
+
+_ZERO_PAD = 8
+_SUBHARMONIC_RATIO = 0.1
+
+
+@dataclass
+class HarmonicFit:
+    """Fourier series ``alpha_0 + sum_k alpha_k sin(k omega t + offset_k)``."""
+
+    omega: float
+    alpha_0: float
+    alpha: NDArray
+    offset: NDArray
+
+    def phi(self, t: float) -> NDArray:
+        """Return the harmonic phases ``k omega t + offset_k`` at a time."""
+        return self.omega * np.arange(1, len(self.alpha) + 1) * t + self.offset
+
+    def evaluate(self, t: NDArray) -> NDArray:
+        """Return the fitted signal at the times ``t``."""
+        phases = np.multiply.outer(t, self.omega * np.arange(1, len(self.alpha) + 1))
+        return self.alpha_0 + np.sin(phases + self.offset) @ self.alpha
+
+
+def dominant_frequency(
+    t: NDArray,
+    signal: NDArray,
+    band: tuple[float, float] = GAIT_FREQ_BAND_HZ,
+) -> float:
+    """Return the fundamental frequency of a rhythmic signal in Hz.
+
+    The signal is interpolated onto a uniform grid at its median sample period and
+    the peak of its zero-padded spectrum within ``band`` is refined by parabolic
+    interpolation. A peak with a strong subharmonic is taken as the second
+    harmonic, as gait signals often have more power there than in the stride
+    frequency.
+
+    :param t: Increasing sample times, covering a few periods.
+    :param signal: Samples of the signal.
+    :param band: Lowest and highest frequency to consider in Hz.
+    :raises ValueError: If the window is too short to resolve the band.
+    """
+    if len(t) < 4:
+        raise ValueError("The spectral estimate needs at least four samples.")
+    dt = float(np.median(np.diff(t)))
+    grid = t[0] + np.arange(int((t[-1] - t[0]) / dt) + 1) * dt
+    uniform = np.interp(grid, t, signal)
+    uniform -= uniform.mean()
+    uniform *= np.hanning(len(uniform))
+
+    n_fft = _ZERO_PAD * len(uniform)
+    power = np.abs(np.fft.rfft(uniform, n_fft)) ** 2
+    freqs = np.fft.rfftfreq(n_fft, dt)
+    in_band = np.flatnonzero((freqs >= band[0]) & (freqs <= band[1]))
+    if len(in_band) < 3 or band[0] < 1.0 / (t[-1] - t[0]):
+        raise ValueError(
+            f"A window of {t[-1] - t[0]:.2f} s cannot resolve the band {band} Hz."
+        )
+
+    peak = in_band[np.argmax(power[in_band])]
+    half = round(peak / 2)
+    if half >= in_band[0] and power[half] > _SUBHARMONIC_RATIO * power[peak]:
+        peak = half
+    peak = int(np.clip(peak, 1, len(power) - 2))
+    lower, centre, upper = np.log(power[peak - 1 : peak + 2] + 1e-300)
+    shift = 0.5 * (lower - upper) / (lower - 2 * centre + upper)
+    return float((peak + np.clip(shift, -0.5, 0.5)) * freqs[1])
+
+
+def fit_harmonics(
+    t: NDArray,
+    signal: NDArray,
+    n_harmonics: int,
+    band: tuple[float, float] = GAIT_FREQ_BAND_HZ,
+) -> HarmonicFit:
+    """Fit a Fourier series at the signal's dominant frequency.
+
+    The frequency comes from ``dominant_frequency``; offset, amplitudes and phases
+    are then fitted by linear least squares on the raw samples, so irregular
+    sample times are handled exactly.
+
+    :param t: Increasing sample times, covering a few periods.
+    :param signal: Samples of the signal.
+    :param n_harmonics: Number of harmonics to fit.
+    :param band: Lowest and highest fundamental frequency to consider in Hz.
+    :return: Fitted series with non-negative amplitudes.
+    """
+    t = np.asarray(t, dtype=float)
+    signal = np.asarray(signal, dtype=float)
+    omega = 2 * np.pi * dominant_frequency(t, signal, band)
+
+    phases = np.multiply.outer(t, omega * np.arange(1, n_harmonics + 1))
+    design = np.hstack([np.ones((len(t), 1)), np.sin(phases), np.cos(phases)])
+    coeffs = np.linalg.lstsq(design, signal, rcond=None)[0]
+    sin_coeffs = coeffs[1 : 1 + n_harmonics]
+    cos_coeffs = coeffs[1 + n_harmonics :]
+    return HarmonicFit(
+        omega=omega,
+        alpha_0=float(coeffs[0]),
+        alpha=np.hypot(sin_coeffs, cos_coeffs),
+        offset=np.arctan2(cos_coeffs, sin_coeffs),
+    )
+
+
+def local_fundamental(
+    t: NDArray,
+    signal: NDArray,
+    window: float = REFERENCE_WINDOW,
+    step: float = 1.0,
+) -> tuple[NDArray, NDArray]:
+    """Return the local frequency and phase of the fundamental at every sample.
+
+    A single-harmonic series is fitted to a window around every ``step`` seconds
+    of the signal, so changes of walking speed show up in the estimate. Every
+    sample gets the phase of the fit centred closest to it.
+
+    :param t: Increasing sample times, longer than ``window``.
+    :param signal: Samples of the signal.
+    :param window: Length of every fitted window in seconds.
+    :param step: Time between window centres in seconds.
+    :return: Angular frequency and phase wrapped to [0, 2π) per sample.
+    """
+    t = np.asarray(t, dtype=float)
+    signal = np.asarray(signal, dtype=float)
+    centres = np.arange(t[0], t[-1], step)
+    starts = np.clip(centres - window / 2, t[0], max(t[0], t[-1] - window))
+    omegas = np.empty(len(centres))
+    phase = np.empty(len(t))
+    bounds = np.searchsorted(t, np.append(centres[1:] - step / 2, np.inf))
+    first = 0
+    for ii, start in enumerate(starts):
+        in_window = (t >= start) & (t <= start + window)
+        fit = fit_harmonics(t[in_window], signal[in_window], n_harmonics=1)
+        omegas[ii] = fit.omega
+        last = bounds[ii]
+        phase[first:last] = fit.omega * t[first:last] + fit.offset[0]
+        first = last
+    return np.interp(t, centres, omegas), np.mod(phase, 2 * np.pi)
@@ -0,0 +1,131 @@
+"""Streaming reader for sensor log files that are still being written."""
+
+import io
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+from loguru import logger
+from numpy.typing import DTypeLike
+
+from adaptive_oscillator.definitions import (
+    STREAM_CHUNK_SIZE,
+    STREAM_POLL_INTERVAL,
+    STREAM_READ_BYTES,
+)
+from adaptive_oscillator.utils.compression_utils import open_log
+from adaptive_oscillator.utils.reader_utils import LogTable, read_log_body
+from adaptive_oscillator.utils.time_utils import SECONDS_PER_DAY
+
+
+def follow_log_file(  # noqa: PLR0913
+    filepath: str | Path,
+    columns: Sequence[str] | None = None,
+    *,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    poll_interval: float = STREAM_POLL_INTERVAL,
+    idle_timeout: float | None = None,
+    dtype: DTypeLike = np.float64,
+) -> Iterator[LogTable]:
+    """Read a growing log file in chunks, like ``tail -f``.
+
+    Only complete lines are parsed; a partially written last line waits for the
+    next read. Chunks hold ``chunk_size`` samples while the reader is behind the
+    writer. Once it has caught up, the samples read so far are yielded right
+    away, so the latency from write to chunk is bounded by ``poll_interval``.
+    Memory stays bounded by the chunk and read sizes, whatever the file size.
+
+    :param filepath: Log file to follow. It may not exist yet.
+    :param columns: Value columns to read, e.g. ``ANGLES_SEGMENT_FIELDS["hip"]``.
+        All columns of the header if None.
+    :param chunk_size: Maximum number of samples per chunk.
+    :param poll_interval: Seconds to sleep when no new data is available.
+    :param idle_timeout: Stop once the file has not grown for this many seconds,
+        or follow forever if None.
+    :param dtype: Floating point type of the sensor values.
+    :return: Iterator over chunks, with times continuing across midnight.
+    :raises ValueError: If a requested column is not in the header.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+    filepath = Path(filepath)
+    file = _wait_for_file(filepath, poll_interval, idle_timeout)
+    if file is None:
+        return
+
+    with file:
+        parser: _LineParser | None = None
+        pending = b""
+        ready: list[bytes] = []
+        last_data = time.monotonic()
+        while True:
+            data = file.read(STREAM_READ_BYTES)
+            if data:
+                last_data = time.monotonic()
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                if parser is None and lines:
+                    parser = _LineParser(lines.pop(0), columns, dtype)
+                ready.extend(line for line in lines if line.strip())
+
+            caught_up = len(data) < STREAM_READ_BYTES
+            while parser is not None and (
+                len(ready) >= chunk_size or (caught_up and ready)
+            ):
+                yield parser.parse(ready[:chunk_size])
+                del ready[:chunk_size]
+
+            if caught_up:
+                if idle_timeout is not None and (
+                    time.monotonic() - last_data >= idle_timeout
+                ):
+                    if pending.strip():
+                        logger.warning(f"Dropping incomplete last line of {filepath}")
+                    return
+                time.sleep(poll_interval)
+
+
+def _wait_for_file(
+    filepath: Path, poll_interval: float, idle_timeout: float | None
+) -> IO[bytes] | None:
+    start = time.monotonic()
+    while True:
+        try:
+            return open_log(filepath)
+        except FileNotFoundError:
+            if idle_timeout is not None and time.monotonic() - start >= idle_timeout:
+                logger.warning(f"Log file {filepath} was not created.")
+                return None
+            time.sleep(poll_interval)
+
+
+class _LineParser:
+    """Convert complete tab-separated lines to log tables."""
+
+    def __init__(
+        self, header: bytes, columns: Sequence[str] | None, dtype: DTypeLike
+    ) -> None:
+        self.names = [name for name in header.decode().rstrip("\r").split("\t") if name]
+        self.columns = list(columns) if columns is not None else self.names[1:]
+        missing = set(self.columns) - set(self.names[1:])
+        if missing:
+            raise ValueError(f"Columns {sorted(missing)} are not in the log header.")
+        self.dtype = dtype
+        self.day_offset = 0.0
+        self.last_time = -np.inf
+
+    def parse(self, lines: list[bytes]) -> LogTable:
+        table = read_log_body(
+            io.BytesIO(b"\n".join(lines)),
+            self.names,
+            dtype=self.dtype,
+            columns=self.columns,
+        )
+        table.time += self.day_offset
+        if table.time[0] < self.last_time - SECONDS_PER_DAY / 2:
+            self.day_offset += SECONDS_PER_DAY
+            table.time += SECONDS_PER_DAY
+        self.last_time = table.time[-1]
+        return table
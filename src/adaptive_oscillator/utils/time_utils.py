@@ -1,11 +1,85 @@
 """Time utilities."""
 
+from collections.abc import Iterable
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
+
 from adaptive_oscillator.definitions import TIME_FORMAT
 
+SECONDS_PER_DAY = 86400
+_ZERO = ord("0")
+_COLON = ord(":")
+_DOT = ord(".")
+_MAX_FRACTION_DIGITS = 6
+
 
 def time_str_to_seconds(time_str: str) -> float:
     """Convert a time string to seconds."""
     dt = datetime.strptime(time_str, TIME_FORMAT)
     return dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond / 1e6
+
+
+def time_strs_to_seconds(
+    time_strs: Iterable[str] | NDArray, rollover: bool = True
+) -> NDArray:
+    """Convert a column of '%H:%M:%S.%f' time strings to seconds in one pass.
+
+    The strings are viewed as a fixed-width byte matrix and the fields are sliced
+    out as integer digit columns, so no string is parsed in Python. The result is
+    identical to applying ``time_str_to_seconds`` to every element.
+
+    :param time_strs: Time strings, e.g. a pandas column or a NumPy array.
+    :param rollover: Add a day whenever the time jumps back past midnight, so
+        recordings that span midnight stay monotonic.
+    :return: Seconds since midnight of the first sample's day.
+    :raises ValueError: If a string does not match the time format.
+    """
+    raw = np.ascontiguousarray(np.asarray(time_strs, dtype=np.bytes_).reshape(-1))
+    if raw.size == 0:
+        return np.array([], dtype=float)
+    width = raw.dtype.itemsize
+    if width < 8:
+        raise ValueError(f"Time strings must match '{TIME_FORMAT}'.")
+    chars = raw.view(np.uint8).reshape(-1, width)
+    digits = chars.astype(np.int64) - _ZERO
+
+    clock = digits[:, [0, 1, 3, 4, 6, 7]]
+    hours = clock[:, 0] * 10 + clock[:, 1]
+    minutes = clock[:, 2] * 10 + clock[:, 3]
+    secs = clock[:, 4] * 10 + clock[:, 5]
+    fraction = digits[:, 9 : 9 + _MAX_FRACTION_DIGITS]
+    # Shorter strings are padded with NUL bytes, which may only follow the digits.
+    fraction_mask = (fraction >= 0) & (fraction <= 9)
+    valid = (
+        np.all((clock >= 0) & (clock <= 9), axis=1)
+        & (hours < 24)
+        & (minutes < 60)
+        & (secs < 62)
+        & (chars[:, 2] == _COLON)
+        & (chars[:, 5] == _COLON)
+        & (chars[:, 8] == _DOT if width > 8 else True)
+        & np.all(fraction_mask | (chars[:, 9 : 9 + _MAX_FRACTION_DIGITS] == 0), axis=1)
+    )
+    if not np.all(valid):
+        bad = raw[np.argmin(valid)].decode(errors="replace")
+        raise ValueError(f"Time string '{bad}' does not match '{TIME_FORMAT}'.")
+
+    seconds = hours * 3600 + minutes * 60 + secs
+    scale = 10 ** np.arange(_MAX_FRACTION_DIGITS - 1, -1, -1)[: fraction.shape[1]]
+    microseconds = np.where(fraction_mask, fraction, 0) @ scale
+    time = seconds + microseconds / 1e6
+
+    if rollover:
+        time = unwrap_midnight(time)
+    return time
+
+
+def unwrap_midnight(time: NDArray) -> NDArray:
+    """Add a day to every sample after the clock wraps back past midnight."""
+    wraps = np.diff(time) < -SECONDS_PER_DAY / 2
+    if not np.any(wraps):
+        return time
+    days = np.concatenate([[0], np.cumsum(wraps)])
+    return time + days * SECONDS_PER_DAY
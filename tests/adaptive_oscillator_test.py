@@ -3,10 +3,16 @@
 import numpy as np
 import pytest
 
+from adaptive_oscillator.integrators import MAX_SUBSTEPS, FixedStepIntegrator
 from adaptive_oscillator.oscillator import (
+    AdaptiveOscillator,
+    AdaptiveOscillatorBank,
     AOParameters,
     GaitPhaseEstimator,
     LowLevelController,
+    MultiJointController,
+    PIDBank,
+    PIDController,
     sample_walking_data,
 )
 
@@ -48,3 +54,275 @@ def test_adaptive_oscillator(gait_freq: float) -> None:
 
     # Assert
     np.testing.assert_almost_equal(estimator.ao.omega, gait_freq * 2 * np.pi, decimal=1)
+
+
+@pytest.mark.parametrize(
+    "solver, tolerance",
+    [
+        ("rk4", 1e-3),
+        ("semi-implicit", 0.08),
+        ("euler", 0.05),
+    ],
+)
+def test_fixed_step_solver_tracks_reference(solver: str, tolerance: float) -> None:
+    """Test the fixed-step solvers against the RK45 reference."""
+    # Arrange
+    gait_freq = 0.5
+    t_vals, theta_il, _ = sample_walking_data(period=gait_freq, t_end=40.0)
+    reference = AdaptiveOscillator(AOParameters(solver="RK45"))
+    oscillator = AdaptiveOscillator(AOParameters(solver=solver))
+
+    # Act
+    omega_ref, omega = [], []
+    phase_ref, phase = [], []
+    for t, th in zip(t_vals, theta_il, strict=True):
+        phase_ref.append(reference.update(t, th))
+        phase.append(oscillator.update(t, th))
+        omega_ref.append(reference.omega)
+        omega.append(oscillator.omega)
+
+    # Assert
+    phase_error = np.angle(np.exp(1j * (np.array(phase) - np.array(phase_ref))))
+    np.testing.assert_allclose(omega, omega_ref, atol=tolerance)
+    np.testing.assert_allclose(phase_error, 0.0, atol=tolerance)
+
+
+@pytest.mark.parametrize("solver", ["euler", "semi-implicit", "rk4"])
+def test_fixed_step_substeps_are_bounded(solver: str) -> None:
+    """Test that a vanishing or non-finite coupling takes a bounded number of steps."""
+    # Arrange
+    integrator = FixedStepIntegrator((8,), n_harmonics=3, method=solver)
+    evaluate = integrator.derivative
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(None)
+        return evaluate(*args, **kwargs)
+
+    integrator.derivative = counting  # type: ignore[method-assign]
+    gains = (0.5, 20.0, 10.0)
+    cold = np.array([1.0, 0.0, -1e-6, 0.0, 0.0, 0.0, 0.0, 0.0])
+    infinite = np.zeros(8)
+
+    # Act
+    with np.errstate(divide="ignore", invalid="ignore"):
+        integrator.advance(cold, 0.3, 0.01, gains)
+        n_calls = len(calls)
+        integrator.advance(infinite, np.inf, 0.01, gains)
+
+    # Assert
+    assert n_calls <= 4 * MAX_SUBSTEPS + 2
+    assert np.isfinite(cold).all()
+    assert integrator._max_coupling == np.inf
+
+
+def test_adaptive_oscillator_bank() -> None:
+    """Test the oscillator bank against independent oscillators."""
+    # Arrange
+    gait_freqs = [0.4, 0.5, 0.6]
+    params = [
+        AOParameters(solver="rk4"),
+        AOParameters(solver="rk4", eta=0.1),
+        AOParameters(solver="rk4", nu_phi=0.8, nu_omega=0.3),
+    ]
+    signals = [sample_walking_data(period=freq, t_end=40.0)[1] for freq in gait_freqs]
+    t_vals = sample_walking_data(period=gait_freqs[0], t_end=40.0)[0]
+    bank = AdaptiveOscillatorBank(params)
+    oscillators = [AdaptiveOscillator(p) for p in params]
+
+    # Act
+    for ii, t in enumerate(t_vals):
+        theta_il = np.array([signal[ii] for signal in signals])
+        phase = bank.update(t, theta_il)
+        for oscillator, th in zip(oscillators, theta_il, strict=True):
+            oscillator.update(t, th)
+
+    # Assert
+    assert len(bank) == len(params)
+    np.testing.assert_allclose(bank.omega, [o.omega for o in oscillators], atol=1e-3)
+    np.testing.assert_allclose(
+        bank.theta_hat, [o.theta_hat for o in oscillators], atol=1e-3
+    )
+    np.testing.assert_allclose(
+        phase, [np.mod(o.phi[0], 2 * np.pi) for o in oscillators], atol=1e-3
+    )
+    np.testing.assert_almost_equal(bank.omega, np.array(gait_freqs) * 2 * np.pi, 1)
+
+
+def test_adaptive_oscillator_bank_harmonics_mismatch() -> None:
+    """Test that a bank rejects oscillators with different harmonics."""
+    # Arrange
+    params = [AOParameters(n_harmonics=3), AOParameters(n_harmonics=2)]
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="n_harmonics"):
+        AdaptiveOscillatorBank(params)
+
+
+@pytest.mark.parametrize("solver", ["RK45", "rk4"])
+def test_gait_phase_estimator_run(solver: str) -> None:
+    """Test that the offline run matches the per-sample update.
+
+    With the default solver, the update's, the results are identical, and the
+    fixed-step RK4 solver tracks them closely.
+    """
+    # Arrange
+    t_vals, theta_il, theta_il_dot = sample_walking_data(period=0.5, t_end=10.0)
+    streaming = GaitPhaseEstimator(AOParameters(solver=solver))
+    offline = GaitPhaseEstimator(AOParameters(solver=solver))
+    fixed_step = GaitPhaseEstimator(AOParameters(solver=solver))
+
+    # Act
+    phi, phi_gp, omega, theta_hat, alpha = [], [], [], [], []
+    for t, th, dth in zip(t_vals, theta_il, theta_il_dot, strict=True):
+        phi.append(streaming.update(t, th, dth))
+        phi_gp.append(streaming.phi_gp)
+        omega.append(streaming.ao.omega)
+        theta_hat.append(streaming.ao.theta_hat)
+        alpha.append(streaming.ao.alpha.copy())
+    trajectory = offline.run(t_vals, theta_il, theta_il_dot)
+    rk4 = fixed_step.run(t_vals, theta_il, theta_il_dot, solver="rk4")
+
+    # Assert
+    phase_error = np.angle(np.exp(1j * (rk4.phi_gp - trajectory.phi_gp)))
+    np.testing.assert_allclose(phase_error, 0.0, atol=1e-3)
+    np.testing.assert_allclose(rk4.omega, trajectory.omega, atol=1e-3)
+    np.testing.assert_array_equal(trajectory.phi, phi)
+    np.testing.assert_array_equal(trajectory.phi_gp, phi_gp)
+    np.testing.assert_array_equal(trajectory.omega, omega)
+    np.testing.assert_array_equal(trajectory.theta_hat, theta_hat)
+    np.testing.assert_array_equal(trajectory.alpha, alpha)
+    assert offline.phi_error == streaming.phi_error
+
+
+def test_adaptive_oscillator_warm_start() -> None:
+    """Test that a warm-started oscillator is locked from the first sample."""
+    # Arrange
+    gait_freq = 0.5
+    t_vals, theta_il, _ = sample_walking_data(period=gait_freq, t_end=20.0)
+    oscillator = AdaptiveOscillator(AOParameters(solver="rk4"))
+
+    # Act
+    window = t_vals <= 5.0
+    fit = oscillator.warm_start(t_vals[window], theta_il[window])
+    theta_hat = []
+    for t, th in zip(t_vals, theta_il, strict=True):
+        oscillator.update(t, th)
+        theta_hat.append(oscillator.theta_hat)
+
+    # Assert
+    np.testing.assert_allclose(fit.omega, gait_freq * 2 * np.pi, rtol=1e-3)
+    np.testing.assert_allclose(oscillator.omega, gait_freq * 2 * np.pi, rtol=1e-2)
+    np.testing.assert_allclose(theta_hat, theta_il, atol=0.05)
+
+
+@pytest.mark.parametrize("method", ["linear", "hermite"])
+def test_low_level_controller_table(method: str) -> None:
+    """Test that the reference table reproduces the spline, wrapped into its knots."""
+    # Arrange
+    x = np.linspace(0, 2 * np.pi, 100)
+    gait_shape = np.sin(x) + 0.3 * np.sin(2 * x + 1.0)
+    phi = np.linspace(0.0, 2 * np.pi, 1000, endpoint=False)
+
+    # Act
+    controller = LowLevelController(gait_shape=gait_shape, table_method=method)
+    reference = controller.reference(phi)
+
+    # Assert
+    expected = controller.spline(np.mod(phi - np.pi, 2 * np.pi))
+    np.testing.assert_allclose(reference, expected, atol=controller.table.max_error)
+    # The spline's end slopes differ slightly, so the wrap at π leaves a kink.
+    assert controller.table.max_error < (1e-4 if method == "linear" else 1e-6)
+    assert controller.reference(1.0) == pytest.approx(
+        controller.spline(1.0 + np.pi), abs=controller.table.max_error
+    )
+
+
+def test_low_level_controller_wraps_phase() -> None:
+    """Test that the default reference is sin(phi - π) over the whole cycle."""
+    # Arrange
+    controller = LowLevelController(kp=2.0, kd=0.0)
+    phi = np.linspace(0.0, 2 * np.pi, 1000, endpoint=False)
+
+    # Act
+    reference = controller.reference(phi)
+    command = controller.compute(0.5, 0.0, 0.01)
+
+    # Assert
+    np.testing.assert_allclose(reference, np.sin(phi - np.pi), atol=1e-6)
+    # Phases below π used to extrapolate the spline, e.g. to +2.0 at phi = 0.
+    assert controller.reference(0.0) == pytest.approx(0.0, abs=1e-6)
+    assert command == pytest.approx(2.0 * np.sin(0.5 - np.pi), abs=1e-5)
+
+
+def test_low_level_controller_shares_tables() -> None:
+    """Test that controllers with equal gait shapes share one table."""
+    # Arrange
+    gait_shape = np.cos(np.linspace(0, 2 * np.pi, 100))
+
+    # Act
+    first = LowLevelController(gait_shape=gait_shape)
+    second = LowLevelController(kp=1.0, gait_shape=gait_shape.copy())
+    other = LowLevelController(gait_shape=-gait_shape)
+    coarse = LowLevelController(gait_shape=gait_shape, table_size=64)
+
+    # Assert
+    assert first.table is second.table
+    assert first.table is not other.table
+    assert first.table is not coarse.table
+    assert LowLevelController().table is LowLevelController().table
+
+
+def test_multi_joint_controller_matches_single_joints() -> None:
+    """Test that stacked references match one controller per joint."""
+    # Arrange
+    x = np.linspace(0, 2 * np.pi, 100)
+    shapes = {"hip": np.sin(x), "knee": 0.5 * np.cos(2 * x), "ankle": None}
+    phi = np.linspace(0.0, 2 * np.pi, 200, endpoint=False)
+    omega = 6.0
+
+    # Act
+    controller = MultiJointController(shapes)
+    singles = [LowLevelController(gait_shape=shape) for shape in shapes.values()]
+    references = controller.reference(phi)
+    velocities = controller.velocity(phi, omega)
+
+    # Assert
+    assert controller.joints == ("hip", "knee", "ankle")
+    assert references.shape == velocities.shape == (3, 200)
+    for joint, single in enumerate(singles):
+        np.testing.assert_allclose(references[joint], single.reference(phi), atol=1e-9)
+        np.testing.assert_allclose(
+            velocities[joint],
+            single.spline.derivative()(np.mod(phi - np.pi, 2 * np.pi)) * omega,
+            atol=1e-5,
+        )
+    np.testing.assert_allclose(
+        controller.reference(1.0),
+        [single.reference(1.0) for single in singles],
+        rtol=0,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        controller.reference(float(phi[31])), references[:, 31], rtol=0, atol=1e-15
+    )
+    assert MultiJointController(shapes).table is controller.table
+
+
+def test_pid_bank_matches_controllers() -> None:
+    """Test that a PID bank gives the outputs of one PID controller per joint."""
+    # Arrange
+    gains = np.array([[5.0, 0.5, 0.1], [2.0, 0.0, 0.3]])
+    bank = PIDBank(2, kp=gains[:, 0], ki=gains[:, 1], kd=gains[:, 2])
+    singles = [PIDController(*joint_gains) for joint_gains in gains]
+    errors = np.random.default_rng(0).normal(size=(50, 2))
+
+    # Act
+    outputs = [bank.compute(error, dt=0.01) for error in errors]
+    expected = [
+        [pid.compute(e, dt=0.01) for pid, e in zip(singles, error, strict=True)]
+        for error in errors
+    ]
+
+    # Assert
+    np.testing.assert_allclose(outputs, expected, rtol=1e-12)
@@ -1,6 +1,7 @@
 """Tests for the base classes."""
 
 import numpy as np
+import pytest
 
 from adaptive_oscillator.base_classes import AngleXYZ, Quaternion, VectorXYZ
 
@@ -73,3 +74,33 @@ def test_quaternion():
         assert quat.y == exp_quat.y
         assert quat.z == exp_quat.z
         assert quat.w == exp_quat.w
+
+
+def test_vector_xyz_views():
+    """Test that the components and indexing are views of one contiguous array."""
+    # Arrange
+    data = np.arange(12, dtype=float).reshape(4, 3)
+
+    # Act
+    vec_xyz = VectorXYZ(data=data)
+    vec_xyz.y = 0.0
+
+    # Assert
+    assert vec_xyz.data.flags.c_contiguous
+    assert np.shares_memory(vec_xyz.x, vec_xyz.data)
+    assert np.shares_memory(vec_xyz[1], vec_xyz.data)
+    assert np.shares_memory(vec_xyz[:], vec_xyz.data)
+    np.testing.assert_array_equal(vec_xyz[1], [3.0, 0.0, 5.0])
+    np.testing.assert_array_equal(vec_xyz[:][2], data[:, 2])
+
+
+def test_quaternion_shape():
+    """Test that data with the wrong number of components is rejected."""
+    # Arrange
+    data = np.zeros((4, 3))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="shape"):
+        Quaternion(data=data)
+    with pytest.raises(ValueError, match="either"):
+        Quaternion(w=np.zeros(4), data=np.zeros((4, 4)))
@@ -0,0 +1,101 @@
+"""Test the log cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.definitions import LOG_CACHE_DIR, LogFileKeys
+from adaptive_oscillator.utils.cache_utils import LogCache
+from adaptive_oscillator.utils.reader_utils import read_log_file
+
+TEST_DIR = Path(__file__).parent.parent / "data" / "walk_4"
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """Copy a log file into a temporary directory."""
+    filepath = tmp_path / f"{LogFileKeys.ANGLE}_left.txt"
+    shutil.copy(TEST_DIR / filepath.name, filepath)
+    return filepath
+
+
+def test_log_cache_round_trip(log_file: Path) -> None:
+    """Test that a cached table is memory-mapped and matches the text file."""
+    # Arrange
+    cache = LogCache()
+    expected = read_log_file(log_file)
+
+    # Act
+    first = cache.load(log_file)
+    second = cache.load(log_file)
+
+    # Assert
+    assert cache.entry_for(log_file).parent == log_file.parent / LOG_CACHE_DIR
+    assert isinstance(second.values, np.memmap)
+    assert second.columns == expected.columns
+    np.testing.assert_array_equal(first.values, expected.values)
+    np.testing.assert_array_equal(second.values, expected.values)
+    np.testing.assert_array_equal(second.time, expected.time)
+
+
+@pytest.mark.parametrize("content_hash", [False, True])
+def test_log_cache_invalidates_stale_entries(
+    log_file: Path, tmp_path: Path, content_hash: bool
+) -> None:
+    """Test that a changed log file replaces its cache entry."""
+    # Arrange
+    cache = LogCache(cache_dir=tmp_path / "cache", content_hash=content_hash)
+    old_entry = cache.entry_for(log_file)
+    cache.load(log_file)
+    lines = log_file.read_text().splitlines(keepends=True)
+
+    # Act
+    log_file.write_text("".join(lines[:-10]))
+    table = cache.load(log_file)
+
+    # Assert
+    assert not old_entry.exists()
+    assert cache.entry_for(log_file).is_dir()
+    assert len(table) == len(lines) - 11
+
+
+def test_log_cache_keeps_other_dtypes(log_file: Path, tmp_path: Path) -> None:
+    """Test that loading a log as another dtype keeps the first entry."""
+    # Arrange
+    cache = LogCache(cache_dir=tmp_path / "cache")
+
+    # Act
+    cache.load(log_file, dtype=np.float32)
+    cache.load(log_file, dtype=np.float64)
+
+    # Assert
+    assert cache.entry_for(log_file, np.float32).is_dir()
+    assert cache.entry_for(log_file, np.float64).is_dir()
+
+
+def test_log_cache_eviction(tmp_path: Path) -> None:
+    """Test that the least recently used entries are evicted."""
+    # Arrange
+    filepaths = []
+    for category in [LogFileKeys.ANGLE, LogFileKeys.ACCEL, LogFileKeys.QUAT]:
+        filepath = tmp_path / f"{category}_left.txt"
+        shutil.copy(TEST_DIR / filepath.name, filepath)
+        filepaths.append(filepath)
+    cache_dir = tmp_path / "cache"
+    LogCache(cache_dir=cache_dir, max_bytes=None).load(filepaths[0])
+    entry_bytes = sum(
+        path.stat().st_size for path in cache_dir.rglob("*") if path.is_file()
+    )
+    cache = LogCache(cache_dir=cache_dir, max_bytes=2 * entry_bytes)
+    os.utime(cache.entry_for(filepaths[0]), (0, 0))
+
+    # Act
+    for filepath in filepaths[1:]:
+        cache.load(filepath)
+
+    # Assert
+    assert not cache.entry_for(filepaths[0]).exists()
+    assert cache.entry_for(filepaths[-1]).is_dir()
@@ -0,0 +1,93 @@
+"""Tests for compressed log support."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.definitions import LogFileKeys
+from adaptive_oscillator.utils.compression_utils import (
+    available_codecs,
+    convert_log_dir,
+    find_log_file,
+    open_log,
+)
+from adaptive_oscillator.utils.index_utils import read_log_window
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
+from adaptive_oscillator.utils.reader_utils import read_log_file
+
+LOG_DIR = Path(__file__).parent.parent / "data" / "walk_5"
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_convert_and_parse(tmp_path: Path, codec: str):
+    """Test that compressed logs parse to the same data as plain text."""
+    # Arrange
+    expected = LogParser(LogFiles(LOG_DIR), sides=["left"])
+
+    # Act
+    written = convert_log_dir(LOG_DIR, codec=codec, output_dir=tmp_path, level=1)
+    log_files = LogFiles(tmp_path)
+    log_data = LogParser(log_files, sides=["left"])
+
+    # Assert
+    assert len(written) == len(list(LOG_DIR.glob("*.txt")))
+    assert log_files.angle.left == tmp_path / f"Angles_left.txt{codec}"
+    assert log_data.files_touched == [
+        tmp_path / f"{path.name}{codec}" for path in expected.files_touched
+    ]
+    np.testing.assert_array_equal(log_data.time, expected.time)
+    for key, parser in expected.parsers.items():
+        np.testing.assert_array_equal(log_data.parsers[key].time, parser.time)
+    np.testing.assert_array_equal(
+        log_data.data.left.foot.quat.data, expected.data.left.foot.quat.data
+    )
+
+
+def test_convert_back_to_plain(tmp_path: Path):
+    """Test recompressing in place and converting back to plain text."""
+    # Arrange
+    source = LOG_DIR / "Gyroscopes_right.txt"
+    (tmp_path / source.name).write_bytes(source.read_bytes())
+
+    # Act
+    convert_log_dir(tmp_path, codec=".gz", remove_source=True)
+    compressed = find_log_file(tmp_path / source.name)
+    convert_log_dir(tmp_path, codec="", remove_source=True)
+
+    # Assert
+    assert compressed == tmp_path / "Gyroscopes_right.txt.gz"
+    assert not compressed.exists()
+    assert (tmp_path / source.name).read_bytes() == source.read_bytes()
+    with pytest.raises(ValueError, match="codec"):
+        convert_log_dir(tmp_path, codec=".rar")
+
+
+def test_compressed_window(tmp_path: Path):
+    """Test seeking into a compressed log through the time index."""
+    # Arrange
+    convert_log_dir(LOG_DIR, codec=".xz", output_dir=tmp_path, level=0)
+    filepath = tmp_path / f"{LogFileKeys.ANGLE}_left.txt.xz"
+    table = read_log_file(LOG_DIR / f"{LogFileKeys.ANGLE}_left.txt")
+    t0 = table.time[0]
+
+    # Act
+    window = read_log_window(filepath, start=30.0, end=31.0)
+
+    # Assert
+    expected = table.between(t0 + 30.0, t0 + 31.0)
+    np.testing.assert_array_equal(window.time, expected.time)
+    np.testing.assert_array_equal(window.values, expected.values)
+
+
+def test_open_log_streams(tmp_path: Path):
+    """Test that compressed logs are read as a decompressed byte stream."""
+    # Arrange
+    convert_log_dir(LOG_DIR, codec=".bz2", output_dir=tmp_path, level=1)
+
+    # Act
+    with open_log(tmp_path / "Angles_right.txt.bz2") as file:
+        header = file.readline()
+
+    # Assert
+    assert header == (LOG_DIR / "Angles_right.txt").read_bytes().split(b"\n")[0] + b"\n"
@@ -1,6 +1,17 @@
 """Integration test for the controller.py module."""
 
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
 from adaptive_oscillator.controller import AOController
+from adaptive_oscillator.definitions import LOG_CACHE_DIR
+from adaptive_oscillator.oscillator import sample_walking_data
+from adaptive_oscillator.recorder import RecorderFields
+from adaptive_oscillator.scheduler import DeadlineScheduler
+from adaptive_oscillator.utils.index_utils import index_path_for
 
 
 def test_ao_controller():
@@ -11,3 +22,113 @@ def test_ao_controller():
     # Act
     controller = AOController(show_plots=False)
     controller.replay(log_dir=log_dir)
+
+
+def test_ao_controller_resampled():
+    """Test replaying a log on a uniform time grid."""
+    # Arrange
+    log_dir = "data/walk_5"
+
+    # Act
+    controller = AOController(show_plots=False)
+    controller.replay(log_dir=log_dir, resample_hz=100.0)
+
+    # Assert
+    dt = np.diff(controller.recorder.column(RecorderFields.TIME))
+    np.testing.assert_allclose(dt, 0.01, atol=1e-9)
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 20])
+def test_ao_controller_step_block(block_size: int):
+    """Test that block steps match frame-by-frame steps."""
+    # Arrange
+    t_vals, theta_il, theta_il_dot = sample_walking_data(period=0.5, t_end=5.0)
+    frame_controller = AOController(show_plots=False)
+    block_controller = AOController(show_plots=False)
+
+    # Act
+    for t, th, dth in zip(t_vals, theta_il, theta_il_dot, strict=True):
+        frame_controller.step(t=t, th=th, dth=dth)
+    theta_m: list[float] = []
+    for start in range(0, len(t_vals), block_size):
+        block = slice(start, start + block_size)
+        output = block_controller.step_block(
+            t=t_vals[block], th=theta_il[block], dth=theta_il_dot[block]
+        )
+        theta_m.extend(output.theta_m)
+
+    # Assert
+    np.testing.assert_array_equal(theta_m, frame_controller.motor_output)
+    np.testing.assert_array_equal(
+        block_controller.motor_output, frame_controller.motor_output
+    )
+    np.testing.assert_array_equal(
+        block_controller.theta_hat_output, frame_controller.theta_hat_output
+    )
+    np.testing.assert_array_equal(
+        block_controller.phi_gp_output, frame_controller.phi_gp_output
+    )
+    np.testing.assert_array_equal(block_controller.omegas, frame_controller.omegas)
+
+
+def test_ao_controller_window(tmp_path: Path):
+    """Test replaying a time window of a log."""
+    # Arrange
+    log_dir = Path("data/walk_5")
+
+    # Act
+    controller = AOController(show_plots=False)
+    controller.replay(log_dir=log_dir, start=10.0, end=20.0, index_dir=tmp_path)
+
+    # Assert
+    t = controller.recorder.column(RecorderFields.TIME)
+    assert 0.0 == t[0]
+    assert 9.9 < t[-1] <= 10.0
+    assert index_path_for(log_dir / "Angles_left.txt", tmp_path).is_file()
+    assert not (log_dir / LOG_CACHE_DIR).exists()
+
+
+def test_ao_controller_warm_start(tmp_path: Path):
+    """Test replaying a log with the oscillator seeded by a spectral fit."""
+    # Arrange
+    log_dir = "data/walk_4"
+
+    # Act
+    cold = AOController(show_plots=False)
+    cold.replay(log_dir=log_dir, end=20.0, index_dir=tmp_path)
+    warm = AOController(show_plots=False)
+    warm.replay(log_dir=log_dir, end=20.0, warm_start=5.0, index_dir=tmp_path)
+
+    # Assert
+    assert 5.0 < warm.omegas[0] < 6.0
+    assert 5.0 < warm.omegas[-1] < 6.0
+    assert not 5.0 < cold.omegas[-1] < 6.0
+    with pytest.raises(ValueError, match="either"):
+        warm.replay(log_dir=log_dir, initial_state=warm.snapshot(), warm_start=5.0)
+
+
+@pytest.mark.parametrize("speed", [None, 8.0])
+def test_ao_controller_paced_replay(speed: float | None, tmp_path: Path):
+    """Test that pacing a replay changes its timing but not its results."""
+    # Arrange
+    log_dir = "data/walk_5"
+    expected = AOController(show_plots=False)
+    expected.replay(log_dir=log_dir, end=2.0, index_dir=tmp_path)
+    controller = AOController(
+        show_plots=False, scheduler=DeadlineScheduler(speed=speed)
+    )
+
+    # Act
+    start = time.perf_counter()
+    controller.replay(log_dir=log_dir, end=2.0, index_dir=tmp_path)
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    t = controller.recorder.column(RecorderFields.TIME)
+    if speed is not None:
+        assert elapsed >= t[-1] / speed
+        assert controller.scheduler.stats().frames == len(t)
+    for field in (RecorderFields.PHI, RecorderFields.THETA_M):
+        np.testing.assert_array_equal(
+            controller.recorder.column(field), expected.recorder.column(field)
+        )
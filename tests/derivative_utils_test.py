@@ -0,0 +1,42 @@
+"""Test the derivative utilities."""
+
+import numpy as np
+
+from adaptive_oscillator.utils.derivative_utils import (
+    BackwardDifference,
+    backward_difference,
+)
+
+
+def test_backward_difference() -> None:
+    """Test slopes of a sampled line, with a repeated timestamp."""
+    # Arrange
+    t = np.array([0.0, 0.1, 0.2, 0.2, 0.4])
+    x = 3.0 * t + 1.0
+
+    # Act
+    slope = backward_difference(t, x)
+
+    # Assert
+    np.testing.assert_allclose(slope, [3.0, 3.0, 3.0, 0.0, 3.0])
+    assert len(backward_difference(np.array([]), np.array([]))) == 0
+
+
+def test_backward_difference_chunks() -> None:
+    """Test that chunked slopes match the slopes of the whole signal."""
+    # Arrange
+    t = np.cumsum(np.random.default_rng(0).uniform(0.005, 0.015, 100))
+    x = np.sin(2 * np.pi * t)
+    derivative = BackwardDifference()
+
+    # Act
+    chunks = [derivative(t[ii : ii + 7], x[ii : ii + 7]) for ii in range(0, 100, 7)]
+
+    # Assert
+    np.testing.assert_array_equal(np.concatenate(chunks), backward_difference(t, x))
+    midpoints = (t[1:] + t[:-1]) / 2
+    np.testing.assert_allclose(
+        backward_difference(t, x)[1:],
+        2 * np.pi * np.cos(2 * np.pi * midpoints),
+        atol=0.01,
+    )
@@ -0,0 +1,158 @@
+"""Tests for the sidecar time index."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.definitions import LOG_CACHE_DIR, LogFileKeys
+from adaptive_oscillator.utils.cache_utils import LogCache
+from adaptive_oscillator.utils.index_utils import (
+    LogIndex,
+    index_path_for,
+    read_log_window,
+)
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
+from adaptive_oscillator.utils.reader_utils import read_log_file
+
+LOG_DIR = Path(__file__).parent.parent / "data" / "walk_5"
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path) -> Path:
+    """Return a copy of a log directory, so sidecar files stay out of the repo."""
+    return Path(shutil.copytree(LOG_DIR, tmp_path / LOG_DIR.name))
+
+
+def test_build_index(log_dir: Path):
+    """Test that the index points at every stride-th sample line."""
+    # Arrange
+    filepath = log_dir / "Angles_left.txt"
+    table = read_log_file(filepath)
+    lines = filepath.read_bytes().split(b"\n")
+
+    # Act
+    index = LogIndex.build(filepath, stride=100)
+
+    # Assert
+    np.testing.assert_array_equal(index.times, table.time[::100])
+    line_starts = np.cumsum([0] + [len(line) + 1 for line in lines[:-1]])
+    np.testing.assert_array_equal(index.offsets, line_starts[1::100][: len(index)])
+
+
+def test_load_index(log_dir: Path):
+    """Test that the sidecar is reused and rebuilt once the log changes."""
+    # Arrange
+    filepath = log_dir / "Angles_left.txt"
+
+    # Act
+    index = LogIndex.load(filepath)
+    reloaded = LogIndex.load(filepath)
+    with open(filepath, "ab") as file:
+        file.write(file_tail(filepath))
+    rebuilt = LogIndex.load(filepath)
+
+    # Assert
+    assert index_path_for(filepath).is_file()
+    np.testing.assert_array_equal(reloaded.offsets, index.offsets)
+    assert rebuilt.size > index.size
+
+
+def test_load_index_elsewhere(log_dir: Path, tmp_path: Path):
+    """Test an index directory of its own and a log directory it cannot write."""
+    # Arrange
+    filepath = log_dir / "Angles_left.txt"
+    index_dir = tmp_path / "indexes"
+    # A file where the cache directory should be makes every write fail.
+    shutil.rmtree(log_dir / LOG_CACHE_DIR, ignore_errors=True)
+    (log_dir / LOG_CACHE_DIR).write_text("")
+
+    # Act
+    kept = LogIndex.load(filepath, index_dir=index_dir)
+    unkept = LogIndex.load(filepath)
+    table = read_log_window(filepath, 10.0, 20.0)
+
+    # Assert
+    assert index_path_for(filepath, index_dir).parent == index_dir
+    # The index is moved into place, so no temporary file is left behind.
+    assert list(index_dir.iterdir()) == [index_path_for(filepath, index_dir)]
+    np.testing.assert_array_equal(kept.offsets, unkept.offsets)
+    assert len(table) > 0
+
+
+def file_tail(filepath: Path) -> bytes:
+    """Return the last sample line of a log file."""
+    return filepath.read_bytes().rstrip(b"\n").rsplit(b"\n", 1)[1] + b"\n"
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [(None, None), (10.0, 20.0), (0.0, 5.0), (None, 3.0), (55.0, None), (70.0, 80.0)],
+)
+def test_read_log_window(log_dir: Path, start: float | None, end: float | None):
+    """Test that a window read equals the same window of a full read."""
+    # Arrange
+    filepath = log_dir / "Quaternions_right.txt"
+    table = read_log_file(filepath)
+    t0 = table.time[0]
+    expected = table.between(
+        None if start is None else t0 + start, None if end is None else t0 + end
+    )
+
+    # Act
+    window = read_log_window(filepath, start, end)
+
+    # Assert
+    np.testing.assert_array_equal(window.time, expected.time)
+    np.testing.assert_array_equal(window.values, expected.values)
+
+
+def test_read_log_window_midnight(tmp_path: Path):
+    """Test seeking into a recording that spans midnight."""
+    # Arrange
+    filepath = tmp_path / "Angles_left.txt"
+    seconds = 86390.0 + 0.01 * np.arange(2000)
+    stamps = [
+        f"{int(s // 3600) % 24:02d}:{int(s // 60) % 60:02d}:{s % 60:09.6f}"
+        for s in seconds
+    ]
+    filepath.write_text(
+        "Time\tHip_x\n" + "".join(f"{t}\t{i}\n" for i, t in enumerate(stamps))
+    )
+
+    # Act
+    window = read_log_window(filepath, start=15.0, end=16.0)
+
+    # Assert
+    np.testing.assert_allclose(window.time, seconds[1500:1601])
+    np.testing.assert_array_equal(window.values[:, 0], np.arange(1500, 1601))
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_log_parser_window(log_dir: Path, tmp_path: Path, use_cache: bool):
+    """Test that LogParser parses only the requested window."""
+    # Arrange
+    log_files = LogFiles(log_dir)
+    cache = LogCache(tmp_path / "cache") if use_cache else None
+    full = LogParser(log_files, sides=["left"], categories=[LogFileKeys.ANGLE])
+    t0 = full.time[0]
+    keep = (full.time >= t0 + 12.5) & (full.time <= t0 + 20.0)
+
+    # Act
+    log_data = LogParser(
+        log_files,
+        cache=cache,
+        sides=["left"],
+        categories=[LogFileKeys.ANGLE],
+        start=12.5,
+        end=20.0,
+        index_dir=tmp_path / "indexes",
+    )
+
+    # Assert
+    assert (tmp_path / "indexes").is_dir() != use_cache
+    np.testing.assert_array_equal(log_data.time, full.time[keep])
+    np.testing.assert_array_equal(
+        log_data.data.left.knee.angles.data, full.data.left.knee.angles.data[keep]
+    )
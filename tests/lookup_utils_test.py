@@ -0,0 +1,110 @@
+"""Tests for the phase lookup tables."""
+
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.definitions import PHASE_TABLE_CACHE_SIZE
+from adaptive_oscillator.utils import lookup_utils
+from adaptive_oscillator.utils.lookup_utils import PhaseTable, cached_table
+
+
+@pytest.mark.parametrize(
+    "method, bound",
+    [
+        # Interpolation error bounds h^2/8 max|f''| and h^4/384 max|f''''|.
+        ("linear", (2 * np.pi / 64) ** 2 / 8),
+        ("hermite", (2 * np.pi / 64) ** 4 / 384),
+    ],
+)
+def test_phase_table_error_bound(method: str, bound: float):
+    """Test that lookups of a sine stay within the interpolation error bound."""
+    # Arrange
+    phi = np.random.default_rng(0).uniform(0.0, 2 * np.pi, 1000)
+
+    # Act
+    table = PhaseTable.sample(np.sin, np.cos, size=64, method=method)
+
+    # Assert
+    assert table.max_error <= bound
+    np.testing.assert_allclose(table(phi), np.sin(phi), atol=bound)
+    np.testing.assert_allclose(table.derivative(phi), np.cos(phi), atol=1e2 * bound)
+
+
+def test_phase_table_lookups():
+    """Test that scalar, array and wrapped lookups agree."""
+    # Arrange
+    table = PhaseTable.sample(np.sin, np.cos, size=256)
+    phi = np.linspace(0.0, 2 * np.pi, 50, endpoint=False)
+
+    # Act
+    values = table(phi)
+    scalars = [table(float(phi_ii)) for phi_ii in phi]
+    wrapped = table(phi - 4 * np.pi)
+
+    # Assert
+    assert isinstance(scalars[0], float)
+    np.testing.assert_allclose(scalars, values, rtol=0, atol=1e-15)
+    np.testing.assert_allclose(wrapped, values, atol=1e-12)
+    assert table(np.zeros((2, 3))).shape == (2, 3)
+    assert np.isnan(table(np.nan))
+    assert np.isnan(table(np.inf))
+
+
+def test_phase_table_stacked():
+    """Test that a stacked table looks up every function at once."""
+    # Arrange
+    table = PhaseTable.sample(
+        lambda phi: np.stack([np.sin(phi), np.cos(phi)]),
+        lambda phi: np.stack([np.cos(phi), -np.sin(phi)]),
+        size=256,
+    )
+    phi = np.array([0.1, 1.0, 4.0])
+
+    # Act
+    values = table(phi)
+
+    # Assert
+    assert values.shape == (2, 3)
+    np.testing.assert_allclose(values, [np.sin(phi), np.cos(phi)], atol=1e-8)
+    np.testing.assert_allclose(table(0.5), [np.sin(0.5), np.cos(0.5)], atol=1e-8)
+    assert np.isnan(table(-np.inf)).all()
+
+
+def test_phase_table_read_only():
+    """Test that shared tables cannot be modified and invalid tables are rejected."""
+    # Arrange
+    table = PhaseTable.sample(np.sin, np.cos, size=16)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="read-only"):
+        table.coeffs[0, 0] = 1.0
+    with pytest.raises(ValueError, match="Unknown method"):
+        PhaseTable(table.values, table.slopes, method="cubic")
+    with pytest.raises(ValueError, match="same shape"):
+        PhaseTable(table.values, table.slopes[:-1], method="linear")
+
+
+def test_cached_table_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    """Test that the table cache keeps only the most recently used tables."""
+    # Arrange
+    tables: OrderedDict = OrderedDict()
+    monkeypatch.setattr(lookup_utils, "_TABLES", tables)
+    phases = np.linspace(0.0, 2 * np.pi, 9)
+
+    def build(offset: float) -> PhaseTable:
+        return PhaseTable(np.sin(phases) + offset, np.cos(phases), "hermite")
+
+    # Act
+    first = cached_table("shape-0", partial(build, 0.0), size=8)
+    second = cached_table("shape-1", partial(build, 1.0), size=8)
+    for ii in range(2, PHASE_TABLE_CACHE_SIZE + 1):
+        cached_table("shape-0", partial(build, 0.0), size=8)
+        cached_table(f"shape-{ii}", partial(build, float(ii)), size=8)
+
+    # Assert
+    assert len(tables) == PHASE_TABLE_CACHE_SIZE
+    assert cached_table("shape-0", partial(build, 0.0), size=8) is first
+    assert cached_table("shape-1", partial(build, 1.0), size=8) is not second
@@ -1,11 +1,14 @@
 """Test the parser modules."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from adaptive_oscillator.definitions import LogFileKeys
+from adaptive_oscillator.definitions import AnglesHeader, LogFileKeys
+from adaptive_oscillator.utils.cache_utils import LogCache
 from adaptive_oscillator.utils.parser_utils import (
     AngleParser,
     IMUParser,
@@ -13,6 +16,8 @@ from adaptive_oscillator.utils.parser_utils import (
     LogParser,
     QuaternionParser,
 )
+from adaptive_oscillator.utils.reader_utils import read_log_file
+from adaptive_oscillator.utils.time_utils import time_str_to_seconds
 
 TEST_DIR = Path(__file__).parent.parent / "data" / "walk_4"
 DECIMAL_ACCURACY = 2
@@ -218,3 +223,177 @@ def test_log_parser() -> None:
     np.testing.assert_array_equal(
         log_data.data.right.foot.time, log_data.data.left.foot.time
     )
+
+
+@pytest.mark.parametrize("log_dir", sorted(TEST_DIR.parent.glob("walk_*")))
+@pytest.mark.parametrize(
+    "category", [LogFileKeys.ACCEL, LogFileKeys.ANGLE, LogFileKeys.QUAT]
+)
+def test_read_log_file_matches_python_engine(log_dir: Path, category: str) -> None:
+    """Test the fast reader against pandas' Python engine."""
+    # Arrange
+    filepath = log_dir / f"{category}_left.txt"
+    expected = pd.read_csv(filepath, sep="\t+", engine="python")
+
+    # Act
+    table = read_log_file(filepath)
+
+    # Assert
+    assert table.columns == tuple(expected.columns[1:])
+    np.testing.assert_array_equal(table.values, expected.iloc[:, 1:].to_numpy())
+    np.testing.assert_array_equal(
+        table.time,
+        [time_str_to_seconds(t) for t in expected[AnglesHeader.TIME]],
+    )
+
+
+def test_read_log_file_float32() -> None:
+    """Test reading sensor values as float32."""
+    # Arrange
+    filepath = TEST_DIR / f"{LogFileKeys.ACCEL}_left.txt"
+
+    # Act
+    table = read_log_file(filepath, dtype=np.float32)
+
+    # Assert
+    assert table.values.dtype == np.float32
+    assert table.time.dtype == np.float64
+    np.testing.assert_allclose(table.values, read_log_file(filepath).values, rtol=1e-6)
+
+
+def test_log_parser_with_cache(tmp_path: Path) -> None:
+    """Test that a cached log parses to the same data."""
+    # Arrange
+    log_files = LogFiles(TEST_DIR)
+    cache = LogCache(cache_dir=tmp_path)
+
+    # Act
+    expected = LogParser(log_files)
+    LogParser(log_files, cache=cache)
+    log_data = LogParser(log_files, cache=cache)
+
+    # Assert
+    np.testing.assert_array_equal(log_data.time, expected.time)
+    np.testing.assert_array_equal(
+        log_data.data.left.hip.angles[:], expected.data.left.hip.angles[:]
+    )
+    np.testing.assert_array_equal(
+        log_data.data.right.foot.quat[:], expected.data.right.foot.quat[:]
+    )
+
+
+def test_log_parser_selection() -> None:
+    """Test that a selective parse only reads the requested files."""
+    # Arrange
+    log_files = LogFiles(TEST_DIR)
+
+    # Act
+    expected = LogParser(log_files)
+    log_data = LogParser(log_files, sides=["left"], categories=[LogFileKeys.ANGLE])
+
+    # Assert
+    assert len(expected.files_touched) == 8
+    assert log_data.files_touched == [log_files.angle.left]
+    np.testing.assert_array_equal(log_data.time, expected.time)
+    np.testing.assert_array_equal(
+        log_data.data.left.hip.angles[:], expected.data.left.hip.angles[:]
+    )
+    assert len(log_data.data.right.hip.angles) == 0
+    assert len(log_data.data.left.pelvis.accel) == 0
+
+
+def test_log_parser_unknown_selection() -> None:
+    """Test that unknown sides are rejected."""
+    # Act / Assert
+    with pytest.raises(ValueError, match="middle"):
+        LogParser(LogFiles(TEST_DIR), sides=["middle"])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_log_parser_concurrent(executor: str) -> None:
+    """Test that concurrent parsing gives the same data as serial parsing."""
+    # Arrange
+    log_files = LogFiles(TEST_DIR)
+
+    # Act
+    expected = LogParser(log_files)
+    log_data = LogParser(log_files, executor=executor)
+
+    # Assert
+    assert log_data.files_touched == expected.files_touched
+    for key, parser in expected.parsers.items():
+        np.testing.assert_array_equal(log_data.parsers[key].time, parser.time)
+    np.testing.assert_array_equal(
+        log_data.data.left.lower_leg.gyro[:], expected.data.left.lower_leg.gyro[:]
+    )
+    np.testing.assert_array_equal(
+        log_data.data.right.knee.angles[:], expected.data.right.knee.angles[:]
+    )
+
+
+def test_log_parser_external_executor() -> None:
+    """Test parsing with a caller-owned executor."""
+    # Arrange
+    log_files = LogFiles(TEST_DIR)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        log_data = LogParser(
+            log_files, categories=[LogFileKeys.QUAT], executor=executor
+        )
+
+    # Assert
+    assert log_data.files_touched == [log_files.quat.left, log_files.quat.right]
+
+
+@pytest.mark.parametrize("log_dir", sorted(TEST_DIR.parent.glob("walk_*")))
+def test_angles_from_quaternions(log_dir: Path) -> None:
+    """Test the derived joint angles against the logged Angles files.
+
+    The Angles logs are sampled independently of the Quaternions logs, so a few
+    percent of their rows hold an intermediate orientation. Every other row must
+    match exactly.
+    """
+    # Arrange
+    log_files = LogFiles(log_dir)
+    logged = LogParser(log_files, categories=[LogFileKeys.ANGLE])
+
+    # Act
+    derived = LogParser(
+        log_files, categories=[LogFileKeys.ANGLE], angles_from_quaternions=True
+    )
+
+    # Assert
+    assert derived.files_touched == [log_files.quat.left, log_files.quat.right]
+    for side in ("left", "right"):
+        for joint in ("hip", "knee", "ankle"):
+            expected = getattr(getattr(logged.data, side), joint)
+            actual = getattr(getattr(derived.data, side), joint)
+            np.testing.assert_array_equal(actual.time, expected.time)
+            error = np.abs(
+                (actual.angles.data - expected.angles.data + 180) % 360 - 180
+            )
+            matching = np.all(error < 1e-6, axis=1)
+            assert np.mean(matching) > 0.95
+
+
+def test_log_parser_resampled() -> None:
+    """Test that every file is resampled onto one uniform grid."""
+    # Arrange
+    log_files = LogFiles(TEST_DIR)
+    raw = LogParser(log_files, sides=["left"])
+
+    # Act
+    log_data = LogParser(log_files, sides=["left"], resample_hz=100.0)
+
+    # Assert
+    np.testing.assert_allclose(np.diff(log_data.time), 0.01, atol=1e-9)
+    assert len(log_data.dropped) == len(log_data.time)
+    assert 0 < np.count_nonzero(log_data.dropped) < 5
+    for parser in log_data.parsers.values():
+        assert parser.time is log_data.time
+    assert len(log_data.data.left.knee.angles) == len(log_data.time)
+    np.testing.assert_allclose(
+        np.interp(log_data.time, raw.time, raw.data.left.foot.accel.x),
+        log_data.data.left.foot.accel.x,
+    )
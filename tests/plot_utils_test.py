@@ -1,6 +1,7 @@
 """Integration test for the plot_utils.py module."""
 
-from adaptive_oscillator.utils.parser_utils import LogFiles
+from adaptive_oscillator.definitions import LogFileKeys
+from adaptive_oscillator.utils.parser_utils import LogFiles, LogParser
 
 
 def test_plot_log_data():
@@ -11,3 +12,14 @@ def test_plot_log_data():
 
     # Act
     log_files.plot()
+
+
+def test_plot_log_data_from_parser():
+    """Test plotting from already parsed log data."""
+    # Arrange
+    log_dir = "data/walk_5"
+    log_files = LogFiles(log_dir)
+    log_data = LogParser(log_files, categories=[LogFileKeys.ACCEL, LogFileKeys.QUAT])
+
+    # Act
+    log_files.plot(log_parser=log_data)
@@ -0,0 +1,166 @@
+"""Tests for the quaternion kernels."""
+
+import itertools
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation, Slerp
+
+from adaptive_oscillator.base_classes import AngleXYZ, Quaternion, VectorXYZ
+from adaptive_oscillator.utils.quaternion_utils import (
+    euler_to_quat,
+    quat_conjugate,
+    quat_inverse,
+    quat_multiply,
+    quat_normalize,
+    quat_relative,
+    quat_rotate,
+    quat_slerp,
+    quat_to_euler,
+)
+
+SEQUENCES = [
+    "".join(axes)
+    for letters in ("xyz", "XYZ")
+    for axes in itertools.permutations(letters)
+]
+
+
+def random_quats(n: int, seed: int = 0) -> np.ndarray:
+    """Return random unit quaternions, scalar first."""
+    return Rotation.random(n, random_state=seed).as_quat(scalar_first=True)
+
+
+def same_rotation(q_a: np.ndarray, q_b: np.ndarray) -> bool:
+    """Return whether two quaternion arrays describe the same rotations."""
+    return bool(np.allclose(np.abs(np.einsum("ij,ij->i", q_a, q_b)), 1.0))
+
+
+def test_multiply_matches_scipy():
+    """Test the Hamilton product against scipy's rotation composition."""
+    # Arrange
+    q_a, q_b = random_quats(100, seed=1), random_quats(100, seed=2)
+    expected = (
+        Rotation.from_quat(q_a, scalar_first=True)
+        * Rotation.from_quat(q_b, scalar_first=True)
+    ).as_quat(scalar_first=True)
+
+    # Act
+    product = quat_multiply(q_a, q_b)
+    in_place = q_a.copy()
+    quat_multiply(in_place, q_b, out=in_place)
+
+    # Assert
+    assert same_rotation(product, expected)
+    np.testing.assert_array_equal(in_place, product)
+
+
+def test_inverse_and_conjugate():
+    """Test that q * q^-1 is the identity."""
+    # Arrange
+    q = random_quats(50) * 3.0
+
+    # Act
+    identity = quat_multiply(q, quat_inverse(q))
+    unit = quat_normalize(q)
+
+    # Assert
+    np.testing.assert_allclose(identity, np.tile([1.0, 0, 0, 0], (50, 1)), atol=1e-12)
+    np.testing.assert_allclose(quat_conjugate(unit), quat_inverse(unit), atol=1e-12)
+
+
+def test_relative_and_rotate():
+    """Test relative rotations and vector rotation against scipy."""
+    # Arrange
+    parent, child = random_quats(100, seed=3), random_quats(100, seed=4)
+    vectors = np.random.default_rng(0).normal(size=(100, 3))
+    r_parent = Rotation.from_quat(parent, scalar_first=True)
+    r_child = Rotation.from_quat(child, scalar_first=True)
+
+    # Act
+    relative = quat_relative(parent, child)
+    rotated = quat_rotate(child, vectors)
+
+    # Assert
+    assert same_rotation(
+        relative, (r_parent.inv() * r_child).as_quat(scalar_first=True)
+    )
+    np.testing.assert_allclose(rotated, r_child.apply(vectors), atol=1e-12)
+
+
+@pytest.mark.parametrize("sequence", SEQUENCES)
+def test_euler_matches_scipy(sequence: str):
+    """Test the Euler conversions against scipy for every Tait-Bryan sequence."""
+    # Arrange
+    q = random_quats(200, seed=5)
+    expected = Rotation.from_quat(q, scalar_first=True).as_euler(sequence, degrees=True)
+
+    # Act
+    angles = quat_to_euler(q, sequence=sequence)
+    round_trip = euler_to_quat(angles, sequence=sequence)
+
+    # Assert
+    np.testing.assert_allclose(angles, expected, atol=1e-8)
+    assert same_rotation(round_trip, q)
+
+
+def test_euler_invalid_sequence():
+    """Test that proper Euler and mixed case sequences are rejected."""
+    # Arrange
+    q = random_quats(2)
+
+    # Act / Assert
+    for sequence in ("xyx", "xYz", "xy"):
+        with pytest.raises(ValueError, match="permutation"):
+            quat_to_euler(q, sequence=sequence)
+
+
+def test_slerp_matches_scipy():
+    """Test slerp resampling against scipy."""
+    # Arrange
+    time = np.cumsum(np.full(20, 0.01))
+    q = random_quats(20, seed=6)
+    new_time = np.linspace(time[0], time[-1], 57)
+    expected = Slerp(time, Rotation.from_quat(q, scalar_first=True))(new_time)
+
+    # Act
+    resampled = quat_slerp(time, q, new_time)
+
+    # Assert
+    assert same_rotation(resampled, expected.as_quat(scalar_first=True))
+    np.testing.assert_allclose(np.linalg.norm(resampled, axis=1), 1.0)
+
+
+def test_slerp_repeated_times():
+    """Test that repeated sample times give the earlier sample instead of NaN."""
+    # Arrange
+    time = np.array([0.0, 1.0, 1.0])
+    q = random_quats(3, seed=9)
+
+    # Act
+    with np.errstate(all="raise"):
+        resampled = quat_slerp(time, q, np.array([0.5, 1.0, 2.0]))
+
+    # Assert
+    assert np.isfinite(resampled).all()
+    assert same_rotation(resampled[1:], q[[1, 1]])
+    np.testing.assert_allclose(np.linalg.norm(resampled, axis=1), 1.0)
+
+
+def test_quaternion_methods():
+    """Test the kernel wrappers on the Quaternion class."""
+    # Arrange
+    quat = Quaternion(data=random_quats(30, seed=7))
+    parent = Quaternion(data=random_quats(30, seed=8))
+    accel = VectorXYZ(data=np.ones((30, 3)))
+
+    # Act
+    angles = quat.to_euler("zyx")
+    relative = quat.relative_to(parent)
+    rotated = quat.rotate(accel)
+
+    # Assert
+    assert isinstance(angles, AngleXYZ)
+    assert same_rotation(Quaternion.from_euler(angles, "zyx").data, quat.data)
+    assert same_rotation((parent * relative).data, quat.data)
+    np.testing.assert_allclose(np.linalg.norm(rotated.data, axis=1), np.sqrt(3))
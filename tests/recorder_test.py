@@ -0,0 +1,107 @@
+"""Test the recorder module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.recorder import AORecorder, RecorderFields
+
+FIELDS = (RecorderFields.TIME, RecorderFields.OMEGA)
+
+
+def test_recorder_grows() -> None:
+    """Test that a growable recorder keeps every record."""
+    # Arrange
+    recorder = AORecorder(capacity=4, fields=FIELDS)
+    t_vals = np.arange(10.0)
+
+    # Act
+    for t in t_vals[:3]:
+        recorder.append(t=t, omega=2 * t)
+    recorder.extend(t=t_vals[3:], omega=2 * t_vals[3:])
+
+    # Assert
+    assert len(recorder) == 10
+    assert recorder.capacity >= 10
+    np.testing.assert_array_equal(recorder.column(RecorderFields.TIME), t_vals)
+    np.testing.assert_array_equal(recorder.column(RecorderFields.OMEGA), 2 * t_vals)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7])
+def test_recorder_ring(block_size: int) -> None:
+    """Test that a ring recorder keeps the latest records in order."""
+    # Arrange
+    capacity = 5
+    recorder = AORecorder(capacity=capacity, ring=True, fields=FIELDS)
+    t_vals = np.arange(23.0)
+
+    # Act
+    for start in range(0, len(t_vals), block_size):
+        block = t_vals[start : start + block_size]
+        recorder.extend(t=block, omega=2 * block)
+
+    # Assert
+    assert len(recorder) == capacity
+    assert recorder.capacity == capacity
+    assert recorder.total == len(t_vals)
+    np.testing.assert_array_equal(
+        recorder.column(RecorderFields.TIME), t_vals[-capacity:]
+    )
+    np.testing.assert_array_equal(
+        recorder.column(RecorderFields.OMEGA), 2 * t_vals[-capacity:]
+    )
+
+
+@pytest.mark.parametrize("ring", [False, True])
+def test_recorder_missing_fields(ring: bool) -> None:
+    """Test that fields left out of a record are recorded as NaN."""
+    # Arrange
+    recorder = AORecorder(capacity=3, ring=ring, fields=FIELDS)
+    t_vals = np.arange(3.0)
+    recorder.extend(t=t_vals, omega=2 * t_vals)
+
+    # Act
+    recorder.append(t=3.0)
+    recorder.extend(t=np.array([4.0, 5.0]))
+
+    # Assert
+    omega = recorder.column(RecorderFields.OMEGA)
+    np.testing.assert_array_equal(recorder.column(RecorderFields.TIME)[-3:], [3, 4, 5])
+    assert np.isnan(omega[-3:]).all()
+    np.testing.assert_array_equal(omega[:-3], 2 * t_vals[: len(omega) - 3])
+
+
+def test_recorder_save_npz(tmp_path: Path) -> None:
+    """Test the npz export."""
+    # Arrange
+    recorder = AORecorder(capacity=3, ring=True, fields=FIELDS)
+    t_vals = np.arange(5.0)
+    recorder.extend(t=t_vals, omega=2 * t_vals)
+
+    # Act
+    filepath = recorder.save_npz(tmp_path / "record.npz")
+
+    # Assert
+    with np.load(filepath) as data:
+        np.testing.assert_array_equal(data[RecorderFields.TIME], t_vals[-3:])
+        np.testing.assert_array_equal(data[RecorderFields.OMEGA], 2 * t_vals[-3:])
+
+
+def test_recorder_save_parquet(tmp_path: Path) -> None:
+    """Test the Parquet export."""
+    # Arrange
+    pq = pytest.importorskip("pyarrow.parquet")
+    recorder = AORecorder(capacity=3, ring=True, fields=FIELDS)
+    t_vals = np.arange(5.0)
+    recorder.extend(t=t_vals, omega=2 * t_vals)
+
+    # Act
+    filepath = recorder.save_parquet(tmp_path / "record.parquet")
+
+    # Assert
+    table = pq.read_table(filepath)
+    np.testing.assert_array_equal(table[RecorderFields.TIME].to_numpy(), t_vals[-3:])
+    np.testing.assert_array_equal(
+        table[RecorderFields.OMEGA].to_numpy(), 2 * t_vals[-3:]
+    )
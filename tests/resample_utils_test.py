@@ -0,0 +1,76 @@
+"""Tests for the resampling utilities."""
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.utils.resample_utils import (
+    ResampleTable,
+    align_time_bases,
+    uniform_grid,
+)
+
+
+def test_uniform_grid_overlap():
+    """Test that the grid covers the overlap of all logs."""
+    # Arrange
+    times = [np.linspace(0.0, 1.0, 11), np.linspace(0.25, 2.0, 8)]
+
+    # Act
+    grid = uniform_grid(times, rate_hz=100.0)
+
+    # Assert
+    assert grid[0] == 0.25
+    assert len(grid) == 76
+    np.testing.assert_allclose(np.diff(grid), 0.01)
+
+
+def test_uniform_grid_invalid():
+    """Test that disjoint logs and invalid rates are rejected."""
+    # Arrange
+    times = [np.array([0.0, 1.0]), np.array([2.0, 3.0])]
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="overlap"):
+        uniform_grid(times, rate_hz=10.0)
+    with pytest.raises(ValueError, match="positive"):
+        uniform_grid(times[:1], rate_hz=0.0)
+
+
+def test_interpolate_linear_signal():
+    """Test that a linear signal is resampled exactly and gaps are flagged."""
+    # Arrange
+    rng = np.random.default_rng(0)
+    time = np.cumsum(rng.uniform(0.009, 0.011, size=200))
+    time = np.concatenate([time[:100], time[103:]])
+    values = np.stack([2.0 * time + 1.0, -time], axis=1)
+
+    # Act
+    grid, (table,), dropped = align_time_bases([time], rate_hz=100.0)
+    resampled = table.interpolate(values)
+
+    # Assert
+    np.testing.assert_allclose(resampled[:, 0], 2.0 * grid + 1.0)
+    np.testing.assert_allclose(resampled[:, 1], -grid)
+    gap = (grid > time[99]) & (grid < time[100])
+    np.testing.assert_array_equal(dropped, gap)
+
+
+def test_interpolate_angles_and_quaternions():
+    """Test interpolation across the angle wrap and between quaternions."""
+    # Arrange
+    time = np.array([0.0, 1.0])
+    grid = np.array([0.0, 0.5, 1.0])
+    table = ResampleTable.build(time, grid)
+    angles = np.array([[170.0], [-170.0]])
+    half_turn = np.sqrt(0.5)
+    quats = np.array([[1.0, 0.0, 0.0, 0.0], [-half_turn, -half_turn, 0.0, 0.0]])
+
+    # Act
+    resampled_angles = table.interpolate_angles(angles)
+    resampled_quats = table.interpolate_quaternions(quats)
+
+    # Assert
+    np.testing.assert_allclose(resampled_angles[:, 0], [170.0, -180.0, -170.0])
+    np.testing.assert_allclose(np.linalg.norm(resampled_quats, axis=1), 1.0)
+    assert resampled_quats[1, 0] > 0.9
+    assert resampled_quats[1, 1] > 0.3
@@ -0,0 +1,100 @@
+"""Tests for the real-time scheduler."""
+
+import time
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.scheduler import DeadlineScheduler, OverrunPolicy
+
+DT = 0.005
+
+
+def run_frames(
+    scheduler: DeadlineScheduler, n_frames: int, work: float
+) -> tuple[float, list[bool]]:
+    """Pace frames DT apart that each take ``work`` seconds."""
+    released = []
+    start = time.perf_counter()
+    for ii in range(n_frames):
+        released.append(scheduler.wait(ii * DT))
+        time.sleep(work)
+    return time.perf_counter() - start, released
+
+
+@pytest.mark.parametrize("speed", [1.0, 2.0])
+def test_scheduler_keeps_rate(speed: float):
+    """Test that deadlines are absolute, so work between frames does not drift."""
+    # Arrange
+    scheduler = DeadlineScheduler(speed=speed)
+    n_frames = 60
+
+    # Act
+    elapsed, released = run_frames(scheduler, n_frames, work=0.5 * DT / speed)
+    stats = scheduler.stats()
+
+    # Assert
+    expected = (n_frames - 1) * DT / speed
+    # Sleeping a period after the work would take 1.5 times as long.
+    assert expected <= elapsed < 1.25 * expected
+    assert all(released)
+    assert stats.frames == n_frames
+    assert 0.0 <= stats.jitter_mean <= stats.jitter_max
+
+
+def test_scheduler_as_fast_as_possible():
+    """Test that an unpaced scheduler never waits and rejects bad speeds."""
+    # Arrange
+    scheduler = DeadlineScheduler(speed=None)
+
+    # Act
+    start = time.perf_counter()
+    released = [scheduler.wait(ii * 10.0) for ii in range(100)]
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    assert not scheduler.paced
+    assert all(released)
+    assert elapsed < 0.1
+    assert scheduler.stats().frames == 100
+    assert not DeadlineScheduler(speed=np.inf).paced
+    with pytest.raises(ValueError, match="Speed"):
+        DeadlineScheduler(speed=0.0)
+    with pytest.raises(ValueError, match="policy"):
+        DeadlineScheduler(policy="drop")
+
+
+@pytest.mark.parametrize(
+    ("policy", "shift"),
+    [
+        (OverrunPolicy.CATCH_UP, 0.0),
+        (OverrunPolicy.SKIP, 0.0),
+        (OverrunPolicy.REALIGN, 0.03 - DT),
+    ],
+)
+def test_scheduler_overrun_policies(policy: str, shift: float):
+    """Test that a stalled frame is caught up on, skipped or realigned to."""
+    # Arrange
+    scheduler = DeadlineScheduler(speed=1.0, policy=policy)
+    scheduler.wait(0.0)
+    origin_ns = scheduler.deadline_ns(0.0)
+
+    # Act
+    time.sleep(0.03)
+    released = [scheduler.wait(ii * DT) for ii in range(1, 30)]
+    stats = scheduler.stats()
+
+    # Assert
+    assert stats.overruns >= 1
+    assert stats.lateness_max > scheduler.tolerance_ns * 1e-9
+    moved = (scheduler.deadline_ns(0.0) - origin_ns) * 1e-9
+    if policy == OverrunPolicy.REALIGN:
+        assert moved >= shift
+    else:
+        assert moved == shift
+    if policy == OverrunPolicy.SKIP:
+        assert not released[0]
+        assert released.count(False) == stats.skipped == stats.overruns
+    else:
+        assert all(released)
+        assert stats.skipped == 0
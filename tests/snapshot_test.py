@@ -0,0 +1,111 @@
+"""Tests for the controller snapshots."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.controller import AOController
+from adaptive_oscillator.oscillator import AOParameters, sample_walking_data
+from adaptive_oscillator.recorder import RecorderFields
+from adaptive_oscillator.snapshot import (
+    SNAPSHOT_VERSION,
+    SnapshotFields,
+    SnapshotLayout,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+def run(controller: AOController, t: np.ndarray, th: np.ndarray, dth: np.ndarray):
+    """Step a controller through frames."""
+    for t_ii, th_ii, dth_ii in zip(t, th, dth, strict=True):
+        controller.step(t=t_ii, th=th_ii, dth=dth_ii)
+
+
+def test_snapshot_restore_continues_identically(tmp_path: Path):
+    """Test that a restored controller continues exactly like the original."""
+    # Arrange
+    t, th, dth = sample_walking_data(period=0.5, t_end=6.0)
+    original = AOController(show_plots=False)
+    run(original, t[:300], th[:300], dth[:300])
+    save_snapshot(tmp_path / "state.npy", original.snapshot())
+
+    # Act
+    restored = AOController(show_plots=False)
+    restored.restore(load_snapshot(tmp_path / "state.npy"))
+    run(original, t[300:], th[300:], dth[300:])
+    run(restored, t[300:], th[300:], dth[300:])
+
+    # Assert
+    np.testing.assert_array_equal(restored.motor_output, original.motor_output[300:])
+    np.testing.assert_array_equal(restored.snapshot(), original.snapshot())
+
+
+def test_snapshot_time_shift():
+    """Test restoring a snapshot onto a different time origin."""
+    # Arrange
+    t, th, dth = sample_walking_data(period=0.5, t_end=6.0)
+    original = AOController(show_plots=False)
+    run(original, t[:300], th[:300], dth[:300])
+    snapshot = original.snapshot()
+
+    # Act
+    shifted = AOController(show_plots=False)
+    shifted.restore(snapshot, time=-0.01)
+    run(shifted, t[300:] - t[300], th[300:], dth[300:])
+    run(original, t[300:], th[300:], dth[300:])
+
+    # Assert
+    np.testing.assert_allclose(
+        shifted.recorder.column(RecorderFields.OMEGA),
+        original.recorder.column(RecorderFields.OMEGA)[300:],
+        atol=1e-9,
+    )
+
+
+def test_snapshot_layout_checks():
+    """Test that foreign, outdated and mismatching buffers are rejected."""
+    # Arrange
+    controller = AOController(show_plots=False)
+    snapshot = controller.snapshot()
+    layout = SnapshotLayout(controller.params.n_harmonics)
+    outdated = snapshot.copy()
+    outdated[layout.index(SnapshotFields.VERSION)] = SNAPSHOT_VERSION + 1
+    other = AOController(show_plots=False, params=AOParameters(n_harmonics=5))
+
+    # Act / Assert
+    assert len(snapshot) == layout.size
+    with pytest.raises(ValueError, match="not a controller snapshot"):
+        controller.restore(np.zeros_like(snapshot))
+    with pytest.raises(ValueError, match="version"):
+        controller.restore(outdated)
+    with pytest.raises(ValueError, match="harmonics"):
+        other.restore(snapshot)
+
+
+def test_replay_warm_start(tmp_path: Path):
+    """Test that a warm-started replay skips the convergence transient."""
+    # Arrange
+    log_dir = "data/walk_5"
+    converged = AOController(show_plots=False)
+    converged.replay(log_dir=log_dir, end=30.0, index_dir=tmp_path)
+
+    # Act
+    cold = AOController(show_plots=False)
+    cold.replay(log_dir=log_dir, start=30.0, end=35.0, index_dir=tmp_path)
+    warm = AOController(show_plots=False)
+    warm.replay(
+        log_dir=log_dir,
+        start=30.0,
+        end=35.0,
+        initial_state=converged.snapshot(),
+        index_dir=tmp_path,
+    )
+
+    # Assert
+    omega_end = converged.recorder.column(RecorderFields.OMEGA)[-1]
+    warm_omega = warm.recorder.column(RecorderFields.OMEGA)
+    cold_omega = cold.recorder.column(RecorderFields.OMEGA)
+    assert abs(warm_omega[0] - omega_end) < 0.1
+    assert abs(cold_omega[0] - omega_end) > abs(warm_omega[0] - omega_end)
@@ -0,0 +1,73 @@
+"""Tests for the spectral estimates."""
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.utils.spectral_utils import (
+    dominant_frequency,
+    fit_harmonics,
+    local_fundamental,
+)
+
+
+def test_fit_harmonics_recovers_series():
+    """Test that a Fourier series on irregular sample times is recovered."""
+    # Arrange
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.008, 0.012, size=600))
+    omega = 2 * np.pi * 0.9
+    alpha = np.array([0.3, 0.1, 0.05])
+    offset = np.array([0.4, -1.2, 2.0])
+    phases = np.multiply.outer(t, omega * np.arange(1, 4)) + offset
+    signal = 0.2 + np.sin(phases) @ alpha
+
+    # Act
+    fit = fit_harmonics(t, signal, n_harmonics=3)
+
+    # Assert
+    np.testing.assert_allclose(fit.omega, omega, rtol=2e-3)
+    np.testing.assert_allclose(fit.alpha_0, 0.2, atol=1e-2)
+    np.testing.assert_allclose(fit.alpha, alpha, atol=1e-2)
+    np.testing.assert_allclose(fit.evaluate(t), signal, atol=2e-2)
+
+
+def test_dominant_frequency_prefers_fundamental():
+    """Test that a signal with a stronger second harmonic gives its fundamental."""
+    # Arrange
+    t = np.arange(0.0, 6.0, 0.01)
+    signal = 0.5 * np.sin(2 * np.pi * 0.8 * t) + np.sin(2 * np.pi * 1.6 * t)
+
+    # Act
+    frequency = dominant_frequency(t, signal)
+
+    # Assert
+    assert frequency == pytest.approx(0.8, rel=1e-2)
+
+
+def test_dominant_frequency_short_window():
+    """Test that a window shorter than the slowest period is rejected."""
+    # Arrange
+    t = np.arange(0.0, 2.0, 0.01)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="cannot resolve"):
+        dominant_frequency(t, np.sin(2 * np.pi * t))
+
+
+def test_local_fundamental_follows_speed_change():
+    """Test that the local estimate follows a change of frequency."""
+    # Arrange
+    t = np.arange(0.0, 60.0, 0.01)
+    omega = np.where(t < 30.0, 2 * np.pi * 0.8, 2 * np.pi * 1.0)
+    phase = np.cumsum(omega) * 0.01
+    signal = np.sin(phase)
+
+    # Act
+    omega_ref, phase_ref = local_fundamental(t, signal)
+
+    # Assert
+    early, late = t < 20.0, t > 40.0
+    np.testing.assert_allclose(omega_ref[early], omega[early], rtol=1e-2)
+    np.testing.assert_allclose(omega_ref[late], omega[late], rtol=1e-2)
+    error = np.angle(np.exp(1j * (phase_ref - phase)))
+    assert np.abs(error[early | late]).max() < 0.1
@@ -0,0 +1,99 @@
+"""Tests for the streaming log reader."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.controller import AOController
+from adaptive_oscillator.definitions import ANGLES_SEGMENT_FIELDS, AnglesHeader
+from adaptive_oscillator.recorder import RecorderFields
+from adaptive_oscillator.utils.derivative_utils import backward_difference
+from adaptive_oscillator.utils.reader_utils import read_log_file
+from adaptive_oscillator.utils.stream_utils import follow_log_file
+
+LOG_FILE = Path(__file__).parent.parent / "data" / "walk_5" / "Angles_left.txt"
+N_LINES = 400
+
+# Appends the source lines in pieces that split lines, like a logger flushing
+# its buffer at arbitrary points.
+WRITER = """
+import sys, time
+source, target, n_lines = sys.argv[1], sys.argv[2], int(sys.argv[3])
+with open(source, "rb") as file:
+    data = b"".join(file.readlines()[: n_lines + 1])
+time.sleep(0.05)
+with open(target, "ab") as file:
+    for start in range(0, len(data), 997):
+        file.write(data[start : start + 997])
+        file.flush()
+        time.sleep(0.002)
+"""
+
+
+def start_writer(target: Path) -> subprocess.Popen:
+    """Start a process that writes the first log lines into a new file."""
+    return subprocess.Popen(
+        [sys.executable, "-c", WRITER, str(LOG_FILE), str(target), str(N_LINES)]
+    )
+
+
+def test_follow_log_file(tmp_path: Path):
+    """Test that following a file being written gives the whole file in chunks."""
+    # Arrange
+    target = tmp_path / LOG_FILE.name
+    columns = [AnglesHeader.HIP_X, AnglesHeader.KNEE_Y]
+    expected = read_log_file(LOG_FILE)
+    writer = start_writer(target)
+
+    # Act
+    chunks = list(follow_log_file(target, columns, chunk_size=16, idle_timeout=0.5))
+    writer.wait()
+
+    # Assert
+    assert all(0 < len(chunk) <= 16 for chunk in chunks)
+    time = np.concatenate([chunk.time for chunk in chunks])
+    values = np.concatenate([chunk.values for chunk in chunks])
+    np.testing.assert_array_equal(time, expected.time[:N_LINES])
+    np.testing.assert_array_equal(values[:, 0], expected[AnglesHeader.HIP_X][:N_LINES])
+    np.testing.assert_array_equal(values[:, 1], expected[AnglesHeader.KNEE_Y][:N_LINES])
+
+
+def test_follow_log_file_errors(tmp_path: Path):
+    """Test unknown columns and files that are never created."""
+    # Arrange
+    target = tmp_path / LOG_FILE.name
+    target.write_bytes(LOG_FILE.read_bytes()[:2000])
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="not in the log header"):
+        list(follow_log_file(target, ["Elbow_x"], idle_timeout=0.1))
+    assert list(follow_log_file(tmp_path / "missing.txt", idle_timeout=0.05)) == []
+
+
+def test_controller_follow(tmp_path: Path):
+    """Test that following a log gives the same estimates as replaying it."""
+    # Arrange
+    target = tmp_path / LOG_FILE.name
+    expected = AOController(show_plots=False)
+    column = ANGLES_SEGMENT_FIELDS["hip"][expected.ang_idx]
+    table = read_log_file(LOG_FILE)
+    t_vals = table.time[:N_LINES] - table.time[0]
+    theta = np.deg2rad(table[column][:N_LINES])
+    theta_dot = backward_difference(t_vals, theta)
+    for t, th, dth in zip(t_vals, theta, theta_dot, strict=True):
+        expected.step(t=t, th=th, dth=dth)
+    writer = start_writer(target)
+
+    # Act
+    controller = AOController(show_plots=False)
+    controller.follow(target, chunk_size=8, idle_timeout=0.5)
+    writer.wait()
+
+    # Assert
+    np.testing.assert_array_equal(
+        controller.recorder.column(RecorderFields.THETA_M),
+        expected.recorder.column(RecorderFields.THETA_M),
+    )
@@ -0,0 +1,106 @@
+"""Tests for the parameter sweeps."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator.oscillator import AOParameters, sample_walking_data
+from adaptive_oscillator.sweep import (
+    METRIC_COLUMNS,
+    convergence_time,
+    evaluate,
+    load_results,
+    parameter_grid,
+    random_design,
+    run_sweep,
+)
+from adaptive_oscillator.utils.cache_utils import LogCache
+
+
+def test_parameter_grid():
+    """Test that the grid holds every combination and keeps other defaults."""
+    # Act
+    designs = parameter_grid(eta=[0.02, 0.05], n_harmonics=[1, 2, 3])
+
+    # Assert
+    assert len(designs) == 6
+    assert {(p.eta, p.n_harmonics) for p in designs} == {
+        (eta, n) for eta in (0.02, 0.05) for n in (1, 2, 3)
+    }
+    assert all(p.nu_phi == AOParameters().nu_phi for p in designs)
+    with pytest.raises(ValueError, match="Unknown parameters"):
+        parameter_grid(gain=[1.0])
+
+
+def test_random_design():
+    """Test that random designs stay in their ranges and are reproducible."""
+    # Act
+    designs = random_design(20, seed=1, eta=(0.01, 0.1), n_harmonics=(1, 4))
+
+    # Assert
+    assert len(designs) == 20
+    assert all(0.01 <= p.eta <= 0.1 for p in designs)
+    assert {p.n_harmonics for p in designs} <= {1, 2, 3, 4}
+    assert all(isinstance(p.n_harmonics, int) for p in designs)
+    assert designs == random_design(20, seed=1, eta=(0.01, 0.1), n_harmonics=(1, 4))
+
+
+def test_convergence_time():
+    """Test the start of the final converged stretch."""
+    # Arrange
+    t = np.arange(6.0)
+    omega_ref = np.full(6, 2.0)
+
+    # Act / Assert
+    assert convergence_time(t, np.array([1, 2, 1, 2, 2, 2.0]), omega_ref) == 3.0
+    assert convergence_time(t, np.full(6, 2.0), omega_ref) == 0.0
+    assert convergence_time(t, np.array([2, 2, 2, 2, 2, 1.0]), omega_ref) == np.inf
+
+
+def test_evaluate_uses_solver():
+    """Test that every solver of a sweep is scored with its own results."""
+    # Arrange
+    t, theta_il, _ = sample_walking_data(period=0.5, t_end=10.0)
+
+    # Act
+    rk45 = evaluate(t, theta_il, AOParameters(solver="RK45"))
+    rk4 = evaluate(t, theta_il, AOParameters(solver="rk4"))
+
+    # Assert
+    assert rk45["omega_error"] != rk4["omega_error"]
+    assert rk45["phase_error"] != rk4["phase_error"]
+
+
+def test_run_sweep_resumes(tmp_path: Path):
+    """Test that a sweep writes its table and only runs new cells on resume."""
+    # Arrange
+    cache = LogCache(tmp_path / "cache")
+    results_path = tmp_path / "results.npz"
+    designs = parameter_grid(eta=[0.02, 0.05], solver=["euler"])
+    log_dirs = ["data/walk_5"]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = run_sweep(
+            designs, log_dirs, results_path, cache=cache, executor=executor
+        )
+    resumed = run_sweep(
+        [*designs, *parameter_grid(eta=[0.1], solver=["euler"])],
+        log_dirs,
+        results_path,
+        cache=cache,
+        executor="serial",
+    )
+
+    # Assert
+    assert len(first) == 2
+    assert len(resumed) == 3
+    assert sorted(resumed["eta"]) == [0.02, 0.05, 0.1]
+    assert list(resumed.columns[-len(METRIC_COLUMNS) :]) == list(METRIC_COLUMNS)
+    np.testing.assert_array_equal(
+        resumed.sort_values("eta")["runtime"][:2], first.sort_values("eta")["runtime"]
+    )
+    assert load_results(results_path).equals(resumed)
+    assert (resumed["omega_error"] < 1.0).all()
@@ -0,0 +1,63 @@
+"""Test the telemetry module."""
+
+import pytest
+
+from adaptive_oscillator.telemetry import Telemetry, TelemetryRecord
+
+FIELDS = ("t", "omega")
+
+
+@pytest.mark.parametrize(
+    "decimation, max_rate_hz, expected_times",
+    [
+        (1, None, [0.0, 0.01, 0.02, 0.03, 0.04, 0.05]),
+        (2, None, [0.0, 0.02, 0.04]),
+        (1, 40.0, [0.0, 0.03]),
+    ],
+)
+def test_telemetry_rate_limits(
+    decimation: int, max_rate_hz: float | None, expected_times: list[float]
+) -> None:
+    """Test decimation and rate limiting."""
+    # Arrange
+    records: list[TelemetryRecord] = []
+    telemetry = Telemetry(
+        FIELDS, sinks=[records.append], decimation=decimation, max_rate_hz=max_rate_hz
+    )
+
+    # Act
+    for ii in range(6):
+        telemetry.record(ii * 0.01, 2.0 * ii)
+
+    # Assert
+    assert [record.values[0] for record in records] == expected_times
+    assert telemetry.n_received == 6
+    assert telemetry.n_emitted == len(expected_times)
+
+
+def test_telemetry_time_going_back() -> None:
+    """Test that the rate limit restarts when time goes back."""
+    # Arrange
+    records: list[TelemetryRecord] = []
+    telemetry = Telemetry(FIELDS, sinks=[records.append], max_rate_hz=10.0)
+
+    # Act
+    for t in (0.0, 0.05, 5.0, 0.0, 0.05, 0.1):
+        telemetry.record(t, 1.0)
+    n_emitted = telemetry.n_emitted
+    telemetry.reset()
+
+    # Assert
+    assert [record.values[0] for record in records] == [0.0, 5.0, 0.0, 0.1]
+    assert n_emitted == 4
+    assert telemetry.n_received == telemetry.n_emitted == 0
+
+
+def test_telemetry_record_formatting() -> None:
+    """Test that records format to text only on demand."""
+    # Act
+    record = TelemetryRecord(FIELDS, (1.234, 5.678))
+
+    # Assert
+    assert record.as_dict() == {"t": 1.234, "omega": 5.678}
+    assert str(record) == "t: 1.23, omega: 5.68"
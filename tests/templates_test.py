@@ -0,0 +1,129 @@
+"""Tests for gait shape templates."""
+
+import gzip
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from adaptive_oscillator import templates
+from adaptive_oscillator.definitions import AnglesHeader
+from adaptive_oscillator.oscillator import (
+    AOParameters,
+    GaitPhaseEstimator,
+    LowLevelController,
+)
+from adaptive_oscillator.templates import (
+    TemplateAccumulator,
+    TemplateCache,
+    learn_template,
+    phase_template,
+)
+from adaptive_oscillator.utils.derivative_utils import backward_difference
+from adaptive_oscillator.utils.reader_utils import read_log_file
+
+LOG_FILE = Path(__file__).parent.parent / "data" / "walk_5" / "Angles_left.txt"
+
+
+def test_phase_template_recovers_shape():
+    """Test that binning noisy cycles on the phase recovers their mean shape."""
+    # Arrange
+    rng = np.random.default_rng(0)
+    phase = rng.uniform(0.0, 40 * np.pi, 50_000)
+    values = np.sin(phase) + 0.5 * np.cos(2 * phase) + rng.normal(0, 0.1, len(phase))
+    x = np.linspace(0, 2 * np.pi, 100)
+
+    # Act
+    template = phase_template(phase, values, n_bins=64)
+
+    # Assert
+    assert template.count.sum() == len(phase)
+    np.testing.assert_allclose(
+        template.gait_shape(), -np.sin(x) + 0.5 * np.cos(2 * x), atol=0.02
+    )
+    np.testing.assert_allclose(template.std, 0.1, atol=0.03)
+    controller = LowLevelController(gait_shape=template.gait_shape())
+    cycle = np.linspace(0, 2 * np.pi, 200, endpoint=False)
+    np.testing.assert_allclose(
+        controller.reference(cycle), template.evaluate(cycle), atol=0.01
+    )
+
+
+def test_accumulator_chunks_match_one_pass():
+    """Test that accumulating chunks of several channels equals one pass."""
+    # Arrange
+    rng = np.random.default_rng(1)
+    phase = rng.uniform(-np.pi, 6 * np.pi, 1000)
+    values = rng.normal(size=(1000, 3))
+    accumulator = TemplateAccumulator(n_bins=20, n_channels=3)
+
+    # Act
+    for start in range(0, len(phase), 128):
+        accumulator.update(phase[start : start + 128], values[start : start + 128])
+    chunked = accumulator.template()
+    whole = phase_template(phase, values, n_bins=20)
+
+    # Assert
+    assert chunked.mean.shape == (20, 3)
+    np.testing.assert_array_equal(chunked.count, whole.count)
+    np.testing.assert_allclose(chunked.mean, whole.mean)
+    np.testing.assert_allclose(chunked.std, whole.std, atol=1e-12)
+    bins = (np.mod(phase, 2 * np.pi) / (2 * np.pi) * 20).astype(int)
+    np.testing.assert_allclose(whole.mean[7], values[bins == 7].mean(axis=0))
+
+
+def test_learn_template_streams_log(tmp_path: Path):
+    """Test that the streamed template equals estimating the whole log at once."""
+    # Arrange
+    log = read_log_file(LOG_FILE)
+    t = log.time - log.time[0]
+    theta = np.deg2rad(log[AnglesHeader.HIP_X])
+    estimator = GaitPhaseEstimator(AOParameters())
+    window = t <= 4.0
+    estimator.ao.warm_start(t[window], theta[window])
+    trajectory = estimator.run(t, theta, backward_difference(t, theta))
+    expected = phase_template(
+        trajectory.phi, np.deg2rad(log[AnglesHeader.KNEE_Y]), n_bins=50
+    )
+    compressed = tmp_path / f"{LOG_FILE.name}.gz"
+    with open(LOG_FILE, "rb") as source, gzip.open(compressed, "wb") as target:
+        shutil.copyfileobj(source, target)
+
+    # Act
+    streamed = learn_template(
+        compressed, AnglesHeader.KNEE_Y, n_bins=50, chunk_size=512, warm_start=4.0
+    )
+
+    # Assert
+    np.testing.assert_array_equal(streamed.count, expected.count)
+    np.testing.assert_allclose(streamed.mean, expected.mean)
+
+
+def test_template_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that templates are learned once per subject and joint until stale."""
+    # Arrange
+    log_file = tmp_path / "subject_a" / LOG_FILE.name
+    log_file.parent.mkdir()
+    shutil.copy(LOG_FILE, log_file)
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return learn_template(*args, **kwargs)
+
+    monkeypatch.setattr(templates, "learn_template", counting)
+    cache = TemplateCache(tmp_path / "cache")
+
+    # Act
+    first = cache.load(log_file, AnglesHeader.KNEE_Y, joint="knee", n_bins=40)
+    second = cache.load(log_file, AnglesHeader.KNEE_Y, joint="knee", n_bins=40)
+    cache.load(log_file, AnglesHeader.KNEE_Y, joint="knee", n_bins=30)
+    os.utime(log_file, ns=(0, 0))
+    cache.load(log_file, AnglesHeader.KNEE_Y, joint="knee", n_bins=30)
+
+    # Assert
+    assert (tmp_path / "cache" / "templates" / "subject_a" / "knee.npz").is_file()
+    np.testing.assert_array_equal(first.mean, second.mean)
+    assert len(calls) == 3
@@ -1,8 +1,13 @@
 """Test the time utils."""
 
+import numpy as np
 import pytest
 
-from adaptive_oscillator.utils.time_utils import time_str_to_seconds
+from adaptive_oscillator.utils.time_utils import (
+    SECONDS_PER_DAY,
+    time_str_to_seconds,
+    time_strs_to_seconds,
+)
 
 
 @pytest.mark.parametrize(
@@ -20,3 +25,42 @@ def test_time_str_to_seconds(time_str: str, expected_seconds: float):
 
     # Assert
     assert time_float == expected_seconds
+
+
+def test_time_strs_to_seconds():
+    """Test that the vectorized conversion matches the scalar one."""
+    # Arrange
+    time_strs = ["12:34:56.789", "12:34:56.0", "12:34:57.154283", "23:59:59.999999"]
+
+    # Act
+    time_floats = time_strs_to_seconds(time_strs)
+
+    # Assert
+    np.testing.assert_array_equal(
+        time_floats, [time_str_to_seconds(t) for t in time_strs]
+    )
+
+
+def test_time_strs_to_seconds_midnight_rollover():
+    """Test that a recording over midnight stays monotonic."""
+    # Arrange
+    time_strs = ["23:59:59.98", "23:59:59.99", "00:00:00.00", "00:00:00.01"]
+
+    # Act
+    time_floats = time_strs_to_seconds(time_strs)
+    time_floats_raw = time_strs_to_seconds(time_strs, rollover=False)
+
+    # Assert
+    assert np.all(np.diff(time_floats) > 0)
+    np.testing.assert_almost_equal(time_floats[2], SECONDS_PER_DAY)
+    assert time_floats_raw[2] == 0.0
+
+
+@pytest.mark.parametrize(
+    "time_str", ["12:34", "12-34-56.0", "25:00:00.0", "1a:00:00.0"]
+)
+def test_time_strs_to_seconds_invalid(time_str: str):
+    """Test that malformed time strings are rejected."""
+    # Act / Assert
+    with pytest.raises(ValueError, match=time_str):
+        time_strs_to_seconds(["12:00:00.0", time_str])